@@ -0,0 +1,111 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import itertools
+import random
+from datetime import datetime, timedelta
+from functools import cache
+from typing import Any, Callable, NamedTuple
+
+import pytest
+
+from tabledata import TableData
+
+
+SEED = 0
+NUM_ROWS_LIST = [100, 1000]
+NUM_COLUMNS_LIST = [4, 16]
+CELL_TYPES = ["int", "float", "str", "mixed"]
+
+
+class TableShape(NamedTuple):
+    num_rows: int
+    num_columns: int
+    cell_type: str
+
+    def __str__(self) -> str:
+        return f"rows={self.num_rows}-cols={self.num_columns}-{self.cell_type}"
+
+
+def _make_int(rand: random.Random) -> Any:
+    return rand.randint(-(10**6), 10**6)
+
+
+def _make_float(rand: random.Random) -> Any:
+    return rand.uniform(-(10**6), 10**6)
+
+
+def _make_str(rand: random.Random) -> Any:
+    return "".join(rand.choices("abcdefghijklmnopqrstuvwxyz", k=rand.randint(1, 16)))
+
+
+def _make_datetime(rand: random.Random) -> Any:
+    return datetime(2017, 1, 1) + timedelta(seconds=rand.randint(0, 10**8))
+
+
+def _make_mixed(rand: random.Random) -> Any:
+    return rand.choice(
+        [
+            _make_int,
+            _make_float,
+            _make_str,
+            _make_datetime,
+            lambda rand: None,
+            lambda rand: str(_make_int(rand)),
+            lambda rand: rand.choice([True, False]),
+        ]
+    )(rand)
+
+
+_VALUE_MAKER_MAP: dict[str, Callable[[random.Random], Any]] = {
+    "int": _make_int,
+    "float": _make_float,
+    "str": _make_str,
+    "mixed": _make_mixed,
+}
+
+
+def make_headers(num_columns: int) -> list[str]:
+    return [f"column_{col_idx}" for col_idx in range(num_columns)]
+
+
+def make_rows(shape: TableShape) -> list[list[Any]]:
+    """
+    Create deterministic rows so that results are comparable across runs.
+    """
+
+    rand = random.Random(SEED)
+    make_value = _VALUE_MAKER_MAP[shape.cell_type]
+
+    return [[make_value(rand) for _ in range(shape.num_columns)] for _ in range(shape.num_rows)]
+
+
+def make_tabledata(shape: TableShape) -> TableData:
+    return TableData("benchmark", make_headers(shape.num_columns), make_rows(shape))
+
+
+@cache
+def make_converted_tabledata(shape: TableShape, instance_id: int = 0) -> TableData:
+    """
+    Create a table with converted caches. Instances are reused between benchmarks
+    that do not modify the table to reduce setup time.
+    """
+
+    tabledata = make_tabledata(shape)
+    tabledata.value_dp_matrix
+
+    return tabledata
+
+
+@pytest.fixture(
+    params=[
+        TableShape(num_rows, num_columns, cell_type)
+        for num_rows, num_columns, cell_type in itertools.product(
+            NUM_ROWS_LIST, NUM_COLUMNS_LIST, CELL_TYPES
+        )
+    ],
+    ids=str,
+)
+def shape(request: pytest.FixtureRequest) -> TableShape:
+    return request.param
@@ -0,0 +1,37 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import subprocess
+import sys
+
+
+IMPORT_SCRIPT = """
+import time
+
+start = time.perf_counter()
+
+from tabledata import TableData
+
+TableData("sample", ["a", "b"], [[1, 2], [3, 4]])
+
+print(time.perf_counter() - start)
+"""
+
+
+class Test_import_tabledata:
+    def test_benchmark(self, benchmark):
+        durations = []
+
+        def run() -> None:
+            # a fresh interpreter for each round: modules are cached after the first import
+            output = subprocess.run(
+                [sys.executable, "-c", IMPORT_SCRIPT], capture_output=True, check=True, text=True
+            ).stdout
+            durations.append(float(output))
+
+        benchmark.pedantic(run, rounds=10, iterations=1)
+
+        # interpreter startup excluded
+        benchmark.extra_info["import_seconds_min"] = min(durations)
+        benchmark.extra_info["import_seconds_mean"] = sum(durations) / len(durations)
@@ -0,0 +1,101 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+
+Peak allocations of the conversion paths measured with tracemalloc.
+Peaks are recorded in ``extra_info`` of the benchmark results
+to compare them across commits.
+"""
+
+import itertools
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+from conftest import TableShape, make_headers, make_rows, make_tabledata
+
+from tabledata import TableData
+from tabledata.normalizer import TableDataNormalizer
+
+
+MEMORY_SHAPES = [
+    TableShape(num_rows, num_columns, cell_type)
+    for num_rows, num_columns, cell_type in itertools.product([100, 1000], [4, 16], ["int", "str"])
+]
+
+
+def _run_traced(benchmark, setup: Callable[[], Any], func: Callable[[Any], Any]) -> None:
+    def traced(target: Any) -> None:
+        tracemalloc.start()
+        try:
+            func(target)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        benchmark.extra_info["peak_bytes"] = peak
+
+    # exclude one-time allocations such as imports and module-level caches
+    func(setup())
+
+    benchmark.pedantic(traced, setup=lambda: ((setup(),), {}), rounds=1, iterations=1)
+
+
+@pytest.fixture(params=MEMORY_SHAPES, ids=str)
+def memory_shape(request: pytest.FixtureRequest) -> TableShape:
+    return request.param
+
+
+class Test_memory_constructor:
+    def test_benchmark(self, benchmark, memory_shape):
+        headers = make_headers(memory_shape.num_columns)
+
+        _run_traced(
+            benchmark,
+            lambda: make_rows(memory_shape),
+            lambda rows: TableData("benchmark", headers, rows),
+        )
+
+
+class Test_memory_value_dp_matrix:
+    def test_benchmark(self, benchmark, memory_shape):
+        _run_traced(
+            benchmark,
+            lambda: make_tabledata(memory_shape),
+            lambda tabledata: tabledata.value_dp_matrix,
+        )
+
+
+class Test_memory_value_matrix:
+    def test_benchmark(self, benchmark, memory_shape):
+        _run_traced(
+            benchmark,
+            lambda: make_tabledata(memory_shape),
+            lambda tabledata: tabledata.value_matrix,
+        )
+
+
+class Test_memory_as_dict:
+    def test_benchmark(self, benchmark, memory_shape):
+        _run_traced(
+            benchmark, lambda: make_tabledata(memory_shape), lambda tabledata: tabledata.as_dict()
+        )
+
+
+class Test_memory_as_dataframe:
+    def test_benchmark(self, benchmark, memory_shape):
+        pytest.importorskip("pandas")
+
+        _run_traced(
+            benchmark,
+            lambda: make_tabledata(memory_shape),
+            lambda tabledata: tabledata.as_dataframe(),
+        )
+
+
+class Test_memory_normalize:
+    def test_benchmark(self, benchmark, memory_shape):
+        _run_traced(
+            benchmark,
+            lambda: make_tabledata(memory_shape),
+            lambda tabledata: TableDataNormalizer(tabledata).normalize().value_dp_matrix,
+        )
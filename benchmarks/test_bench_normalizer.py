@@ -0,0 +1,19 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from conftest import make_converted_tabledata, make_tabledata
+
+from tabledata.normalizer import TableDataNormalizer
+
+
+class Test_TableDataNormalizer_normalize:
+    def test_benchmark(self, benchmark, shape):
+        tabledata = make_tabledata(shape)
+
+        benchmark(lambda: TableDataNormalizer(tabledata).normalize())
+
+    def test_benchmark_converted(self, benchmark, shape):
+        tabledata = make_converted_tabledata(shape)
+
+        benchmark(lambda: TableDataNormalizer(tabledata).normalize().value_dp_matrix)
@@ -0,0 +1,220 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+
+import pytest
+from conftest import (
+    TableShape,
+    make_converted_tabledata,
+    make_headers,
+    make_rows,
+    make_tabledata,
+)
+
+from typepy import Integer
+
+from tabledata import ConversionMode, FloatType, Schema, TableData
+from tabledata._parallel import is_gil_enabled
+
+
+ROUNDS = 5
+
+
+class Test_TableData_constructor:
+    def test_benchmark(self, benchmark, shape):
+        headers = make_headers(shape.num_columns)
+        rows = make_rows(shape)
+
+        benchmark(TableData, "benchmark", headers, rows)
+
+
+class Test_TableData_value_dp_matrix:
+    def test_benchmark(self, benchmark, shape):
+        # value_dp_matrix is cached: convert a fresh instance for each round
+        benchmark.pedantic(
+            lambda tabledata: tabledata.value_dp_matrix,
+            setup=lambda: ((make_tabledata(shape),), {}),
+            rounds=ROUNDS,
+        )
+
+
+class Test_TableData_column_dp_list:
+    def test_benchmark(self, benchmark, shape):
+        tabledata = make_converted_tabledata(shape)
+
+        benchmark(lambda: tabledata.column_dp_list)
+
+
+class Test_TableData_as_dict:
+    def test_benchmark(self, benchmark, shape):
+        tabledata = make_converted_tabledata(shape)
+
+        benchmark(tabledata.as_dict)
+
+
+class Test_TableData_as_tuple:
+    def test_benchmark(self, benchmark, shape):
+        tabledata = make_converted_tabledata(shape)
+
+        benchmark(lambda: list(tabledata.as_tuple()))
+
+
+class Test_TableData_as_dataframe:
+    def test_benchmark(self, benchmark, shape):
+        pytest.importorskip("pandas")
+
+        tabledata = make_converted_tabledata(shape)
+
+        benchmark(tabledata.as_dataframe)
+
+
+class Test_TableData_from_dataframe:
+    def test_benchmark(self, benchmark, shape):
+        pytest.importorskip("pandas")
+
+        dataframe = make_converted_tabledata(shape).as_dataframe()
+
+        benchmark(TableData.from_dataframe, dataframe, table_name="benchmark")
+
+
+class Test_TableData_transpose:
+    def test_benchmark(self, benchmark, shape):
+        tabledata = make_tabledata(shape)
+
+        benchmark(tabledata.transpose)
+
+
+class Test_TableData_filter_column:
+    def test_benchmark(self, benchmark, shape):
+        tabledata = make_tabledata(shape)
+        patterns = tabledata.headers[::2]
+
+        benchmark(tabledata.filter_column, patterns=patterns)
+
+
+class Test_TableData_equals:
+    @pytest.mark.parametrize(["cmp_by_dp"], [[True], [False]])
+    def test_benchmark(self, benchmark, shape, cmp_by_dp):
+        lhs = make_converted_tabledata(shape)
+        rhs = make_converted_tabledata(shape, instance_id=1)
+
+        assert benchmark(lhs.equals, rhs, cmp_by_dp=cmp_by_dp)
+
+
+class Test_TableData_validate_rows:
+    def test_benchmark(self, benchmark, shape):
+        tabledata = make_tabledata(shape)
+
+        benchmark(tabledata.validate_rows)
+
+
+class Test_TableData_get_column:
+    def test_benchmark(self, benchmark, shape):
+        tabledata = make_converted_tabledata(shape)
+        name = tabledata.headers[-1]
+
+        benchmark(tabledata.get_column, name)
+
+
+class Test_RowIndex_lookup:
+    def test_benchmark(self, benchmark, shape):
+        tabledata = make_converted_tabledata(shape)
+        index = tabledata.create_index(tabledata.headers[0])
+        keys = tabledata.get_column(tabledata.headers[0])
+
+        def lookup_all_keys() -> None:
+            for key in keys:
+                index.lookup(key)
+
+        benchmark(lookup_all_keys)
+
+
+class Test_TableData_page:
+    def test_benchmark(self, benchmark, shape):
+        def first_page_dp_matrix() -> None:
+            make_tabledata(shape).page(0, 50).value_dp_matrix
+
+        benchmark(first_page_dp_matrix)
+
+
+class Test_TableData_float_type:
+    @pytest.mark.parametrize(["float_type"], [[FloatType.DECIMAL], [FloatType.FLOAT]])
+    def test_benchmark(self, benchmark, float_type):
+        shape = TableShape(1000, 16, "float")
+        headers = make_headers(shape.num_columns)
+        rows = make_rows(shape)
+
+        benchmark.pedantic(
+            lambda tabledata: tabledata.as_dict(),
+            setup=lambda: ((TableData("benchmark", headers, rows, float_type=float_type),), {}),
+            rounds=ROUNDS,
+        )
+
+
+class Test_TableData_schema_column_dp_list:
+    """
+    Column properties of typed rows with a trusted schema and with the same type hints.
+    """
+
+    @pytest.mark.parametrize(["is_trusted"], [[True], [False]], ids=["schema", "type_hints"])
+    def test_benchmark(self, benchmark, is_trusted):
+        shape = TableShape(1000, 16, "int")
+        headers = make_headers(shape.num_columns)
+        rows = make_rows(shape)
+        type_hints = [Integer] * shape.num_columns
+
+        def make_tabledata() -> TableData:
+            if is_trusted:
+                return TableData("benchmark", headers, rows, schema=Schema(headers, type_hints))
+
+            return TableData("benchmark", headers, rows, type_hints=type_hints)
+
+        benchmark.pedantic(
+            lambda tabledata: tabledata.column_dp_list,
+            setup=lambda: ((make_tabledata(),), {}),
+            rounds=ROUNDS,
+        )
+
+
+class Test_TableData_conversion_mode:
+    """
+    Scaling of the threaded conversion by the number of workers.
+    The conversion scales with cores only on free-threaded Python (``gil_enabled`` is
+    ``False`` in the extra info): threads are serialized by the GIL otherwise.
+    """
+
+    @pytest.mark.parametrize(
+        ["conversion_mode", "max_workers"],
+        [
+            [ConversionMode.SERIAL, 1],
+            [ConversionMode.THREAD, 2],
+            [ConversionMode.THREAD, 4],
+            [ConversionMode.THREAD, 8],
+        ],
+        ids=lambda value: value.value if isinstance(value, ConversionMode) else f"workers={value}",
+    )
+    def test_benchmark(self, benchmark, conversion_mode, max_workers):
+        shape = TableShape(1000, 16, "mixed")
+        headers = make_headers(shape.num_columns)
+        rows = make_rows(shape)
+
+        benchmark.extra_info["gil_enabled"] = is_gil_enabled()
+        benchmark.extra_info["cpu_count"] = os.cpu_count()
+        benchmark.pedantic(
+            lambda tabledata: tabledata.value_dp_matrix,
+            setup=lambda: (
+                (
+                    TableData(
+                        "benchmark",
+                        headers,
+                        rows,
+                        max_workers=max_workers,
+                        conversion_mode=conversion_mode,
+                    ),
+                ),
+                {},
+            ),
+            rounds=ROUNDS,
+        )
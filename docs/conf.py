@@ -190,6 +190,16 @@ rp_builtin = """
 rp_class = """
 .. |TableData| replace::
     :py:class:`~tabledata.TableData`
+.. |ExtractorConfig| replace::
+    :py:class:`~tabledata.ExtractorConfig`
+.. |Schema| replace::
+    :py:class:`~tabledata.Schema`
+.. |BinaryTableReader| replace::
+    :py:class:`~tabledata.BinaryTableReader`
+.. |PhaseEvent| replace::
+    :py:class:`~tabledata.PhaseEvent`
+.. |set_instrument| replace::
+    :py:func:`~tabledata.set_instrument`
 """
 
 rst_prolog = (
@@ -2,15 +2,63 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .__version__ import __author__, __copyright__, __email__, __license__, __version__
-from ._common import convert_idx_to_alphabet
-from ._constant import PatternMatch
-from ._converter import to_value_matrix
+from ._constant import ConversionMode, FloatType, PatternMatch, Phase
 from ._core import TableData
+from ._instrument import PhaseEvent, PhaseStat, PhaseStats, set_instrument
 from ._logger import set_logger
 from .error import DataError, InvalidHeaderNameError, InvalidTableNameError, NameValidationError
 
 
+if TYPE_CHECKING:
+    from ._column_stats import ColumnStats
+    from ._common import convert_idx_to_alphabet
+    from ._converter import to_value_matrix
+    from ._extractor import ExtractorConfig
+    from ._group_by import GroupBy
+    from ._index import RowIndex
+    from ._memory import MemoryUsage
+    from ._schema import Schema
+    from ._schema_cache import SchemaCache
+    from ._shared_memory import SharedTableData
+    from ._storage import BinaryTableReader
+
+
+# names that are imported at the first access to keep 'import tabledata' cheap
+_LAZY_ATTR_MODULE_MAP = {
+    "convert_idx_to_alphabet": "._common",
+    "to_value_matrix": "._converter",
+    "BinaryTableReader": "._storage",
+    "ColumnStats": "._column_stats",
+    "ExtractorConfig": "._extractor",
+    "GroupBy": "._group_by",
+    "RowIndex": "._index",
+    "MemoryUsage": "._memory",
+    "Schema": "._schema",
+    "SchemaCache": "._schema_cache",
+    "SharedTableData": "._shared_memory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTR_MODULE_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTR_MODULE_MAP))
+
+
 __all__ = (
     "__author__",
     "__copyright__",
@@ -18,9 +66,25 @@ __all__ = (
     "__license__",
     "__version__",
     "convert_idx_to_alphabet",
+    "set_instrument",
     "set_logger",
     "to_value_matrix",
+    "BinaryTableReader",
+    "ColumnStats",
+    "ConversionMode",
+    "ExtractorConfig",
+    "FloatType",
+    "GroupBy",
+    "MemoryUsage",
     "PatternMatch",
+    "Phase",
+    "PhaseEvent",
+    "PhaseStat",
+    "PhaseStats",
+    "RowIndex",
+    "Schema",
+    "SchemaCache",
+    "SharedTableData",
     "TableData",
     "DataError",
     "InvalidHeaderNameError",
@@ -0,0 +1,247 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import copy
+import hashlib
+import math
+from collections.abc import Iterable
+from decimal import InvalidOperation
+from typing import Any, Optional
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch to estimate the number of distinct values with bounded memory.
+    Values are hashed from their ``repr``, so sketches built in different processes
+    can be merged.
+
+    :param precision:
+        Number of bits used to select a register.
+        The sketch uses ``2 ** precision`` bytes and
+        the standard error is about ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    #: Maximum number of hashes kept to count small cardinalities exactly.
+    EXACT_LIMIT = 1024
+
+    def __init__(self, precision: int = 12) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError(f"precision must be in the range 4 to 16: actual={precision}")
+
+        self.__precision = precision
+        self.__registers = bytearray(1 << precision)
+        self.__exact_hashes: Optional[set[int]] = set()
+
+    @property
+    def precision(self) -> int:
+        return self.__precision
+
+    @staticmethod
+    def hash(value: Any) -> int:
+        return int.from_bytes(
+            hashlib.blake2b(repr(value).encode("utf-8"), digest_size=8).digest(), "little"
+        )
+
+    def add(self, value: Any) -> None:
+        value_hash = self.hash(value)
+
+        if self.__exact_hashes is not None:
+            self.__exact_hashes.add(value_hash)
+            if len(self.__exact_hashes) > self.EXACT_LIMIT:
+                self.__exact_hashes = None
+
+        register_idx = value_hash & ((1 << self.__precision) - 1)
+        remaining = value_hash >> self.__precision
+        rank = (64 - self.__precision) - remaining.bit_length() + 1
+
+        if rank > self.__registers[register_idx]:
+            self.__registers[register_idx] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """
+        Merge another sketch that has the same precision into the sketch.
+        """
+
+        if self.precision != other.precision:
+            raise ValueError(f"precision mismatch: {self.precision} != {other.precision}")
+
+        self.__registers = bytearray(
+            max(lhs, rhs) for lhs, rhs in zip(self.__registers, other.__registers)
+        )
+
+        if self.__exact_hashes is not None and other.__exact_hashes is not None:
+            self.__exact_hashes |= other.__exact_hashes
+            if len(self.__exact_hashes) > self.EXACT_LIMIT:
+                self.__exact_hashes = None
+        else:
+            self.__exact_hashes = None
+
+    def count(self) -> int:
+        """
+        :return:
+            Estimated number of distinct values.
+            Exact while the number of distinct values is up to :py:attr:`.EXACT_LIMIT`.
+        """
+
+        if self.__exact_hashes is not None:
+            return len(self.__exact_hashes)
+
+        num_registers = len(self.__registers)
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+        estimate = alpha * num_registers**2 / sum(2.0**-register for register in self.__registers)
+
+        if estimate <= 2.5 * num_registers:
+            num_zero_registers = self.__registers.count(0)
+            if num_zero_registers:
+                # linear counting for small cardinalities
+                estimate = num_registers * math.log(num_registers / num_zero_registers)
+
+        return round(estimate)
+
+
+class ColumnStats:
+    """
+    Statistics of a column: minimum/maximum, null count, estimated distinct count
+    and maximum string length.
+    Statistics can be updated incrementally with :py:meth:`.update`,
+    and statistics of chunks of a column can be combined with :py:meth:`.merge`.
+
+    :Sample Code:
+        .. code:: python
+
+            from tabledata import TableData
+
+            tabledata = TableData("sample", ["a", "b"], [[1, "x"], [2, None], [2, "yz"]])
+
+            for header, stats in zip(tabledata.headers, tabledata.column_stats()):
+                print(header, stats)
+
+    :Output:
+        .. code-block:: none
+
+            a count=3, null_count=0, distinct_count=2, min=1, max=2, max_str_length=None
+            b count=3, null_count=1, distinct_count=2, min=x, max=yz, max_str_length=2
+    """
+
+    def __init__(self) -> None:
+        self.__count = 0
+        self.__null_count = 0
+        self.__min: Any = None
+        self.__max: Any = None
+        self.__is_comparable = True
+        self.__max_str_length: Optional[int] = None
+        self.__distinct = HyperLogLog()
+
+    def __repr__(self) -> str:
+        return ", ".join(
+            [
+                f"count={self.count}",
+                f"null_count={self.null_count}",
+                f"distinct_count={self.distinct_count}",
+                f"min={self.min}",
+                f"max={self.max}",
+                f"max_str_length={self.max_str_length}",
+            ]
+        )
+
+    @property
+    def count(self) -> int:
+        """int: Number of values including nulls."""
+
+        return self.__count
+
+    @property
+    def null_count(self) -> int:
+        """int: Number of |None| values."""
+
+        return self.__null_count
+
+    @property
+    def distinct_count(self) -> int:
+        """int: Estimated number of distinct non-null values."""
+
+        return self.__distinct.count()
+
+    @property
+    def min(self) -> Any:
+        """
+        Minimum of the non-null values.
+        |None| if there are no values or the values are not comparable to each other.
+        NaN values are ignored.
+        """
+
+        return self.__min if self.__is_comparable else None
+
+    @property
+    def max(self) -> Any:
+        """
+        Maximum of the non-null values.
+        |None| if there are no values or the values are not comparable to each other.
+        NaN values are ignored.
+        """
+
+        return self.__max if self.__is_comparable else None
+
+    @property
+    def max_str_length(self) -> Optional[int]:
+        """Optional[int]: Maximum length of the |str| values. |None| if no |str| values."""
+
+        return self.__max_str_length
+
+    def copy(self) -> "ColumnStats":
+        return copy.deepcopy(self)
+
+    def update(self, values: Iterable[Any]) -> None:
+        """
+        Add values to the statistics.
+        """
+
+        for value in values:
+            self.__count += 1
+
+            if value is None:
+                self.__null_count += 1
+                continue
+
+            self.__distinct.add(value)
+
+            if isinstance(value, str):
+                value_len = len(value)
+                if self.__max_str_length is None or value_len > self.__max_str_length:
+                    self.__max_str_length = value_len
+
+            if self.__is_comparable:
+                self.__update_min_max(value)
+
+    def merge(self, other: "ColumnStats") -> None:
+        """
+        Merge statistics of another chunk of the column into the statistics.
+        """
+
+        self.__count += other.__count
+        self.__null_count += other.__null_count
+        self.__distinct.merge(other.__distinct)
+
+        if other.__max_str_length is not None:
+            self.__max_str_length = max(self.__max_str_length or 0, other.__max_str_length)
+
+        if not other.__is_comparable:
+            self.__is_comparable = False
+        elif self.__is_comparable:
+            for value in (other.__min, other.__max):
+                if value is not None:
+                    self.__update_min_max(value)
+
+    def __update_min_max(self, value: Any) -> None:
+        if value != value:
+            # NaN (float or Decimal)
+            return
+
+        try:
+            if self.__min is None or value < self.__min:
+                self.__min = value
+            if self.__max is None or value > self.__max:
+                self.__max = value
+        except (TypeError, InvalidOperation):
+            self.__is_comparable = False
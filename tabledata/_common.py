@@ -2,6 +2,17 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+
+if TYPE_CHECKING:
+    from dataproperty import ColumnDataProperty, DataPropertyMatrix
+    from dataproperty.typing import TypeHint
+    from typepy import Typecode
+
+    from ._core import TableData
+
 
 def convert_idx_to_alphabet(idx: int) -> str:
     if idx < 26:
@@ -10,3 +21,128 @@ def convert_idx_to_alphabet(idx: int) -> str:
     div, mod = divmod(idx, 26)
 
     return convert_idx_to_alphabet(div - 1) + convert_idx_to_alphabet(mod)
+
+
+def extract_column_type_hints(
+    column_dp_list: Sequence["ColumnDataProperty"], value_dp_matrix: "DataPropertyMatrix"
+) -> list["TypeHint"]:
+    """
+    Extract type hints that reproduce the types of converted columns.
+    A column gets a type hint only if every non-null cell has the column type:
+    columns with mixed cell types get |None| (left to type inference).
+    """
+
+    from typepy import StrictLevel, Typecode
+
+    type_hints: list["TypeHint"] = []
+
+    for col_idx, col_dp in enumerate(column_dp_list):
+        acceptable_typecodes = (col_dp.typecode, Typecode.NONE)
+        type_hint: "TypeHint" = col_dp.type_class
+        has_null = False
+
+        for value_dp_list in value_dp_matrix:
+            try:
+                typecode = value_dp_list[col_idx].typecode
+            except IndexError:
+                # rows shorter than the headers do not have the column
+                type_hint = None
+                break
+
+            if typecode not in acceptable_typecodes:
+                type_hint = None
+                break
+
+            has_null = has_null or typecode == Typecode.NONE
+
+        if (
+            type_hint is not None
+            and has_null
+            and type_hint(None, strict_level=StrictLevel.MIN).is_type()
+        ):
+            # the type hint would convert null values to the column type
+            type_hint = None
+
+        type_hints.append(type_hint)
+
+    return type_hints
+
+
+def get_sample_row_indices(num_rows: int, sample_size: int) -> range:
+    """
+    :return: Indices of up to ``sample_size`` evenly spaced rows.
+    """
+
+    step = max(num_rows // max(sample_size, 1), 1)
+
+    return range(0, num_rows, step)[:sample_size]
+
+
+def get_matrix_num_columns(tabledata: "TableData", matrix: Sequence[Sequence[Any]]) -> int:
+    """
+    :return:
+        Number of the columns that have values in all of the rows of a converted matrix:
+        the conversion trims rows that have different lengths than the headers.
+    """
+
+    if not matrix:
+        return tabledata.num_columns or 0
+
+    return min(len(row) for row in matrix)
+
+
+def get_matrix_column_index(
+    tabledata: "TableData", name: str, matrix: Sequence[Sequence[Any]]
+) -> int:
+    """
+    :return: Index of a column that has values in all of the rows of a converted matrix.
+    :raises ValueError:
+        If the column does not exist, or the column does not have converted values
+        (rows shorter than the headers).
+    """
+
+    col_idx = tabledata.get_column_index(name)
+    num_columns = get_matrix_num_columns(tabledata, matrix)
+
+    if col_idx >= num_columns:
+        raise ValueError(
+            f"column does not have converted values: column={name}, converted columns={num_columns}"
+        )
+
+    return col_idx
+
+
+def get_column_typecodes(tabledata: "TableData") -> list[Optional["Typecode"]]:
+    """
+    Get the column types without converting the values to ``DataProperty``
+    if the table has a trusted schema.
+    """
+
+    if tabledata.is_trusted_schema and not tabledata.has_value_dp_matrix:
+        return [
+            None if type_hint is None else type_hint(None).typecode
+            for type_hint in tabledata.schema.type_hints
+        ]
+
+    return [col_dp.typecode for col_dp in tabledata.column_dp_list]
+
+
+_NAN_HASH_KEY = object()
+
+
+def to_hash_key(value: Any) -> Any:
+    """
+    Normalize a cell value to compare cells by hashing:
+    NaN values are regarded as equal to each other,
+    and unhashable values are compared by their representations.
+    """
+
+    if value != value:
+        return _NAN_HASH_KEY
+
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value).__name__, repr(value))
+
+    return value
@@ -0,0 +1,155 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import bisect
+import itertools
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+
+if TYPE_CHECKING:
+    from dataproperty.typing import TypeHint
+
+    from ._core import TableData
+
+
+ColumnMap = Optional[list[Optional[int]]]
+
+
+def merge_headers(tables: Sequence["TableData"]) -> list[str]:
+    """
+    :return: Headers of the tables in the order of appearance without duplicates.
+    :raises ValueError: If a table that has rows does not have headers.
+    """
+
+    headers: dict[str, None] = {}
+
+    for table in tables:
+        if not table.headers and not table.is_empty_rows():
+            raise ValueError(f"a table to concatenate requires headers: table={table.table_name}")
+
+        headers.update(dict.fromkeys(table.headers))
+
+    return list(headers)
+
+
+def make_column_map(headers: Sequence[str], part_headers: Sequence[str]) -> ColumnMap:
+    """
+    :return:
+        Column indices of the part for each of the headers (|None| for missing columns).
+        |None| if the part has the same headers.
+    """
+
+    if list(part_headers) == list(headers):
+        return None
+
+    part_col_idx_map = {header: col_idx for col_idx, header in enumerate(part_headers)}
+
+    return [part_col_idx_map.get(header) for header in headers]
+
+
+def widen_type_hints(
+    tables: Sequence["TableData"], headers: Sequence[str]
+) -> list[Optional["TypeHint"]]:
+    """
+    Unify the column types of the tables.
+    Columns that have only nulls in a table do not affect the unified type.
+    Numeric types are widened to ``RealNumber``. The other type combinations
+    get |None| (left to type inference).
+    """
+
+    from typepy import Infinity, Integer, Nan, RealNumber, Typecode
+
+    from ._common import get_column_typecodes
+
+    numeric_type_hints = {Integer, RealNumber, Infinity, Nan}
+    type_hints_map: dict[str, list[Optional["TypeHint"]]] = {header: [] for header in headers}
+
+    for table in tables:
+        if table.is_empty_rows():
+            continue
+
+        for header, typecode, type_hint in zip(
+            table.headers, get_column_typecodes(table), table.schema.type_hints
+        ):
+            if typecode == Typecode.NONE:
+                continue
+
+            type_hints_map[header].append(type_hint)
+
+    widened_type_hints: list[Optional["TypeHint"]] = []
+
+    for header in headers:
+        type_hint_set = set(type_hints_map[header])
+
+        if not type_hint_set or None in type_hint_set:
+            widened_type_hints.append(None)
+        elif len(type_hint_set) == 1:
+            widened_type_hints.append(type_hint_set.pop())
+        elif type_hint_set <= numeric_type_hints:
+            widened_type_hints.append(RealNumber)
+        else:
+            widened_type_hints.append(None)
+
+    return widened_type_hints
+
+
+def remap_row(row: Sequence[Any], column_map: ColumnMap, null_value: Any) -> Sequence[Any]:
+    if column_map is None:
+        return row
+
+    return [null_value if col_idx is None else row[col_idx] for col_idx in column_map]
+
+
+class ChainedRows(Sequence):
+    """
+    Read-only view of the rows of multiple matrices without copying them.
+    Rows of a matrix that has different columns are rearranged on access.
+    """
+
+    def __init__(
+        self,
+        matrices: Sequence[Sequence[Sequence[Any]]],
+        column_maps: Sequence[ColumnMap],
+        null_value: Any = None,
+    ) -> None:
+        self.__matrices = list(matrices)
+        self.__column_maps = list(column_maps)
+        self.__null_value = null_value
+        self.__offsets = list(itertools.accumulate(len(matrix) for matrix in self.__matrices))
+
+    def __len__(self) -> int:
+        return self.__offsets[-1] if self.__offsets else 0
+
+    def __iter__(self) -> Iterator[Sequence[Any]]:
+        for matrix, column_map in zip(self.__matrices, self.__column_maps):
+            for row in matrix:
+                yield remap_row(row, column_map, self.__null_value)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore
+        if isinstance(index, slice):
+            return [self[row_idx] for row_idx in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+
+        matrix_idx = bisect.bisect_right(self.__offsets, index)
+        start = self.__offsets[matrix_idx - 1] if matrix_idx > 0 else 0
+
+        return remap_row(
+            self.__matrices[matrix_idx][index - start],
+            self.__column_maps[matrix_idx],
+            self.__null_value,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return False
+
+        return all(lhs == rhs for lhs, rhs in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"ChainedRows(matrices={len(self.__matrices)}, rows={len(self)})"
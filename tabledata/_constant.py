@@ -9,3 +9,62 @@ import enum
 class PatternMatch(enum.Enum):
     OR = 0
     AND = 1
+
+
+@enum.unique
+class Phase(enum.Enum):
+    """
+    Processing phases of |TableData| measured by instruments.
+    """
+
+    #: Conversion of the rows into value lists aligned with the headers.
+    TO_VALUE_MATRIX = "to_value_matrix"
+
+    #: Extraction of ``DataProperty`` instances from the values.
+    TO_DP_MATRIX = "to_dp_matrix"
+
+    #: Aggregation of ``DataProperty`` instances into column properties.
+    TO_COLUMN_DP_LIST = "to_column_dp_list"
+
+    #: Export of the converted data (e.g. :py:meth:`.TableData.as_dict`).
+    EXPORT = "export"
+
+
+@enum.unique
+class FloatType(enum.Enum):
+    """
+    Representations of real numbers in the converted data of |TableData|.
+    """
+
+    #: ``decimal.Decimal`` instances (arbitrary precision).
+    DECIMAL = "decimal"
+
+    #: ``float`` instances. Faster to convert and to process than ``Decimal``.
+    FLOAT = "float"
+
+    #: Keep real number values of the rows as they are (e.g. ``float`` stays ``float``).
+    #: Other values such as strings are converted to ``Decimal``.
+    ORIGINAL = "original"
+
+
+@enum.unique
+class ConversionMode(enum.Enum):
+    """
+    Execution modes of the conversion of :py:attr:`.TableData.value_dp_matrix`.
+    """
+
+    #: ``THREAD`` on free-threaded Python (the GIL is disabled), ``PROCESS`` otherwise.
+    AUTO = "auto"
+
+    #: Convert columns in parallel with ``max_workers`` threads
+    #: (the number of CPUs if ``max_workers`` is not specified).
+    #: The results are the same as the serial conversion.
+    #: Scales with cores only if the GIL is disabled.
+    THREAD = "thread"
+
+    #: Convert columns in parallel with ``max_workers`` processes of the extractor.
+    #: Serial if ``max_workers`` is ``1``.
+    PROCESS = "process"
+
+    #: Convert in the calling thread regardless of ``max_workers``.
+    SERIAL = "serial"
@@ -2,35 +2,136 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import operator
+from collections import OrderedDict
 from collections.abc import Sequence
-from typing import Any
+from typing import Any, Callable, Optional
 
 from .error import DataError
 
 
-Row = tuple[int, Any]
+RowAdapter = Callable[[Any], Sequence[Any]]
 
 
-def to_value_matrix(headers: Sequence[str], value_matrix: Sequence[Any]) -> list[Row]:
+def to_value_matrix(
+    headers: Sequence[str], value_matrix: Sequence[Any], row_type: Optional[type] = None
+) -> list[Any]:
+    """
+    Convert rows to a list of value lists that are aligned with the headers.
+
+    Rows can be lists/tuples, dictionaries (or objects that have a ``get`` method),
+    namedtuples, dataclass instances or attrs instances. The shape of rows is
+    detected once per row type, and rows are converted by an adapter for the type.
+
+    :param headers: Header names. Used to pick values from non-sequence rows.
+    :param value_matrix: Rows to convert.
+    :param row_type: Type of the rows. Detected from the rows if |None|.
+    :raises tabledata.DataError: If a row cannot be converted.
+    """
+
     if not value_matrix:
         return []
 
-    return [_to_row(headers, values, row_idx)[1] for row_idx, values in enumerate(value_matrix)]
+    adapter_map: dict[type, RowAdapter] = {}
+    if row_type is not None:
+        adapter_map[row_type] = _make_row_adapter(headers, row_type)
 
+    value_list = []
+    for values in value_matrix:
+        values_type = type(values)
 
-def _to_row(headers: Sequence[str], values: Any, row_idx: int) -> Row:
-    if headers:
         try:
-            values = values._asdict()
-        except AttributeError:
-            pass
+            adapter = adapter_map[values_type]
+        except KeyError:
+            adapter = adapter_map[values_type] = _make_row_adapter(headers, values_type)
 
-        try:
-            return (row_idx, [values.get(header) for header in headers])
-        except (TypeError, AttributeError):
-            pass
+        value_list.append(adapter(values))
+
+    return value_list
+
+
+def _pass_through(values: Any) -> Any:
+    return values
+
+
+def _get_attr_names(row_type: type) -> Optional[list[str]]:
+    if hasattr(row_type, "__dataclass_fields__"):
+        # dataclasses is imported only for dataclass rows
+        import dataclasses
+
+        return [field.name for field in dataclasses.fields(row_type)]
+
+    attrs_attrs = getattr(row_type, "__attrs_attrs__", None)
+    if attrs_attrs is not None:
+        return [attr.name for attr in attrs_attrs]
+
+    return None
+
+
+def _make_row_adapter(headers: Sequence[str], row_type: type) -> RowAdapter:
+    attr_names = _get_attr_names(row_type)
+
+    if attr_names is not None:
+        return _make_attr_adapter(headers if headers else attr_names, attr_names)
+
+    if headers:
+        fields = getattr(row_type, "_fields", None)
+        if fields is not None and hasattr(row_type, "_asdict"):
+            # namedtuple
+            if tuple(headers) == tuple(fields):
+                return _pass_through
 
-    if not isinstance(values, (tuple, list)):
-        raise DataError(f"row must be a list or tuple: actual={type(values)}")
+            return _make_attr_adapter(headers, list(fields))
+
+        if hasattr(row_type, "get"):
+            return _make_mapping_adapter(headers, row_type)
+
+    if not issubclass(row_type, (tuple, list)):
+
+        def raise_data_error(values: Any) -> Any:
+            raise DataError(f"row must be a list or tuple: actual={type(values)}")
+
+        return raise_data_error
+
+    return _pass_through
+
+
+def _make_attr_adapter(headers: Sequence[str], attr_names: Sequence[str]) -> RowAdapter:
+    if not all(header in attr_names for header in headers):
+        # only the declared fields are values of a row: other attributes such as methods
+        # are regarded as missing
+        field_flags = [header in attr_names for header in headers]
+
+        return lambda values: [
+            getattr(values, header, None) if is_field else None
+            for header, is_field in zip(headers, field_flags)
+        ]
+
+    if len(headers) == 1:
+        header = headers[0]
+        return lambda values: [getattr(values, header)]
+
+    getter = operator.attrgetter(*headers)
+
+    return lambda values: list(getter(values))
+
+
+def _make_mapping_adapter(headers: Sequence[str], row_type: type) -> RowAdapter:
+    def get_values(values: Any) -> list[Any]:
+        return [values.get(header) for header in headers]
+
+    # item access is equivalent to get() only for plain dictionaries: subclasses such as
+    # defaultdict insert missing keys, and other objects may not support item access
+    if row_type not in (dict, OrderedDict) or len(headers) == 1:
+        return get_values
+
+    getter = operator.itemgetter(*headers)
+
+    def adapter(values: Any) -> list[Any]:
+        try:
+            return list(getter(values))
+        except (KeyError, TypeError):
+            # some of the headers are missing in the row
+            return get_values(values)
 
-    return (row_idx, values)
+    return adapter
@@ -4,23 +4,41 @@
 
 import copy
 import re
+import threading
+import time
 from collections import OrderedDict, namedtuple
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Optional, Union
 
-import dataproperty as dp
-import typepy
-from dataproperty import DataPropertyMatrix
-from dataproperty.typing import TypeHint
-from typepy import Nan
-
-from ._constant import PatternMatch
+from . import _instrument
+from ._common import (
+    extract_column_type_hints,
+    get_column_typecodes,
+    get_matrix_column_index,
+    get_matrix_num_columns,
+    get_sample_row_indices,
+    to_hash_key,
+)
+from ._constant import ConversionMode, FloatType, PatternMatch, Phase
 from ._converter import to_value_matrix
-from ._logger import logger  # type: ignore
+from ._instrument import Instrument, emit_phase
+from ._logger import log_row_diagnostics, logger, logger_state  # type: ignore
+from ._schema import Schema
 
 
 if TYPE_CHECKING:
+    import dataproperty as dp
     import pandas
+    from dataproperty import DataPropertyMatrix
+    from dataproperty.typing import TypeHint
+
+    from ._column_stats import ColumnStats
+    from ._extractor import ExtractorConfig
+    from ._group_by import GroupBy
+    from ._index import RowIndex
+    from ._memory import MemoryUsage
+    from ._schema_cache import SchemaCache
 
 
 class TableData:
@@ -30,44 +48,113 @@ class TableData:
     :param table_name: Name of the table.
     :param  headers: Table header names.
     :param rows: Data of the table.
+    :param dp_extractor:
+        Extractor to convert the data.
+        A ``DataPropertyExtractor`` instance is copied.
+        An |ExtractorConfig| instance is shared without copying: a private extractor
+        is created only when the instance needs an extractor.
+    :param schema_cache:
+        Cache of column types shared by tables with the same name and headers.
+        Used only when ``type_hints`` is not specified.
+    :param schema:
+        Trusted |Schema| of the table. If specified, ``rows`` are regarded as
+        already typed values: :py:attr:`.value_matrix` is built from ``rows`` without
+        per-cell type inference and validation, and the column types
+        of the schema are used as ``type_hints``.
+        ``headers`` defaults to the headers of the schema.
+    :param float_type:
+        Representation of real numbers in the converted data
+        (:py:attr:`.value_matrix`, :py:meth:`.as_dict`, :py:meth:`.as_tuple` and
+        :py:meth:`.as_dataframe`). Defaults to the ``float_type`` of ``dp_extractor``
+        (``Decimal`` by default). ``max_precision`` is applied to the display
+        of the values regardless of the representation.
+        Real number values of trusted ``rows`` are converted to ``float`` only if
+        :py:attr:`~.FloatType.FLOAT` is specified.
+    :param conversion_mode:
+        Execution mode of the conversion of :py:attr:`.value_dp_matrix`.
+        Defaults to :py:attr:`~.ConversionMode.AUTO`: threads on free-threaded Python,
+        the extractor's own (process-based if ``max_workers`` > 1) conversion otherwise.
     """
 
+    #: Maximum number of pages cached by :py:meth:`.page`.
+    page_cache_size = 16
+
+    #: Number of rows sampled by :py:meth:`.page` to determine the column properties.
+    page_sample_size = 1000
+
     def __init__(
         self,
         table_name: Optional[str],
         headers: Sequence[str],
         rows: Sequence,
-        dp_extractor: Optional[dp.DataPropertyExtractor] = None,
-        type_hints: Optional[Sequence[Union[str, TypeHint]]] = None,
+        dp_extractor: Union["dp.DataPropertyExtractor", "ExtractorConfig", None] = None,
+        type_hints: Optional[Sequence[Union[str, "TypeHint"]]] = None,
         max_workers: Optional[int] = None,
         max_precision: Optional[int] = None,
+        schema_cache: Optional["SchemaCache"] = None,
+        schema: Optional[Schema] = None,
+        float_type: Optional[FloatType] = None,
+        conversion_mode: ConversionMode = ConversionMode.AUTO,
     ) -> None:
         self.__table_name = table_name
+        self.__schema_cache = schema_cache
+        self.__schema = schema
         self.__value_matrix: list[list[Any]] = []
         self.__value_dp_matrix: Optional[DataPropertyMatrix] = None
+        # guards the computations of the caches: the caches are computed once even if
+        # multiple threads access them at the same time. Reads of computed caches
+        # do not acquire the lock.
+        self.__lock = threading.RLock()
+        self.__column_stats: Optional[list[ColumnStats]] = None
+        self.__header_position_map: Optional[dict[str, int]] = None
+        self.__row_index_map: dict[str, RowIndex] = {}
+        self.__page_cache: OrderedDict[tuple[int, int], TableData] = OrderedDict()
+        self.__page_column_dp_list: Optional[list[dp.ColumnDataProperty]] = None
+        self.__shared_column_dp_list: Optional[list[dp.ColumnDataProperty]] = None
+        self.__shared_column_dp_lock: Optional[threading.RLock] = None
+        self.__is_shared_column_dp_list_widened = False
+        self.__is_custom_dp_extractor = dp_extractor is not None
+        self.__instrument: Optional[Instrument] = None
+        self.pickle_caches = False
 
         if rows:
             self.__rows = rows
         else:
             self.__rows = []
 
-        if dp_extractor:
-            self.__dp_extractor = copy.deepcopy(dp_extractor)
-        else:
-            self.__dp_extractor = dp.DataPropertyExtractor(max_precision=max_precision)
+        # the default configuration is resolved on demand to keep construction cheap
+        self.__extractor_config: Optional["ExtractorConfig"] = None
+        self.__max_precision = max_precision
+        self.__float_type = float_type
+        self.__conversion_mode = conversion_mode
 
-        if type_hints:
-            self.__dp_extractor.column_type_hints = type_hints
+        if dp_extractor:
+            from ._extractor import ExtractorConfig
+
+            if isinstance(dp_extractor, ExtractorConfig):
+                self.__extractor_config = dp_extractor
+            else:
+                self.__extractor_config = ExtractorConfig(dp_extractor)
+
+        if schema is not None:
+            if not headers:
+                headers = schema.headers
+            elif len(headers) != len(schema.headers):
+                raise ValueError(
+                    f"headers and schema length mismatch: {len(headers)} != {len(schema.headers)}"
+                )
 
-        self.__dp_extractor.strip_str_header = '"'
+            type_hints = schema.type_hints
 
-        if max_workers:
-            self.__dp_extractor.max_workers = max_workers
+        # a private extractor is created on demand (copy-on-write)
+        self.__dp_extractor: Optional[dp.DataPropertyExtractor] = None
+        self.__type_hints = type_hints
+        self.__max_workers = max_workers
 
         if not headers:
-            self.__dp_extractor.headers = []
+            self.__headers: Sequence[str] = []
         else:
-            self.__dp_extractor.headers = headers
+            self.__headers = headers
 
     def __repr__(self) -> str:
         element_list = [f"table_name={self.table_name}"]
@@ -93,6 +180,102 @@ class TableData:
 
         return not self.equals(other, cmp_by_dp=False)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Return a compact picklable state.
+        Converted tables are shipped as typed column data instead of the raw rows,
+        and the receiver restores :py:attr:`.value_matrix` without type inference.
+        The raw rows are shipped as well if they are not the same as the converted values
+        (e.g. strings converted to numbers), thus a restored table equals the source.
+        Computed caches are included only if :py:attr:`.pickle_caches` is |True|.
+        Tables whose converted rows do not have a value for each of the headers
+        (e.g. rows shorter than the headers) are shipped with the original rows.
+        """
+
+        state: dict[str, Any] = {
+            "table_name": self.table_name,
+            "headers": list(self.headers),
+            "max_workers": self.max_workers,
+            "max_precision": self.extractor_config.max_precision,
+            "float_type": self.__float_type,
+            "conversion_mode": self.__conversion_mode,
+            "pickle_caches": self.pickle_caches,
+            "type_hints": self.type_hints,
+            "schema": self.__schema,
+        }
+
+        if self.__is_custom_dp_extractor:
+            state["dp_extractor"] = self.extractor_config
+
+        if self.pickle_caches and self.__value_dp_matrix is not None:
+            state["value_dp_matrix"] = [
+                list(value_dp_list) for value_dp_list in self.__value_dp_matrix
+            ]
+
+        is_converted = self.__value_dp_matrix is not None or (
+            self.__schema is not None and bool(self.__value_matrix)
+        )
+
+        if not is_converted or not self.__is_aligned_value_matrix():
+            state["rows"] = self.rows
+
+            return state
+
+        from ._storage import pack_column
+
+        value_matrix = self.value_matrix
+        state["num_rows"] = len(value_matrix)
+        state["columns"] = [pack_column(values, allow_pickle=True) for values in zip(*value_matrix)]
+
+        if not self.__is_rows_value_matrix(value_matrix):
+            state["rows"] = self.rows
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        value_matrix: Optional[list[list[Any]]] = None
+
+        if "columns" in state:
+            from ._storage import unpack_column
+
+            num_rows = state["num_rows"]
+            value_matrix = [
+                list(row)
+                for row in zip(
+                    *(
+                        unpack_column(encoding, blocks, num_rows, has_null, allow_pickle=True)
+                        for encoding, blocks, has_null in state["columns"]
+                    )
+                )
+            ]
+
+        if "rows" in state:
+            rows: Sequence = state["rows"]
+        else:
+            assert value_matrix is not None
+            rows = [list(values) for values in value_matrix]
+
+        self.__init__(  # type: ignore
+            state["table_name"],
+            state["headers"],
+            rows,
+            dp_extractor=state.get("dp_extractor"),
+            type_hints=state.get("type_hints"),
+            max_workers=state["max_workers"],
+            max_precision=state["max_precision"],
+            schema=state.get("schema"),
+            float_type=state.get("float_type"),
+            conversion_mode=state.get("conversion_mode", ConversionMode.AUTO),
+        )
+        self.pickle_caches = state["pickle_caches"]
+
+        if value_matrix:
+            self.__value_matrix = value_matrix
+
+        value_dp_matrix = state.get("value_dp_matrix")
+        if value_dp_matrix is not None:
+            self.__value_dp_matrix = value_dp_matrix
+
     @property
     def table_name(self) -> Optional[str]:
         """str: Name of the table."""
@@ -107,26 +290,102 @@ class TableData:
     def headers(self) -> Sequence[str]:
         """Sequence[str]: Table header names."""
 
-        return self.__dp_extractor.headers
+        return self.__headers
 
     @property
     def rows(self) -> Sequence:
-        """Sequence: Original rows of tabular data."""
+        """
+        Sequence: Original rows of tabular data.
+        """
 
         return self.__rows
 
     @property
-    def value_matrix(self) -> DataPropertyMatrix:
+    def value_matrix(self) -> "DataPropertyMatrix":
         """DataPropertyMatrix: Converted rows of tabular data."""
 
+        instrument = self.__instrument or _instrument.global_instrument
+
         if self.__value_matrix:
+            if instrument is not None:
+                self.__emit_phase(
+                    instrument,
+                    Phase.TO_VALUE_MATRIX,
+                    "value_matrix",
+                    time.perf_counter(),
+                    self.__value_matrix,
+                    cache_hit=True,
+                )
+
             return self.__value_matrix
 
-        self.__value_matrix = [
-            [value_dp.data for value_dp in value_dp_list] for value_dp_list in self.value_dp_matrix
-        ]
+        with self.__lock:
+            # double-checked: another thread may have converted while waiting for the lock
+            if self.__value_matrix:
+                return self.__value_matrix
+
+            if self.__schema is not None and self.__value_dp_matrix is None:
+                start = time.perf_counter()
+                value_matrix = [list(row) for row in to_value_matrix(self.headers, self.rows)]
+                self.__schema.spot_check(value_matrix)
+                if self.__float_type == FloatType.FLOAT:
+                    value_matrix = [
+                        [float(value) if isinstance(value, Decimal) else value for value in row]
+                        for row in value_matrix
+                    ]
+            else:
+                value_dp_matrix = self.value_dp_matrix
+                start = time.perf_counter()
+                if self.__float_type == FloatType.ORIGINAL:
+                    value_matrix = self.__to_original_float_value_matrix(value_dp_matrix)
+                else:
+                    value_matrix = [
+                        [value_dp.data for value_dp in value_dp_list]
+                        for value_dp_list in value_dp_matrix
+                    ]
+
+            # publish the matrix only after it is completely built
+            self.__value_matrix = value_matrix
+
+        if instrument is not None:
+            self.__emit_phase(
+                instrument, Phase.TO_VALUE_MATRIX, "value_matrix", start, value_matrix
+            )
+
+        return value_matrix
+
+    @property
+    def pickle_caches(self) -> bool:
+        """
+        bool: If |True|, computed caches (e.g. :py:attr:`.value_dp_matrix`) are
+        included when the instance is pickled. Otherwise, the receiver rebuilds
+        the caches from typed column data without type inference.
+        Defaults to |False|.
+        """
+
+        return self.__pickle_caches
+
+    @pickle_caches.setter
+    def pickle_caches(self, value: bool) -> None:
+        self.__pickle_caches = value
+
+    @property
+    def instrument(self) -> Optional[Instrument]:
+        """
+        Optional[Callable[[PhaseEvent], None]]:
+        Instrument that is called with a |PhaseEvent| for each processing phase
+        of the instance. Defaults to the instrument set by |set_instrument|.
+        Phases are not measured if |None|.
+        """
+
+        if self.__instrument is not None:
+            return self.__instrument
 
-        return self.__value_matrix
+        return _instrument.global_instrument
+
+    @instrument.setter
+    def instrument(self, value: Optional[Instrument]) -> None:
+        self.__instrument = value
 
     @property
     def has_value_dp_matrix(self) -> bool:
@@ -134,11 +393,53 @@ class TableData:
 
     @property
     def max_workers(self) -> int:
-        return self.__dp_extractor.max_workers
+        if self.__dp_extractor is not None:
+            return self.__dp_extractor.max_workers
+
+        return self.__config.resolve_max_workers(self.__max_workers)
 
     @max_workers.setter
     def max_workers(self, value: Optional[int]) -> None:
-        self.__dp_extractor.max_workers = value
+        self.__max_workers = value
+
+        if self.__dp_extractor is not None:
+            self.__dp_extractor.max_workers = value
+
+    @property
+    def float_type(self) -> Optional[FloatType]:
+        """
+        Optional[FloatType]: Representation of real numbers in the converted data.
+        |None| if the representation follows the extractor.
+        """
+
+        return self.__float_type
+
+    @property
+    def conversion_mode(self) -> ConversionMode:
+        """
+        ConversionMode: Execution mode of the conversion of :py:attr:`.value_dp_matrix`.
+        Changes take effect only if the conversion is not done yet.
+        """
+
+        return self.__conversion_mode
+
+    @conversion_mode.setter
+    def conversion_mode(self, value: ConversionMode) -> None:
+        self.__conversion_mode = value
+
+    @property
+    def type_hints(self) -> list["TypeHint"]:
+        """list: Type hints of the columns."""
+
+        if self.__dp_extractor is not None:
+            return self.__dp_extractor.column_type_hints
+
+        if self.__type_hints:
+            from dataproperty.typing import normalize_type_hint
+
+            return [normalize_type_hint(type_hint) for type_hint in self.__type_hints]
+
+        return self.__config.column_type_hints
 
     @property
     def num_rows(self) -> Optional[int]:
@@ -154,6 +455,8 @@ class TableData:
 
     @property
     def num_columns(self) -> Optional[int]:
+        import typepy
+
         if typepy.is_not_empty_sequence(self.headers):
             return len(self.headers)
 
@@ -165,31 +468,293 @@ class TableData:
             return 0
 
     @property
-    def value_dp_matrix(self) -> DataPropertyMatrix:
+    def value_dp_matrix(self) -> "DataPropertyMatrix":
         """DataPropertyMatrix: DataProperty for table data."""
 
-        if self.__value_dp_matrix is None:
-            self.__value_dp_matrix = self.__dp_extractor.to_dp_matrix(
-                to_value_matrix(self.headers, self.rows)
+        instrument = self.__instrument or _instrument.global_instrument
+
+        if self.__value_dp_matrix is not None:
+            if instrument is not None:
+                self.__emit_phase(
+                    instrument,
+                    Phase.TO_DP_MATRIX,
+                    "value_dp_matrix",
+                    time.perf_counter(),
+                    self.__value_dp_matrix,
+                    cache_hit=True,
+                )
+
+            return self.__value_dp_matrix
+
+        with self.__lock:
+            if self.__value_dp_matrix is not None:
+                return self.__value_dp_matrix
+
+            if self.__schema is not None:
+                value_matrix = self.value_matrix
+            else:
+                start = time.perf_counter()
+                value_matrix = to_value_matrix(self.headers, self.rows)
+
+                if instrument is not None:
+                    self.__emit_phase(
+                        instrument, Phase.TO_VALUE_MATRIX, "value_dp_matrix", start, value_matrix
+                    )
+
+            start = time.perf_counter()
+
+            if self.__schema_cache is not None and not self.type_hints:
+                value_dp_matrix = self.__to_dp_matrix_with_schema_cache(value_matrix)
+            else:
+                value_dp_matrix = self.__to_dp_matrix(self.dp_extractor, value_matrix)
+
+            self.__value_dp_matrix = value_dp_matrix
+
+        if instrument is not None:
+            self.__emit_phase(
+                instrument, Phase.TO_DP_MATRIX, "value_dp_matrix", start, value_dp_matrix
             )
 
-        return self.__value_dp_matrix
+        return value_dp_matrix
 
     @property
-    def header_dp_list(self) -> list[dp.DataProperty]:
-        return self.__dp_extractor.to_header_dp_list()
+    def header_dp_list(self) -> list["dp.DataProperty"]:
+        return self.dp_extractor.to_header_dp_list()
 
     @property
-    def column_dp_list(self) -> list[dp.ColumnDataProperty]:
-        return self.__dp_extractor.to_column_dp_list(self.value_dp_matrix)
+    def column_dp_list(self) -> list["dp.ColumnDataProperty"]:
+        """
+        list[ColumnDataProperty]: Column properties of the converted data.
+        Built from :py:attr:`.value_dp_matrix` at each access, thus the properties
+        reflect the current settings of :py:attr:`.dp_extractor`.
+        Tables with a trusted schema that are not converted yet convert only the values
+        that determine the properties: the minimum, maximum and smallest absolute values
+        of integer columns, and distinct values of the other columns with column types.
+        Thus the properties are the same except for the counts of the values
+        (e.g. ``minmax_decimal_places``).
+        Pages created by :py:meth:`.page` share the column properties of the source table,
+        which are widened with the values of each page at the first access.
+        """
+
+        instrument = self.__instrument or _instrument.global_instrument
+
+        if self.__shared_column_dp_list is not None:
+            if not self.__is_shared_column_dp_list_widened:
+                self.__widen_shared_column_dp_list()
+
+            if instrument is not None:
+                self.__emit_phase(
+                    instrument,
+                    Phase.TO_COLUMN_DP_LIST,
+                    "column_dp_list",
+                    time.perf_counter(),
+                    self.__rows,
+                    cache_hit=True,
+                )
+
+            return self.__shared_column_dp_list
+
+        if self.__is_trusted_format_values():
+            start = time.perf_counter()
+            value_dp_matrix = self.__to_format_dp_matrix()
+        else:
+            value_dp_matrix = self.value_dp_matrix
+            start = time.perf_counter()
+
+        column_dp_list = self.dp_extractor.to_column_dp_list(value_dp_matrix)
+
+        if instrument is not None:
+            self.__emit_phase(
+                instrument, Phase.TO_COLUMN_DP_LIST, "column_dp_list", start, value_dp_matrix
+            )
+
+        return column_dp_list
+
+    def get_column_index(self, name: str) -> int:
+        """
+        Get the position of a column. Positions are looked up from a mapping of
+        the headers that is created at the first call.
+
+        :param name: Header name of the column.
+        :return: Index of the column. The first one if the headers have duplicates.
+        :raises ValueError: If the column does not exist.
+        """
+
+        if self.__header_position_map is None:
+            header_position_map: dict[str, int] = {}
+            for col_idx, header in enumerate(self.headers):
+                header_position_map.setdefault(header, col_idx)
+
+            self.__header_position_map = header_position_map
+
+        try:
+            return self.__header_position_map[name]
+        except KeyError:
+            raise ValueError(f"column not found: {name}") from None
+
+    def get_column(self, name: str) -> list[Any]:
+        """
+        :param name: Header name of the column.
+        :return: Converted values of the column.
+        :raises ValueError: If the column does not exist or does not have converted values
+            (rows shorter than the headers).
+        """
+
+        value_matrix = self.value_matrix
+        col_idx = get_matrix_column_index(self, name, value_matrix)
+
+        return [row[col_idx] for row in value_matrix]
+
+    def get_value_dp_list(self, name: str) -> list["dp.DataProperty"]:
+        """
+        :param name: Header name of the column.
+        :return: ``DataProperty`` instances of the column.
+        :raises ValueError: If the column does not exist or does not have converted values
+            (rows shorter than the headers).
+        """
+
+        value_dp_matrix = self.value_dp_matrix
+        col_idx = get_matrix_column_index(self, name, value_dp_matrix)
+
+        return [value_dp_list[col_idx] for value_dp_list in value_dp_matrix]
+
+    def create_index(self, name: str) -> "RowIndex":
+        """
+        Create a hash index of the rows by the converted values of a key column.
+        The index is cached in the instance: the rows are indexed at the first call
+        for the column.
+
+        :param name: Header name of the key column.
+        :return: Index that looks up rows by a key in constant time.
+        :rtype: RowIndex
+        :raises ValueError: If the column does not exist or does not have converted values
+            (rows shorter than the headers).
+
+        :Sample Code:
+            .. code:: python
+
+                from tabledata import TableData
+
+                tabledata = TableData("sample", ["id", "name"], [[1, "a"], [2, "b"]])
+                index = tabledata.create_index("id")
+                print(index.lookup(2))
+
+        :Output:
+            .. code-block:: none
+
+                [2, 'b']
+        """
+
+        from ._index import RowIndex
+
+        try:
+            return self.__row_index_map[name]
+        except KeyError:
+            pass
+
+        with self.__lock:
+            try:
+                return self.__row_index_map[name]
+            except KeyError:
+                pass
+
+            value_matrix = self.value_matrix
+            row_index = RowIndex(
+                name, value_matrix, get_matrix_column_index(self, name, value_matrix)
+            )
+            self.__row_index_map[name] = row_index
+
+        return row_index
+
+    def column_stats(self) -> list["ColumnStats"]:
+        """
+        Compute statistics of each column from the converted values:
+        minimum/maximum, null count, estimated distinct count and maximum string length.
+        The statistics are collected in a single pass over the converted cells and
+        cached in the instance. Distinct counts are estimated with a HyperLogLog sketch,
+        thus the memory usage is bounded regardless of the number of rows.
+
+        :return:
+            Copies of the cached statistics in the order of the columns.
+            The copies can be updated incrementally (e.g. with appended rows)
+            by :py:meth:`.ColumnStats.update` and :py:meth:`.ColumnStats.merge`.
+        :rtype: list[ColumnStats]
+        """
+
+        if self.__column_stats is None:
+            with self.__lock:
+                if self.__column_stats is None:
+                    self.__column_stats = self.__compute_column_stats()
+
+        return [column_stats.copy() for column_stats in self.__column_stats]
 
     @property
-    def dp_extractor(self) -> dp.DataPropertyExtractor:
+    def schema(self) -> Schema:
+        """
+        Schema: Trusted schema of the table if specified.
+        Otherwise, a schema created from the converted column types.
+        """
+
+        if self.__schema is not None:
+            return self.__schema
+
+        return Schema.from_tabledata(self)
+
+    @property
+    def is_trusted_schema(self) -> bool:
+        return self.__schema is not None
+
+    @property
+    def dp_extractor(self) -> "dp.DataPropertyExtractor":
+        """
+        DataPropertyExtractor: Private extractor of the instance.
+        Created from :py:attr:`.extractor_config` at the first access.
+        """
+
+        if self.__dp_extractor is None:
+            with self.__lock:
+                if self.__dp_extractor is None:
+                    self.__dp_extractor = self.__config.new_extractor(
+                        self.__headers,
+                        type_hints=self.__type_hints,
+                        max_workers=self.__max_workers,
+                        float_type={FloatType.FLOAT: float, FloatType.DECIMAL: Decimal}.get(
+                            self.__float_type  # type: ignore
+                        ),
+                    )
+
         return self.__dp_extractor
 
+    @property
+    def extractor_config(self) -> "ExtractorConfig":
+        """
+        ExtractorConfig: Extractor configuration of the instance.
+        Shared with the source configuration as long as the private extractor
+        does not have changes other than the table-specific settings.
+        Otherwise, a snapshot of the private extractor.
+        """
+
+        if self.__dp_extractor is not None and not self.__config.is_source_of(self.__dp_extractor):
+            from ._extractor import ExtractorConfig
+
+            return ExtractorConfig(self.__dp_extractor)
+
+        return self.__config
+
+    @property
+    def __config(self) -> "ExtractorConfig":
+        if self.__extractor_config is None:
+            from ._extractor import get_default_extractor_config
+
+            self.__extractor_config = get_default_extractor_config(self.__max_precision)
+
+        return self.__extractor_config
+
     def is_empty_header(self) -> bool:
         """bool: |True| if the data :py:attr:`.headers` is empty."""
 
+        import typepy
+
         return typepy.is_empty_sequence(self.headers)
 
     def is_empty_rows(self) -> bool:
@@ -225,6 +790,8 @@ class TableData:
         return all(compare_item_list)
 
     def __equals_raw(self, other: "TableData") -> bool:
+        from typepy import Nan
+
         if not self.__equals_base(other):
             return False
 
@@ -290,8 +857,10 @@ class TableData:
         if not invalid_row_idx_list:
             return
 
-        for invalid_row_idx in invalid_row_idx_list:
-            logger.debug(f"invalid row (line={invalid_row_idx}): {self.rows[invalid_row_idx]}")
+        log_row_diagnostics(
+            invalid_row_idx_list,
+            lambda row_idx: f"invalid row (line={row_idx}): {self.rows[row_idx]}",
+        )
 
         raise ValueError(
             "table header length and row length are mismatch:\n"
@@ -327,8 +896,11 @@ class TableData:
                 {'sample': [OrderedDict([('a', 1), ('b', 2)]), OrderedDict([('a', 3.3), ('b', 4.4)])]}
         """  # noqa
 
+        value_matrix = self.value_matrix
+        start = time.perf_counter()
+
         dict_body = []
-        for row in self.value_matrix:
+        for row in value_matrix:
             if not row:
                 continue
 
@@ -345,6 +917,10 @@ class TableData:
         if not table_name:
             table_name = default_key
 
+        instrument = self.__instrument or _instrument.global_instrument
+        if instrument is not None:
+            self.__emit_phase(instrument, Phase.EXPORT, "as_dict", start, value_matrix)
+
         return {table_name: dict_body}
 
     def as_tuple(self) -> Iterator[tuple]:
@@ -372,15 +948,22 @@ class TableData:
                 Row(a=Decimal('3.3'), b=Decimal('4.4'))
         """
 
+        import typepy
+
         Row = namedtuple("Row", self.headers)  # type: ignore
+        value_matrix = self.value_matrix
+        instrument = self.__instrument or _instrument.global_instrument
+        start = time.perf_counter()
 
-        for value_dp_list in self.value_dp_matrix:
-            if typepy.is_empty_sequence(value_dp_list):
+        for values in value_matrix:
+            if typepy.is_empty_sequence(values):
                 continue
 
-            row = Row(*(value_dp.data for value_dp in value_dp_list))
+            yield Row(*values)
 
-            yield row
+        if instrument is not None:
+            # measured from the start to the end of the iteration
+            self.__emit_phase(instrument, Phase.EXPORT, "as_tuple", start, value_matrix)
 
     def as_dataframe(self) -> "pandas.DataFrame":
         """
@@ -414,18 +997,58 @@ class TableData:
         except ImportError:
             raise RuntimeError("required 'pandas' package to execute as_dataframe method")
 
-        dataframe = DataFrame(self.value_matrix)
+        value_matrix = self.value_matrix
+        start = time.perf_counter()
+
+        dataframe = DataFrame(value_matrix)
         if not self.is_empty_header():
             dataframe.columns = self.headers
 
+        instrument = self.__instrument or _instrument.global_instrument
+        if instrument is not None:
+            self.__emit_phase(instrument, Phase.EXPORT, "as_dataframe", start, value_matrix)
+
         return dataframe
 
+    def memory_usage(self, deep: bool = True) -> "MemoryUsage":
+        """
+        Measure the memory usage of the instance per column and per cache layer.
+        Caches that are not computed yet are not computed by this method.
+
+        :param deep:
+            If |True|, include the objects referenced by the cells
+            (e.g. the values and formatters of ``DataProperty`` instances).
+            Otherwise, measure only the cell objects themselves.
+        :return: Memory usage of the instance.
+        :rtype: MemoryUsage
+        """
+
+        from ._memory import MemoryUsage, measure_layer
+
+        num_columns = self.num_columns or 0
+        seen: set[int] = set()
+        column_usage_map = {}
+        container_usage_map = {}
+
+        for layer, containers, cell_matrix in (
+            ("rows", self.rows, to_value_matrix(self.headers, self.rows)),
+            ("value_matrix", self.__value_matrix or None, self.__value_matrix or None),
+            ("value_dp_matrix", self.__value_dp_matrix, self.__value_dp_matrix),
+        ):
+            column_usage_map[layer], container_usage_map[layer] = measure_layer(
+                containers, cell_matrix, num_columns, deep, seen
+            )
+
+        return MemoryUsage(self.headers, column_usage_map, container_usage_map)
+
     def transpose(self) -> "TableData":
         return TableData(
             self.table_name,
             self.headers,
             [row for row in zip(*self.rows)],
             max_workers=self.max_workers,
+            float_type=self.__float_type,
+            conversion_mode=self.__conversion_mode,
         )
 
     def filter_column(
@@ -435,12 +1058,13 @@ class TableData:
         is_re_match: bool = False,
         pattern_match: PatternMatch = PatternMatch.OR,
     ) -> "TableData":
-        logger.debug(
-            "filter_column: patterns={}, is_invert_match={}, "
-            "is_re_match={}, pattern_match={}".format(
-                patterns, is_invert_match, is_re_match, pattern_match
+        if logger_state.is_enabled:
+            logger.debug(
+                "filter_column: patterns={}, is_invert_match={}, "
+                "is_re_match={}, pattern_match={}".format(
+                    patterns, is_invert_match, is_re_match, pattern_match
+                )
             )
-        )
 
         if not patterns:
             return self
@@ -468,24 +1092,399 @@ class TableData:
                 match_header_list.append(header)
                 match_column_matrix.append(column)
 
-        logger.debug(
-            "filter_column: table={}, match_header_list={}".format(
-                self.table_name, match_header_list
+        if logger_state.is_enabled:
+            logger.debug(
+                "filter_column: table={}, match_header_list={}".format(
+                    self.table_name, match_header_list
+                )
             )
-        )
 
         return TableData(
             self.table_name,
             match_header_list,
             list(zip(*match_column_matrix)),
             max_workers=self.max_workers,
+            float_type=self.__float_type,
+            conversion_mode=self.__conversion_mode,
         )
 
+    def sort_by(
+        self,
+        columns: Union[str, Sequence[str]],
+        descending: Union[bool, Sequence[bool]] = False,
+        nulls: str = "last",
+        limit: Optional[int] = None,
+    ) -> "TableData":
+        """
+        Create a table data that has rows sorted by the values of columns.
+        Sort keys are built once per column from the converted values and
+        the column types: values of numeric, boolean and datetime columns are compared
+        by the values, and the other values are compared as strings.
+        The sort is stable.
+        The new instance keeps the converted data of the instance, thus column types
+        are not inferred again.
+
+        :param columns: Header names of the sort key columns in priority order.
+        :param descending:
+            Sort in descending order if |True|.
+            A sequence specifies the order for each column.
+        :param nulls:
+            Position of |None| and NaN values: ``"first"`` or ``"last"``.
+        :param limit:
+            Number of rows to keep from the top of the sorted rows.
+            The top rows are selected with a heap without sorting all of the rows.
+        :raises ValueError:
+            If a column does not exist or does not have converted values,
+            or ``descending``, ``nulls`` or ``limit`` is invalid.
+
+        :Sample Code:
+            .. code:: python
+
+                from tabledata import TableData
+
+                tabledata = TableData("sample", ["a", "b"], [[2, "x"], [None, "y"], [1, "z"]])
+                print(tabledata.sort_by("a", descending=True).value_matrix)
+
+        :Output:
+            .. code-block:: none
+
+                [[2, 'x'], [1, 'z'], [None, 'y']]
+        """
+
+        from ._sort import NULLS_POSITIONS, make_key_column, sort_row_indices
+
+        if isinstance(columns, str):
+            columns = [columns]
+        if not columns:
+            raise ValueError("require at least one column to sort")
+
+        if isinstance(descending, bool):
+            descending_list = [descending] * len(columns)
+        else:
+            descending_list = list(descending)
+            if len(descending_list) != len(columns):
+                raise ValueError(
+                    f"columns and descending length mismatch: "
+                    f"{len(columns)} != {len(descending_list)}"
+                )
+
+        if nulls not in NULLS_POSITIONS:
+            raise ValueError(f"nulls must be one of {NULLS_POSITIONS}: actual={nulls}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must be a non-negative integer: actual={limit}")
+
+        value_matrix = self.value_matrix
+        col_idx_list = [get_matrix_column_index(self, column, value_matrix) for column in columns]
+        typecodes = get_column_typecodes(self)
+        key_columns = [
+            make_key_column(
+                [row[col_idx] for row in value_matrix], typecodes[col_idx], is_descending, nulls
+            )
+            for col_idx, is_descending in zip(col_idx_list, descending_list)
+        ]
+
+        tabledata = self.__take_rows(sort_row_indices(key_columns, descending_list, limit))
+        if limit is None or limit >= len(value_matrix):
+            # the same set of values
+            tabledata.__column_stats = self.__column_stats
+
+        return tabledata
+
+    def group_by(self, keys: Union[str, Sequence[str]]) -> "GroupBy":
+        """
+        Group the rows by the values of key columns.
+        Rows that have equal key values belong to the same group:
+        |None| and NaN are also regarded as key values.
+        Aggregate the groups with :py:meth:`.GroupBy.agg`.
+
+        :param keys: Header names of the key columns.
+        :return: Grouped rows of the instance.
+        :rtype: GroupBy
+        :raises ValueError: If a key column does not exist.
+        """
+
+        from ._group_by import GroupBy
+
+        if isinstance(keys, str):
+            keys = [keys]
+
+        return GroupBy(self, keys)
+
+    def drop_duplicates(
+        self, subset: Union[str, Sequence[str], None] = None, keep: str = "first"
+    ) -> "TableData":
+        """
+        Create a table data that does not have duplicated rows.
+        Rows are compared by hashing the converted values: NaN values are regarded as
+        equal to each other. Rows are processed in a single pass that keeps only
+        the hashes of unique rows.
+        The new instance keeps the converted data of the instance, thus column types
+        are not inferred again.
+
+        :param subset:
+            Header names of the columns to compare. Compare all of the columns if |None|.
+        :param keep: Which of the duplicated rows to keep: ``"first"`` or ``"last"``.
+        :raises ValueError:
+            If a column does not exist or does not have converted values,
+            or ``keep`` is invalid.
+
+        :Sample Code:
+            .. code:: python
+
+                from tabledata import TableData
+
+                tabledata = TableData("sample", ["a", "b"], [[1, "x"], [2, "y"], [1, "z"]])
+                print(tabledata.drop_duplicates("a", keep="last").value_matrix)
+
+        :Output:
+            .. code-block:: none
+
+                [[2, 'y'], [1, 'z']]
+        """
+
+        if keep not in ("first", "last"):
+            raise ValueError(f"keep must be either 'first' or 'last': actual={keep}")
+
+        value_matrix = self.value_matrix
+
+        if subset is None:
+            col_idx_list = list(range(get_matrix_num_columns(self, value_matrix)))
+        else:
+            col_idx_list = [
+                get_matrix_column_index(self, column, value_matrix)
+                for column in ([subset] if isinstance(subset, str) else subset)
+            ]
+
+        row_idx_iter: Iterable[int] = range(len(value_matrix))
+        if keep == "last":
+            row_idx_iter = reversed(row_idx_iter)  # type: ignore
+
+        seen: set[tuple] = set()
+        row_idx_list = []
+
+        for row_idx in row_idx_iter:
+            row = value_matrix[row_idx]
+            key = tuple(to_hash_key(row[col_idx]) for col_idx in col_idx_list)
+
+            if key in seen:
+                continue
+
+            seen.add(key)
+            row_idx_list.append(row_idx)
+
+        if keep == "last":
+            row_idx_list.reverse()
+
+        if len(row_idx_list) == len(value_matrix):
+            return self.rename(self.table_name)
+
+        return self.__take_rows(row_idx_list)
+
+    def page(self, index: int, size: int = 50) -> "TableData":
+        """
+        Create a table data of a window of the rows.
+        Only the rows of the window are converted when the converted data of the page
+        is accessed, unless the instance is already converted.
+        Recently used pages are cached up to :py:attr:`.page_cache_size` pages.
+
+        The pages share the column properties (:py:attr:`.column_dp_list`) so that
+        pages are rendered with consistent column types, widths and alignments.
+        The shared column properties are determined from the whole table if it is
+        already converted. Otherwise, from evenly spaced
+        :py:attr:`.page_sample_size` rows, and widened with the values of each page
+        when the column properties of the page are accessed: values of a page are
+        not formatted as narrower types of the sample, while pages accessed earlier
+        may have narrower column properties than later ones.
+
+        :param index: Zero-based index of the page.
+        :param size: Number of rows per page.
+        :return: Rows of the page. Empty if the page is out of the rows.
+        :rtype: TableData
+        :raises ValueError: If ``index`` is negative or ``size`` is not positive.
+
+        :Sample Code:
+            .. code:: python
+
+                from tabledata import TableData
+
+                tabledata = TableData("sample", ["a"], [[i] for i in range(1000)])
+                print(tabledata.page(2, size=3).value_matrix)
+
+        :Output:
+            .. code-block:: none
+
+                [[6], [7], [8]]
+        """
+
+        if index < 0:
+            raise ValueError(f"index must be a non-negative integer: actual={index}")
+        if size <= 0:
+            raise ValueError(f"size must be a positive integer: actual={size}")
+
+        # the LRU order is updated even by cache hits
+        with self.__lock:
+            page_cache = self.__page_cache
+            cache_key = (index, size)
+
+            try:
+                page = page_cache[cache_key]
+            except KeyError:
+                pass
+            else:
+                page_cache.move_to_end(cache_key)
+                return page
+
+            num_rows = len(self.__rows)
+            start = min(index * size, num_rows)
+            page = self.__take_rows(range(start, min(start + size, num_rows)))
+            page.__shared_column_dp_list = self.__get_page_column_dp_list()
+            page.__shared_column_dp_lock = self.__lock
+
+            if self.page_cache_size > 0:
+                page_cache[cache_key] = page
+                while len(page_cache) > self.page_cache_size:
+                    page_cache.popitem(last=False)
+
+            return page
+
+    def rename(
+        self, table_name: Optional[str], headers: Optional[Sequence[str]] = None
+    ) -> "TableData":
+        """
+        Create a table data that has a new table name and new headers.
+        The new instance shares the rows and the converted data
+        (:py:attr:`.value_matrix`, :py:attr:`.value_dp_matrix` and
+        :py:meth:`.column_stats`) of the instance
+        without copying.
+
+        :param table_name: Table name of the new instance.
+        :param headers:
+            Headers of the new instance. Keep the current headers if |None|.
+        :raises ValueError: If the number of headers is changed.
+        """
+
+        if headers is None:
+            headers = self.headers
+        elif self.headers and len(headers) != len(self.headers):
+            raise ValueError(
+                f"headers length mismatch: expected={len(self.headers)}, actual={len(headers)}"
+            )
+
+        schema = self.__schema
+        if schema is not None and list(headers) != schema.headers:
+            schema = Schema(headers, schema.type_hints, sample_size=schema.sample_size)
+
+        tabledata = TableData(
+            table_name,
+            headers,
+            self.__rows,
+            dp_extractor=self.extractor_config,
+            type_hints=self.__type_hints,
+            max_workers=self.__max_workers,
+            schema_cache=self.__schema_cache,
+            schema=schema,
+            float_type=self.__float_type,
+            conversion_mode=self.__conversion_mode,
+        )
+        tabledata.__is_custom_dp_extractor = self.__is_custom_dp_extractor
+        tabledata.__value_matrix = self.__value_matrix
+        tabledata.__value_dp_matrix = self.__value_dp_matrix
+        tabledata.__column_stats = self.__column_stats
+        tabledata.__instrument = self.__instrument
+        tabledata.pickle_caches = self.pickle_caches
+
+        return tabledata
+
+    @staticmethod
+    def concat(
+        tables: Sequence["TableData"], table_name: Optional[str] = None, lazy: bool = False
+    ) -> "TableData":
+        """
+        Concatenate the rows of tables.
+        The headers are merged in the order of appearance, and missing columns of
+        a table are filled with |None|. The column types of the tables are unified
+        with widening rules (e.g. integer and real number columns become
+        a real number column), and are used as a trusted |Schema| of the new instance.
+        Converted data of the tables are reused: only the tables that are not
+        converted yet are converted, and the concatenated table is not type inferred again.
+
+        :param tables: Tables to concatenate.
+        :param table_name:
+            Table name of the new instance. Defaults to the table name of the first table.
+        :param lazy:
+            If |True|, the rows of the new instance are a read-only view that chains
+            the converted data of the tables without copying.
+            The view keeps referencing the data of the tables.
+        :raises ValueError:
+            If ``tables`` is empty, or a table that has rows does not have headers.
+
+        :Sample Code:
+            .. code:: python
+
+                from tabledata import TableData
+
+                tabledata = TableData.concat(
+                    [
+                        TableData("shard", ["a", "b"], [[1, "x"]]),
+                        TableData("shard", ["a", "c"], [[2.5, True]]),
+                    ]
+                )
+                print(tabledata.headers)
+                print(tabledata.value_matrix)
+
+        :Output:
+            .. code-block:: none
+
+                ['a', 'b', 'c']
+                [[1, 'x', None], [Decimal('2.5'), None, True]]
+        """
+
+        from ._concat import ChainedRows, make_column_map, merge_headers, widen_type_hints
+
+        if not tables:
+            raise ValueError("require at least one table to concatenate")
+
+        headers = merge_headers(tables)
+        schema = Schema(headers, widen_type_hints(tables, headers))
+        column_maps = [make_column_map(headers, table.headers) for table in tables]
+
+        value_matrix: Sequence = ChainedRows([table.value_matrix for table in tables], column_maps)
+        value_dp_matrix: Optional[Sequence] = None
+        if all(table.has_value_dp_matrix for table in tables):
+            from dataproperty import DataProperty
+
+            value_dp_matrix = ChainedRows(
+                [table.value_dp_matrix for table in tables],
+                column_maps,
+                null_value=DataProperty(None),
+            )
+
+        if not lazy:
+            value_matrix = list(value_matrix)
+            if value_dp_matrix is not None:
+                value_dp_matrix = list(value_dp_matrix)
+
+        first_table = tables[0]
+        tabledata = TableData(
+            first_table.table_name if table_name is None else table_name,
+            headers,
+            value_matrix,
+            max_workers=first_table.__max_workers,
+            schema=schema,
+            float_type=first_table.__float_type,
+            conversion_mode=first_table.__conversion_mode,
+        )
+        if value_matrix:
+            tabledata.__value_matrix = value_matrix  # type: ignore
+        tabledata.__value_dp_matrix = value_dp_matrix  # type: ignore
+
+        return tabledata
+
     @staticmethod
     def from_dataframe(
         dataframe: "pandas.DataFrame",
         table_name: str = "",
-        type_hints: Optional[Sequence[TypeHint]] = None,
+        type_hints: Optional[Sequence["TypeHint"]] = None,
         max_workers: Optional[int] = None,
     ) -> "TableData":
         """
@@ -503,6 +1502,292 @@ class TableData:
             max_workers=max_workers,
         )
 
+    def dump(self, file_path: str) -> None:
+        """
+        Write the table data to a file in a binary format.
+        The file stores converted values per column together with the resolved
+        column types, thus :py:meth:`.load` can skip type inference.
+        Written files can be read column by column with |BinaryTableReader|.
+        Columns of mixed types are stored as strings with type tags: files do not
+        contain pickled data, thus loading a file never unpickles it.
+
+        :param str file_path: Output file path.
+        """
+
+        from ._storage import dump_tabledata
+
+        dump_tabledata(self, file_path)
+
+    @staticmethod
+    def load(file_path: str) -> "TableData":
+        """
+        Load a table data from a file written by :py:meth:`.dump`.
+
+        :param str file_path: Input file path.
+        :raises tabledata.DataError: If the file is not a valid binary table file.
+        """
+
+        from ._storage import load_tabledata
+
+        return load_tabledata(file_path)
+
+    def __emit_phase(
+        self,
+        instrument: Instrument,
+        phase: Phase,
+        operation: str,
+        start: float,
+        matrix: Sequence[Sequence[Any]],
+        cache_hit: bool = False,
+    ) -> None:
+        num_rows = len(matrix)
+
+        emit_phase(
+            instrument,
+            phase,
+            operation,
+            self.table_name,
+            start,
+            num_rows=num_rows,
+            num_cells=num_rows * (self.num_columns or 0),
+            cache_hit=cache_hit,
+        )
+
+    def __compute_column_stats(self) -> list["ColumnStats"]:
+        from ._column_stats import ColumnStats
+
+        if self.__value_matrix or (self.__schema is not None and self.__value_dp_matrix is None):
+            # typed values are available without building DataProperty instances
+            columns: Iterator[Sequence[Any]] = zip(*self.value_matrix)
+        else:
+            columns = (
+                [value_dp.data for value_dp in value_dp_list]
+                for value_dp_list in zip(*self.value_dp_matrix)
+            )
+
+        column_stats_list = []
+        for values in columns:
+            column_stats = ColumnStats()
+            column_stats.update(values)
+            column_stats_list.append(column_stats)
+
+        if not column_stats_list:
+            column_stats_list = [ColumnStats() for _ in range(self.num_columns or 0)]
+
+        return column_stats_list
+
+    def __is_trusted_format_values(self) -> bool:
+        """
+        :return:
+            |True| if the column properties can be built from the values selected
+            with the column types of the trusted schema.
+        """
+
+        if self.__schema is None or self.__value_dp_matrix is not None:
+            return False
+
+        value_matrix = self.value_matrix
+        num_columns = len(self.headers)
+
+        return bool(value_matrix) and all(len(row) == num_columns for row in value_matrix)
+
+    def __to_format_dp_matrix(self) -> "DataPropertyMatrix":
+        """
+        Convert only the values that determine the column properties of a table with
+        a trusted schema. Columns are padded with their first values to make a matrix.
+        """
+
+        from ._parallel import to_dp_list
+        from ._schema import select_format_values
+
+        assert self.__schema is not None
+
+        dp_extractor = self.dp_extractor
+        dp_lists = [
+            to_dp_list(dp_extractor, col_idx, select_format_values(values, type_hint))
+            for col_idx, (values, type_hint) in enumerate(
+                zip(zip(*self.value_matrix), self.__schema.type_hints)
+            )
+        ]
+        num_rows = max(len(dp_list) for dp_list in dp_lists)
+
+        return list(
+            zip(*(dp_list + [dp_list[0]] * (num_rows - len(dp_list)) for dp_list in dp_lists))
+        )  # type: ignore
+
+    def __widen_shared_column_dp_list(self) -> None:
+        assert self.__shared_column_dp_list is not None
+        assert self.__shared_column_dp_lock is not None
+
+        # values of the page may have wider types than the sampled rows
+        column_dp_list = self.dp_extractor.to_column_dp_list(self.value_dp_matrix)
+
+        with self.__shared_column_dp_lock:
+            if self.__is_shared_column_dp_list_widened:
+                return
+
+            for shared_col_dp, col_dp in zip(self.__shared_column_dp_list, column_dp_list):
+                shared_col_dp.merge(col_dp)
+
+            self.__is_shared_column_dp_list_widened = True
+
+    def __get_page_column_dp_list(self) -> list["dp.ColumnDataProperty"]:
+        if self.__page_column_dp_list is None:
+            if self.__value_dp_matrix is not None:
+                self.__page_column_dp_list = self.column_dp_list
+            else:
+                sample = self.__take_rows(
+                    get_sample_row_indices(len(self.__rows), self.page_sample_size)
+                )
+                self.__page_column_dp_list = sample.column_dp_list
+
+        return self.__page_column_dp_list
+
+    def __to_original_float_value_matrix(
+        self, value_dp_matrix: "DataPropertyMatrix"
+    ) -> list[list[Any]]:
+        from typepy import Typecode
+
+        real_number_typecodes = (Typecode.REAL_NUMBER, Typecode.INFINITY, Typecode.NAN)
+
+        return [
+            [
+                value
+                if value_dp.typecode in real_number_typecodes
+                and isinstance(value, (float, Decimal))
+                else value_dp.data
+                for value_dp, value in zip(value_dp_list, row)
+            ]
+            for value_dp_list, row in zip(value_dp_matrix, to_value_matrix(self.headers, self.rows))
+        ]
+
+    def __take_rows(self, row_idx_list: Sequence[int]) -> "TableData":
+        """
+        Create a table data that has the rows of the indices. The converted data
+        of the instance is reused for the new instance.
+        """
+
+        tabledata = self.rename(self.table_name)
+        tabledata.__rows = [self.__rows[row_idx] for row_idx in row_idx_list]
+        if self.__value_matrix:
+            tabledata.__value_matrix = [self.__value_matrix[row_idx] for row_idx in row_idx_list]
+        if self.__value_dp_matrix is not None:
+            tabledata.__value_dp_matrix = [
+                self.__value_dp_matrix[row_idx] for row_idx in row_idx_list
+            ]
+        tabledata.__column_stats = None
+
+        return tabledata
+
+    def __is_rows_value_matrix(self, value_matrix: Sequence[Sequence[Any]]) -> bool:
+        """
+        :return:
+            |True| if the rows are lists of the same values of the same types
+            as the converted values.
+        """
+
+        rows = self.rows
+        if len(rows) != len(value_matrix):
+            return False
+
+        for row, values in zip(rows, value_matrix):
+            if type(row) is not list or len(row) != len(values):
+                return False
+
+            for value, converted_value in zip(row, values):
+                if type(value) is not type(converted_value) or value != converted_value:
+                    return False
+
+        return True
+
+    def __is_aligned_value_matrix(self) -> bool:
+        value_matrix = self.value_matrix
+        if not value_matrix:
+            return True
+
+        num_columns = len(self.headers) if self.headers else len(value_matrix[0])
+
+        return all(len(values) == num_columns for values in value_matrix)
+
+    def __to_dp_matrix(
+        self, dp_extractor: "dp.DataPropertyExtractor", value_matrix: Sequence[Any]
+    ) -> "DataPropertyMatrix":
+        from ._parallel import to_dp_matrix
+
+        return to_dp_matrix(dp_extractor, value_matrix, self.__conversion_mode, self.__max_workers)
+
+    def __to_dp_matrix_with_schema_cache(self, value_matrix: list[Any]) -> "DataPropertyMatrix":
+        assert self.__schema_cache is not None
+
+        schema_cache = self.__schema_cache
+        dp_extractor = self.dp_extractor
+        type_hints = schema_cache.get(self.table_name, self.headers)
+
+        if type_hints is not None:
+            # values are converted with type hints even if they are lossy (e.g. 1.5 -> 1):
+            # the cached types are verified with the types inferred from sampled rows
+            row_idx_list = get_sample_row_indices(len(value_matrix), schema_cache.sample_size)
+            sample_extractor = copy.copy(dp_extractor)
+            sample_extractor.column_type_hints = []
+            sample_dp_matrix = self.__to_dp_matrix(
+                sample_extractor, [value_matrix[row_idx] for row_idx in row_idx_list]
+            )
+
+            if self.__is_match_type_hints(sample_extractor, sample_dp_matrix, type_hints):
+                dp_extractor.column_type_hints = type_hints
+
+                if len(row_idx_list) == len(value_matrix):
+                    # the sample is the whole rows
+                    return sample_dp_matrix
+
+                return self.__to_dp_matrix(dp_extractor, value_matrix)
+
+            if logger_state.is_enabled:
+                logger.debug(f"schema cache mismatch: table={self.table_name}")
+            schema_cache.add_mismatch()
+
+            return self.__to_dp_matrix(dp_extractor, value_matrix)
+
+        value_dp_matrix = self.__to_dp_matrix(dp_extractor, value_matrix)
+        schema_cache.put(
+            self.table_name,
+            self.headers,
+            extract_column_type_hints(
+                dp_extractor.to_column_dp_list(value_dp_matrix), value_dp_matrix
+            ),
+        )
+
+        return value_dp_matrix
+
+    @staticmethod
+    def __is_match_type_hints(
+        sample_extractor: "dp.DataPropertyExtractor",
+        sample_dp_matrix: "DataPropertyMatrix",
+        type_hints: Sequence["TypeHint"],
+    ) -> bool:
+        """
+        :return:
+            |True| if the types inferred from the sampled rows are the same as
+            the type hints. Columns without type hints, and columns that have only
+            null values in the sampled rows, are not compared.
+        """
+
+        from typepy import Typecode
+
+        sample_column_dp_list = sample_extractor.to_column_dp_list(sample_dp_matrix)
+        sample_type_hints = extract_column_type_hints(sample_column_dp_list, sample_dp_matrix)
+
+        for type_hint, sample_type_hint, col_dp in zip(
+            type_hints, sample_type_hints, sample_column_dp_list
+        ):
+            if type_hint is None or col_dp.typecode == Typecode.NONE:
+                continue
+
+            if sample_type_hint != type_hint:
+                return False
+
+        return True
+
     @staticmethod
     def __is_match(header: str, pattern: str, is_re_match: bool) -> bool:
         if is_re_match:
@@ -0,0 +1,208 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import copy
+from collections.abc import Sequence
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+import dataproperty as dp
+from dataproperty import Preprocessor
+from dataproperty.typing import TypeHint
+
+
+# public settings of DataPropertyExtractor that extractors created from the same snapshot share.
+# table-specific settings (headers, column_type_hints, max_workers and float_type)
+# are set by ExtractorConfig.new_extractor and excluded.
+_SHARED_SETTING_NAMES = (
+    "default_type_hint",
+    "is_formatting_float",
+    "max_precision",
+    "preprocessor",
+    "strip_str_header",
+    "min_column_width",
+    "default_format_flags",
+    "format_flags_list",
+    "datetime_format_str",
+    "strict_level_map",
+    "east_asian_ambiguous_width",
+    "type_value_map",
+    "quoting_flags",
+    "datetime_formatter",
+    "matrix_formatting",
+)
+
+# settings that DataPropertyExtractor updates in place
+# (set_type_value, update_preprocessor, update_strict_level_map, etc.)
+_MUTABLE_SETTING_NAMES = (
+    "preprocessor",
+    "format_flags_list",
+    "strict_level_map",
+    "type_value_map",
+    "quoting_flags",
+)
+
+# DataPropertyExtractor provides no public getter for the functions registered by
+# register_trans_func. the attribute is read with a guard:
+# extractors are treated as different from the snapshot if the attribute is missing.
+_TRANS_FUNC_LIST_ATTR = "_DataPropertyExtractor__trans_func_list"
+
+
+def _is_same_setting(lhs: Any, rhs: Any) -> bool:
+    if lhs == rhs:
+        return True
+
+    # settings objects such as Preprocessor do not define the equality
+    if type(lhs) is not type(rhs) or not hasattr(lhs, "__dict__"):
+        return False
+
+    return vars(lhs) == vars(rhs)
+
+
+class ExtractorConfig:
+    """
+    Immutable snapshot of a ``DataPropertyExtractor`` configuration.
+    An instance can be shared by any number of |TableData| instances without copying:
+    each |TableData| creates a private extractor from the snapshot only when
+    the extractor is actually needed.
+
+    :param dp_extractor:
+        Extractor to take the snapshot from.
+        Changes to the extractor after the snapshot are not reflected.
+    :param max_precision:
+        Maximum precision of the default extractor.
+        Used only when ``dp_extractor`` is |None|.
+
+    :Sample Code:
+        .. code:: python
+
+            from dataproperty import DataPropertyExtractor
+            from tabledata import ExtractorConfig, TableData
+
+            dp_extractor = DataPropertyExtractor()
+            dp_extractor.max_precision = 2
+            config = ExtractorConfig(dp_extractor)
+
+            tables = [
+                TableData(f"table{i}", ["a", "b"], [[i, 1.2345]], dp_extractor=config)
+                for i in range(10000)
+            ]
+    """
+
+    def __init__(
+        self,
+        dp_extractor: Optional[dp.DataPropertyExtractor] = None,
+        max_precision: Optional[int] = None,
+    ) -> None:
+        if dp_extractor:
+            template = copy.deepcopy(dp_extractor)
+        else:
+            template = dp.DataPropertyExtractor(max_precision=max_precision)
+
+        template.strip_str_header = '"'
+
+        self.__template = template
+
+    @property
+    def headers(self) -> Sequence[str]:
+        return self.__template.headers
+
+    @property
+    def column_type_hints(self) -> list[TypeHint]:
+        return list(self.__template.column_type_hints)
+
+    @property
+    def max_workers(self) -> int:
+        return self.__template.max_workers
+
+    @property
+    def max_precision(self) -> int:
+        return self.__template.max_precision
+
+    @property
+    def float_type(self) -> Union[type[float], type[Decimal], None]:
+        return self.__template.float_type
+
+    def resolve_max_workers(self, max_workers: Optional[int]) -> int:
+        """
+        :return: The number of workers that an extractor actually uses for ``max_workers``.
+        """
+
+        if not max_workers:
+            return self.max_workers
+
+        extractor = copy.copy(self.__template)
+        extractor.max_workers = max_workers
+
+        return extractor.max_workers
+
+    def is_source_of(self, extractor: dp.DataPropertyExtractor) -> bool:
+        """
+        :return:
+            |True| if the extractor has the same settings as the snapshot
+            except for the table-specific settings that :py:meth:`new_extractor` sets
+            (headers, type hints, the number of workers and the float type).
+        """
+
+        template = self.__template
+
+        for name in _SHARED_SETTING_NAMES:
+            if not _is_same_setting(getattr(extractor, name), getattr(template, name)):
+                return False
+
+        template_trans_funcs = getattr(template, _TRANS_FUNC_LIST_ATTR, None)
+        if template_trans_funcs is None:
+            return False
+
+        return getattr(extractor, _TRANS_FUNC_LIST_ATTR, None) == template_trans_funcs
+
+    def new_extractor(
+        self,
+        headers: Sequence[str],
+        type_hints: Optional[Sequence[Union[str, TypeHint]]] = None,
+        max_workers: Optional[int] = None,
+        float_type: Union[type[float], type[Decimal], None] = None,
+    ) -> dp.DataPropertyExtractor:
+        """
+        Create a private extractor from the snapshot with table-specific settings.
+        The snapshot is cloned shallowly: containers that an extractor may update
+        in place are copied, and immutable objects such as cached
+        ``DataProperty`` instances are shared.
+        The snapshot is deep-copied instead if the shallow clone still shares
+        in-place updatable settings with the snapshot.
+        """
+
+        template = self.__template
+        extractor = copy.copy(template)
+        attrs = vars(extractor)
+        for key, value in attrs.items():
+            if isinstance(value, (dict, list, Preprocessor)):
+                attrs[key] = copy.copy(value)
+
+        if any(
+            getattr(extractor, name) is getattr(template, name) for name in _MUTABLE_SETTING_NAMES
+        ):
+            # the shallow clone failed to separate the in-place updatable settings
+            # from the snapshot: fall back to the full copy
+            extractor = copy.deepcopy(template)
+
+        if type_hints:
+            extractor.column_type_hints = type_hints
+
+        if max_workers:
+            extractor.max_workers = max_workers
+
+        if float_type is not None:
+            extractor.float_type = float_type
+
+        if list(extractor.headers) != list(headers):
+            extractor.headers = headers
+
+        return extractor
+
+
+@lru_cache(maxsize=8)
+def get_default_extractor_config(max_precision: Optional[int] = None) -> ExtractorConfig:
+    return ExtractorConfig(max_precision=max_precision)
@@ -0,0 +1,313 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import abc
+from collections.abc import Callable, Mapping, Sequence
+from decimal import Decimal
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from ._common import get_column_typecodes, get_matrix_column_index, to_hash_key
+from ._sort import make_value_key_func
+
+
+if TYPE_CHECKING:
+    from dataproperty.typing import TypeHint
+
+    from ._core import TableData
+
+
+class _Aggregator(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def update(self, value: Any) -> None:  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def result(self) -> Any:  # pragma: no cover
+        pass
+
+
+class _Count(_Aggregator):
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def update(self, value: Any) -> None:
+        self.count += 1
+
+    def result(self) -> Any:
+        return self.count
+
+
+def _add(lhs: Any, rhs: Any) -> Any:
+    try:
+        return lhs + rhs
+    except TypeError:
+        if not isinstance(lhs, (float, Decimal)) or not isinstance(rhs, (float, Decimal)):
+            raise
+
+    # float and Decimal values of a column with FloatType.ORIGINAL
+    return Decimal(str(lhs)) + Decimal(str(rhs))
+
+
+class _Sum(_Aggregator):
+    __slots__ = ("total",)
+
+    def __init__(self) -> None:
+        self.total: Any = 0
+
+    def update(self, value: Any) -> None:
+        self.total = _add(self.total, value)
+
+    def result(self) -> Any:
+        return self.total
+
+
+class _Mean(_Aggregator):
+    __slots__ = ("total", "count")
+
+    def __init__(self) -> None:
+        self.total: Any = 0
+        self.count = 0
+
+    def update(self, value: Any) -> None:
+        self.total = _add(self.total, value)
+        self.count += 1
+
+    def result(self) -> Any:
+        if self.count == 0:
+            return None
+
+        if isinstance(self.total, int):
+            # keep the precision as real numbers converted by DataProperty
+            return Decimal(self.total) / self.count
+
+        return self.total / self.count
+
+
+class _Min(_Aggregator):
+    __slots__ = ("value", "key", "to_key")
+
+    def __init__(self, to_key: Callable[[Any], tuple]) -> None:
+        self.value: Any = None
+        self.key: Any = None
+        self.to_key = to_key
+
+    def update(self, value: Any) -> None:
+        key = self.to_key(value)
+        if self.key is None or key < self.key:
+            self.value = value
+            self.key = key
+
+    def result(self) -> Any:
+        return self.value
+
+
+class _Max(_Min):
+    __slots__ = ()
+
+    def update(self, value: Any) -> None:
+        key = self.to_key(value)
+        if self.key is None or key > self.key:
+            self.value = value
+            self.key = key
+
+
+class _First(_Aggregator):
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: Any = None
+
+    def update(self, value: Any) -> None:
+        if self.value is None:
+            self.value = value
+
+    def result(self) -> Any:
+        return self.value
+
+
+AGGREGATOR_CLASS_MAP: dict[str, type[_Aggregator]] = {
+    "count": _Count,
+    "sum": _Sum,
+    "mean": _Mean,
+    "min": _Min,
+    "max": _Max,
+    "first": _First,
+}
+NUMERIC_AGGREGATIONS = ("sum", "mean")
+ORDERED_AGGREGATIONS = ("min", "max")
+
+
+def _resolve_type_hint(agg_name: str, type_hint: "TypeHint") -> "TypeHint":
+    from typepy import Integer, RealNumber
+
+    if agg_name == "count":
+        return Integer
+    if agg_name == "mean":
+        return RealNumber
+    if agg_name == "sum":
+        if type_hint is None:
+            return None
+
+        return Integer if type_hint == Integer else RealNumber
+
+    # min/max/first: values of the input column
+    return type_hint
+
+
+class GroupBy:
+    """
+    Rows of a |TableData| instance grouped by key columns.
+    Created by :py:meth:`.TableData.group_by`.
+    """
+
+    def __init__(self, tabledata: "TableData", keys: Sequence[str]) -> None:
+        self.__tabledata = tabledata
+        self.__keys = list(keys)
+
+        # raise an error for a missing key column without converting the values
+        for key in self.__keys:
+            tabledata.get_column_index(key)
+
+    @property
+    def keys(self) -> list[str]:
+        """list[str]: Header names of the key columns."""
+
+        return self.__keys
+
+    def agg(self, aggregations: Mapping[str, Union[str, Sequence[str]]]) -> "TableData":
+        """
+        Aggregate the values of each group with hash aggregation in a single pass.
+        |None| and NaN values are excluded from the aggregations.
+
+        :param aggregations:
+            Mapping of a header name to an aggregation name or a list of aggregation names.
+            Available aggregations are
+            ``"count"`` (number of non-null values), ``"sum"``, ``"mean"``,
+            ``"min"``, ``"max"`` and ``"first"`` (first non-null value).
+            ``"sum"`` and ``"mean"`` require numeric columns.
+        :return:
+            A table data that has a row for each group in the order of appearance.
+            The columns are the key columns followed by ``<header>_<aggregation>``
+            columns. Column types are derived from the input column types, thus
+            the values are not type inferred again.
+        :rtype: TableData
+        :raises ValueError:
+            If a column does not exist or does not have converted values,
+            an aggregation is unknown or
+            is not applicable to the column type, or values of a column cannot be aggregated.
+
+        :Sample Code:
+            .. code:: python
+
+                from tabledata import TableData
+
+                tabledata = TableData(
+                    "sample", ["k", "v"], [["a", 1], ["b", 2], ["a", 3], ["b", None]]
+                )
+                result = tabledata.group_by("k").agg({"v": ["count", "sum", "mean"]})
+                print(result.headers)
+                print(result.value_matrix)
+
+        :Output:
+            .. code-block:: none
+
+                ['k', 'v_count', 'v_sum', 'v_mean']
+                [['a', 2, 4, Decimal('2')], ['b', 1, 2, Decimal('2')]]
+        """
+
+        from typepy import Typecode
+
+        from ._core import TableData
+        from ._schema import Schema
+
+        tabledata = self.__tabledata
+        value_matrix = tabledata.value_matrix
+        key_col_idx_list = [
+            get_matrix_column_index(tabledata, key, value_matrix) for key in self.__keys
+        ]
+        input_type_hints = tabledata.schema.type_hints
+        input_typecodes = get_column_typecodes(tabledata)
+        numeric_typecodes = (Typecode.INTEGER, Typecode.REAL_NUMBER, Typecode.INFINITY)
+
+        headers = list(self.__keys)
+        type_hints: list[Optional["TypeHint"]] = [
+            input_type_hints[col_idx] for col_idx in key_col_idx_list
+        ]
+        agg_specs: list[tuple[int, Callable[[], _Aggregator]]] = []
+
+        for column, agg_names in aggregations.items():
+            col_idx = get_matrix_column_index(tabledata, column, value_matrix)
+            type_hint = input_type_hints[col_idx]
+            typecode = input_typecodes[col_idx]
+
+            for agg_name in [agg_names] if isinstance(agg_names, str) else agg_names:
+                try:
+                    aggregator_class = AGGREGATOR_CLASS_MAP[agg_name]
+                except KeyError:
+                    raise ValueError(
+                        f"unknown aggregation: expected={list(AGGREGATOR_CLASS_MAP)}, "
+                        f"actual={agg_name}"
+                    ) from None
+
+                if (
+                    agg_name in NUMERIC_AGGREGATIONS
+                    and typecode is not None
+                    and typecode not in numeric_typecodes
+                ):
+                    raise ValueError(
+                        f"'{agg_name}' requires a numeric column: "
+                        f"column={column}, type={typecode.name}"
+                    )
+
+                new_aggregator: Callable[[], _Aggregator] = aggregator_class
+                if agg_name in ORDERED_AGGREGATIONS:
+                    # compare mixed values of the column as the sort does
+                    new_aggregator = partial(aggregator_class, make_value_key_func(typecode))
+
+                headers.append(f"{column}_{agg_name}")
+                type_hints.append(_resolve_type_hint(agg_name, type_hint))
+                agg_specs.append((col_idx, new_aggregator))
+
+        group_map: dict[tuple, tuple[list[Any], list[_Aggregator]]] = {}
+
+        for row in value_matrix:
+            key_values = [row[col_idx] for col_idx in key_col_idx_list]
+            group_key = tuple(to_hash_key(value) for value in key_values)
+
+            try:
+                _, aggregators = group_map[group_key]
+            except KeyError:
+                aggregators = [new_aggregator() for _, new_aggregator in agg_specs]
+                group_map[group_key] = (key_values, aggregators)
+
+            for (col_idx, _), aggregator in zip(agg_specs, aggregators):
+                value = row[col_idx]
+                if value is None or value != value:
+                    continue
+
+                try:
+                    aggregator.update(value)
+                except TypeError as e:
+                    raise ValueError(
+                        f"failed to aggregate: column={tabledata.headers[col_idx]}, "
+                        f"value={value!r}: {e}"
+                    ) from e
+
+        return TableData(
+            tabledata.table_name,
+            headers,
+            [
+                key_values + [aggregator.result() for aggregator in aggregators]
+                for key_values, aggregators in group_map.values()
+            ],
+            max_workers=tabledata.max_workers,
+            schema=Schema(headers, type_hints),
+            float_type=tabledata.float_type,
+            conversion_mode=tabledata.conversion_mode,
+        )
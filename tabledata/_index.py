@@ -0,0 +1,91 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from ._common import to_hash_key
+
+
+class RowIndex:
+    """
+    Hash index of rows by the values of a key column.
+    Created by :py:meth:`.TableData.create_index`.
+    Keys are compared with the converted values of the key column
+    (e.g. an ``int`` key for an integer column). NaN keys are equal to each other.
+    """
+
+    def __init__(self, column: str, value_matrix: Sequence[Sequence[Any]], col_idx: int) -> None:
+        self.__column = column
+        self.__value_matrix = value_matrix
+        self.__row_idx_map: dict[Any, int] = {}
+        # row indices of the keys that appear more than once
+        self.__duplicate_row_idx_map: dict[Any, list[int]] = {}
+
+        row_idx_map = self.__row_idx_map
+        for row_idx, row in enumerate(value_matrix):
+            key = to_hash_key(row[col_idx])
+
+            if key not in row_idx_map:
+                row_idx_map[key] = row_idx
+                continue
+
+            try:
+                self.__duplicate_row_idx_map[key].append(row_idx)
+            except KeyError:
+                self.__duplicate_row_idx_map[key] = [row_idx]
+
+    def __len__(self) -> int:
+        return len(self.__row_idx_map)
+
+    def __contains__(self, key: Any) -> bool:
+        return to_hash_key(key) in self.__row_idx_map
+
+    def __repr__(self) -> str:
+        return f"RowIndex(column={self.column}, keys={len(self)})"
+
+    @property
+    def column(self) -> str:
+        """str: Header name of the key column."""
+
+        return self.__column
+
+    @property
+    def is_unique(self) -> bool:
+        """bool: |True| if every key appears only once."""
+
+        return not self.__duplicate_row_idx_map
+
+    def get_row_index(self, key: Any) -> Optional[int]:
+        """
+        :return: Index of the first row that has the key. |None| if not found.
+        """
+
+        return self.__row_idx_map.get(to_hash_key(key))
+
+    def lookup(self, key: Any) -> Optional[Sequence[Any]]:
+        """
+        :return: The first row that has the key. |None| if not found.
+        """
+
+        row_idx = self.__row_idx_map.get(to_hash_key(key))
+        if row_idx is None:
+            return None
+
+        return self.__value_matrix[row_idx]
+
+    def lookup_all(self, key: Any) -> list[Sequence[Any]]:
+        """
+        :return: All of the rows that have the key in the order of the rows.
+        """
+
+        key = to_hash_key(key)
+        row_idx = self.__row_idx_map.get(key)
+        if row_idx is None:
+            return []
+
+        return [
+            self.__value_matrix[row_idx]
+            for row_idx in [row_idx] + self.__duplicate_row_idx_map.get(key, [])
+        ]
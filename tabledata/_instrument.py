@@ -0,0 +1,196 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+from ._constant import Phase
+
+
+class PhaseEvent(NamedTuple):
+    """
+    Measurement of a processing phase of a |TableData| instance.
+    """
+
+    #: Processing phase.
+    phase: Phase
+
+    #: Name of the operation that ran the phase (e.g. ``"value_dp_matrix"``, ``"as_dict"``).
+    operation: str
+
+    #: Table name of the instance.
+    table_name: Optional[str]
+
+    #: Start time of the phase in seconds since the epoch.
+    start_time: float
+
+    #: Duration of the phase in seconds.
+    duration: float
+
+    #: Number of rows processed by the phase.
+    num_rows: int
+
+    #: Number of cells processed by the phase.
+    num_cells: int
+
+    #: |True| if the phase was served from a cache.
+    cache_hit: bool
+
+
+Instrument = Callable[[PhaseEvent], None]
+
+global_instrument: Optional[Instrument] = None
+
+
+def set_instrument(instrument: Optional[Instrument]) -> None:
+    """
+    Set an instrument that is called with a :py:class:`~.PhaseEvent` for each processing
+    phase of all of the |TableData| instances that do not have their own instrument.
+    Phases are not measured while no instrument is set.
+
+    :param instrument:
+        Callable that receives :py:class:`~.PhaseEvent` instances
+        (e.g. a :py:class:`~.PhaseStats` instance). |None| to disable.
+    """
+
+    global global_instrument
+
+    global_instrument = instrument
+
+
+def get_instrument() -> Optional[Instrument]:
+    return global_instrument
+
+
+def emit_phase(
+    instrument: Instrument,
+    phase: Phase,
+    operation: str,
+    table_name: Optional[str],
+    start: float,
+    num_rows: int,
+    num_cells: int,
+    cache_hit: bool = False,
+) -> None:
+    """
+    :param start: Start time of the phase taken with ``time.perf_counter``.
+    """
+
+    duration = time.perf_counter() - start
+
+    instrument(
+        PhaseEvent(
+            phase=phase,
+            operation=operation,
+            table_name=table_name,
+            start_time=time.time() - duration,
+            duration=duration,
+            num_rows=num_rows,
+            num_cells=num_cells,
+            cache_hit=cache_hit,
+        )
+    )
+
+
+class PhaseStat:
+    """
+    Aggregated measurements of a phase.
+    """
+
+    def __init__(self) -> None:
+        #: Number of the measurements.
+        self.count = 0
+
+        #: Total duration in seconds.
+        self.duration = 0.0
+
+        #: Total number of the processed rows.
+        self.num_rows = 0
+
+        #: Total number of the processed cells.
+        self.num_cells = 0
+
+        #: Number of the measurements that were served from a cache.
+        self.cache_hits = 0
+
+        #: Number of the measurements that were not served from a cache.
+        self.cache_misses = 0
+
+    def __repr__(self) -> str:
+        return ", ".join(
+            [
+                f"count={self.count}",
+                f"duration={self.duration:.6f}",
+                f"rows={self.num_rows}",
+                f"cells={self.num_cells}",
+                f"cache_hits={self.cache_hits}",
+                f"cache_misses={self.cache_misses}",
+            ]
+        )
+
+    def update(self, event: PhaseEvent) -> None:
+        self.count += 1
+        self.duration += event.duration
+        self.num_rows += event.num_rows
+        self.num_cells += event.num_cells
+
+        if event.cache_hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+
+class PhaseStats:
+    """
+    Instrument that aggregates :py:class:`~.PhaseEvent` instances per phase.
+
+    :Sample Code:
+        .. code:: python
+
+            from tabledata import Phase, PhaseStats, TableData
+
+            stats = PhaseStats()
+            tabledata = TableData("sample", ["a", "b"], [[1, 2], [3, 4]])
+            tabledata.instrument = stats
+
+            tabledata.as_dict()
+            print(stats[Phase.TO_DP_MATRIX])
+    """
+
+    def __init__(self) -> None:
+        self.__stat_map: dict[Phase, PhaseStat] = {}
+        self.__lock = threading.Lock()
+
+    def __call__(self, event: PhaseEvent) -> None:
+        with self.__lock:
+            try:
+                stat = self.__stat_map[event.phase]
+            except KeyError:
+                stat = self.__stat_map[event.phase] = PhaseStat()
+
+            stat.update(event)
+
+    def __getitem__(self, phase: Phase) -> PhaseStat:
+        """
+        :return: Aggregated measurements of the phase.
+        """
+
+        with self.__lock:
+            return self.__stat_map.get(phase, PhaseStat())
+
+    def __repr__(self) -> str:
+        with self.__lock:
+            return "\n".join(f"{phase.value}: {stat}" for phase, stat in self.__stat_map.items())
+
+    @property
+    def phases(self) -> list[Phase]:
+        """list[Phase]: Phases that have measurements."""
+
+        with self.__lock:
+            return list(self.__stat_map)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__stat_map.clear()
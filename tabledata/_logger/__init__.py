@@ -1,4 +1,4 @@
-from ._logger import logger, set_logger  # type: ignore
+from ._logger import logger, logger_state, log_row_diagnostics, set_logger  # type: ignore
 
 
-__all__ = ("logger", "set_logger")
+__all__ = ("logger", "logger_state", "log_row_diagnostics", "set_logger")
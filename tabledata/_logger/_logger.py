@@ -3,32 +3,92 @@
 """
 
 import warnings
-from typing import Final
-
-import dataproperty
+from collections.abc import Sequence
+from typing import Any, Callable, Final
 
 from ._null_logger import NullLogger  # type: ignore
 
 
 MODULE_NAME: Final = "tabledata"
 
-try:
-    from loguru import logger
+#: Maximum number of per-row diagnostic messages logged by a single operation.
+MAX_ROW_DIAGNOSTICS: Final = 10
+
+
+class LazyLogger:
+    """
+    Logger that imports ``loguru`` at the first use.
+    Falls back to a null logger if ``loguru`` is not installed.
+    """
+
+    def __init__(self) -> None:
+        self.__backend: Any = None
+
+    @property
+    def backend(self) -> Any:
+        if self.__backend is None:
+            try:
+                from loguru import logger
+
+                logger.disable(MODULE_NAME)
+            except ImportError:
+                logger = NullLogger()
+
+            self.__backend = logger
+
+        return self.__backend
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.backend, name)
+
+
+logger: Any = LazyLogger()
+
+
+class LoggerState:
+    """
+    Logging state that is checked before building log messages:
+    call sites guard debug logging with ``if logger_state.is_enabled:``,
+    so that disabled logging costs one flag check.
+    The state is changed only by :py:func:`set_logger`, not by the enabling state
+    of the ``loguru`` logger.
+    """
+
+    def __init__(self) -> None:
+        self.is_enabled = False
 
-    logger.disable(MODULE_NAME)
-except ImportError:
-    logger = NullLogger()
+
+logger_state = LoggerState()
 
 
 def set_logger(is_enable: bool, propagation_depth: int = 1) -> None:
+    """
+    Enable/disable logging of the package.
+    Messages are built and passed to the logger only while logging is enabled
+    by this function. Logging is always disabled with the null logger
+    that is used when ``loguru`` is not installed.
+
+    .. note::
+        Enabling the package only through ``loguru`` (``logger.enable("tabledata")``)
+        does not log messages of the package: debug messages are guarded by a flag
+        of the package that is set by this function, so that disabled logging costs
+        a flag check.
+    """
+
+    backend = logger.backend if isinstance(logger, LazyLogger) else logger
+
     if is_enable:
-        logger.enable(MODULE_NAME)
+        backend.enable(MODULE_NAME)
     else:
-        logger.disable(MODULE_NAME)
+        backend.disable(MODULE_NAME)
+
+    logger_state.is_enabled = is_enable and not isinstance(backend, NullLogger)
 
     if propagation_depth <= 0:
         return
 
+    import dataproperty
+
     dataproperty.set_logger(is_enable, propagation_depth - 1)
 
 
@@ -38,3 +98,27 @@ def set_log_level(log_level):  # type: ignore
         DeprecationWarning,
     )
     return
+
+
+def log_row_diagnostics(
+    row_idx_list: Sequence[int],
+    make_message: Callable[[int], str],
+    max_count: int = MAX_ROW_DIAGNOSTICS,
+) -> None:
+    """
+    Log debug messages for at most ``max_count`` rows, and a summary for the rest.
+    Messages are built only if logging is enabled.
+
+    :param row_idx_list: Indices of the rows to log.
+    :param make_message: Callable that builds a message for a row index.
+    """
+
+    if not logger_state.is_enabled:
+        return
+
+    for row_idx in row_idx_list[:max_count]:
+        logger.debug(make_message(row_idx))
+
+    num_omitted = len(row_idx_list) - max_count
+    if num_omitted > 0:
+        logger.debug(f"... and {num_omitted} more rows")
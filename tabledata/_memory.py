@@ -0,0 +1,197 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import enum
+import sys
+import types
+from collections.abc import Sequence
+from typing import Any, Optional
+
+
+_STATIC_TYPES = (type, types.FunctionType, types.BuiltinFunctionType, types.ModuleType, enum.Enum)
+
+
+def _iter_slot_values(obj: Any) -> list[Any]:
+    values = []
+
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if slot.startswith("__") and not slot.endswith("__"):
+                slot = "_{}{}".format(cls.__name__.lstrip("_"), slot)
+
+            try:
+                values.append(getattr(obj, slot))
+            except AttributeError:
+                pass
+
+    return values
+
+
+def _is_static(obj: Any) -> bool:
+    return obj is None or obj is True or obj is False or isinstance(obj, _STATIC_TYPES)
+
+
+def sizeof(obj: Any, seen: set[int]) -> int:
+    """
+    Return the size of an object without the objects referenced by it.
+    """
+
+    if _is_static(obj) or id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+
+    return sys.getsizeof(obj)
+
+
+def deep_sizeof(obj: Any, seen: set[int]) -> int:
+    """
+    Return the size of an object and the objects that are referenced by it.
+    Objects that are already in ``seen`` are not counted,
+    nor are singletons such as |None|, booleans, enum members and types.
+    """
+
+    if _is_static(obj) or id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, (str, bytes, int, float)):
+        return size
+
+    if isinstance(obj, dict):
+        return size + sum(
+            deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items()
+        )
+
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(deep_sizeof(item, seen) for item in obj)
+
+    if hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), seen)
+
+    return size + sum(deep_sizeof(value, seen) for value in _iter_slot_values(obj))
+
+
+class MemoryUsage:
+    """
+    Memory usage of a |TableData| instance returned by :py:meth:`.TableData.memory_usage`.
+
+    Usage is reported per layer and per column.
+    Layers are the original ``rows`` and the caches of the converted data:
+    ``value_matrix`` and ``value_dp_matrix``. Caches that are not computed yet use zero bytes.
+
+    Each layer consists of per-column cell usage and
+    the usage of the row containers (the outer list and the row objects).
+    An object that is referenced by multiple layers
+    (e.g. a value shared by ``rows`` and ``value_matrix``) is counted
+    only once, in the first layer.
+    """
+
+    LAYERS = ("rows", "value_matrix", "value_dp_matrix")
+
+    def __init__(
+        self,
+        headers: Sequence[str],
+        column_usage_map: dict[str, list[int]],
+        container_usage_map: dict[str, int],
+    ) -> None:
+        self.__headers = list(headers)
+        self.__column_usage_map = column_usage_map
+        self.__container_usage_map = container_usage_map
+
+    def __repr__(self) -> str:
+        return ", ".join(
+            [f"total={self.total}"]
+            + [f"{layer}={self.layer_usage(layer)}" for layer in self.LAYERS]
+        )
+
+    @property
+    def headers(self) -> list[str]:
+        return self.__headers
+
+    @property
+    def total(self) -> int:
+        """int: Total bytes of all of the layers."""
+
+        return sum(self.layer_usage(layer) for layer in self.LAYERS)
+
+    @property
+    def column_totals(self) -> list[int]:
+        """list[int]: Bytes of the cells of each column summed over the layers."""
+
+        return [sum(sizes) for sizes in zip(*self.__column_usage_map.values())]
+
+    def column_usage(self, layer: str) -> list[int]:
+        """
+        :param layer: One of :py:attr:`.LAYERS`.
+        :return: Bytes of the cells of each column in the layer.
+        """
+
+        return list(self.__column_usage_map[layer])
+
+    def container_usage(self, layer: str) -> int:
+        """
+        :param layer: One of :py:attr:`.LAYERS`.
+        :return: Bytes of the row containers of the layer.
+        """
+
+        return self.__container_usage_map[layer]
+
+    def layer_usage(self, layer: str) -> int:
+        """
+        :param layer: One of :py:attr:`.LAYERS`.
+        :return: Total bytes of the layer.
+        """
+
+        return sum(self.__column_usage_map[layer]) + self.__container_usage_map[layer]
+
+    def as_dict(self) -> dict[str, dict[str, int]]:
+        """
+        :return: Bytes of each column keyed by header, for each layer.
+        """
+
+        return {
+            layer: dict(zip(self.headers, self.__column_usage_map[layer])) for layer in self.LAYERS
+        }
+
+
+def measure_layer(
+    containers: Optional[Sequence[Any]],
+    cell_matrix: Optional[Sequence[Sequence[Any]]],
+    num_columns: int,
+    deep: bool,
+    seen: set[int],
+) -> tuple[list[int], int]:
+    """
+    :param containers: Outer sequence of the layer. |None| if the layer is not computed.
+    :param cell_matrix: Cells of the layer aligned with the columns.
+    :return: Bytes of each column and bytes of the containers.
+    """
+
+    column_usage = [0] * num_columns
+
+    if containers is None or cell_matrix is None:
+        return (column_usage, 0)
+
+    if id(containers) in seen:
+        # the layer is shared with another layer
+        return (column_usage, 0)
+
+    seen.add(id(containers))
+    container_usage = sys.getsizeof(containers)
+
+    for row in containers:
+        if id(row) not in seen:
+            seen.add(id(row))
+            container_usage += sys.getsizeof(row)
+
+    measure = deep_sizeof if deep else sizeof
+
+    for cells in cell_matrix:
+        for col_idx, value in enumerate(cells[:num_columns]):
+            column_usage[col_idx] += measure(value, seen)
+
+    return (column_usage, container_usage)
@@ -0,0 +1,129 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import copy
+import os
+import sys
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+from ._constant import ConversionMode
+
+
+if TYPE_CHECKING:
+    import dataproperty as dp
+    from dataproperty import DataPropertyMatrix
+
+
+#: Minimum number of rows of a matrix converted by multiple threads.
+MIN_PARALLEL_ROWS = 256
+
+
+def is_gil_enabled() -> bool:
+    """
+    :return: |False| if the interpreter runs without the GIL (free-threaded CPython).
+    """
+
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def resolve_conversion_mode(mode: ConversionMode) -> ConversionMode:
+    """
+    :return: The conversion mode that is actually used for ``mode``.
+    """
+
+    if mode != ConversionMode.AUTO:
+        return mode
+
+    if is_gil_enabled():
+        return ConversionMode.PROCESS
+
+    return ConversionMode.THREAD
+
+
+def resolve_num_threads(max_workers: Optional[int]) -> int:
+    if max_workers:
+        return max_workers
+
+    return os.cpu_count() or 1
+
+
+def _new_serial_extractor(dp_extractor: "dp.DataPropertyExtractor") -> "dp.DataPropertyExtractor":
+    extractor = copy.copy(dp_extractor)
+    extractor.max_workers = 1
+
+    return extractor
+
+
+def _is_aligned(dp_extractor: "dp.DataPropertyExtractor", value_matrix: Sequence[Any]) -> bool:
+    """
+    :return: |True| if the extractor converts the rows without padding or trimming them.
+    """
+
+    col_size_set = {len(row) for row in value_matrix}
+    if len(col_size_set) != 1:
+        return False
+
+    return not dp_extractor.headers or col_size_set == {len(dp_extractor.headers)}
+
+
+def to_dp_list(
+    dp_extractor: "dp.DataPropertyExtractor", col_idx: int, values: Sequence[Any]
+) -> list["dp.DataProperty"]:
+    """
+    Convert the values of a column with the extractor.
+    A single column extractor infers the types of the column exactly as the whole matrix.
+    """
+
+    extractor = _new_serial_extractor(dp_extractor)
+    extractor.headers = []
+    try:
+        extractor.column_type_hints = [dp_extractor.column_type_hints[col_idx]]
+    except IndexError:
+        extractor.column_type_hints = []
+
+    return [dp_list[0] for dp_list in extractor.to_dp_matrix([[value] for value in values])]
+
+
+def to_dp_matrix(
+    dp_extractor: "dp.DataPropertyExtractor",
+    value_matrix: Sequence[Sequence[Any]],
+    mode: ConversionMode,
+    max_workers: Optional[int],
+) -> "DataPropertyMatrix":
+    """
+    Convert the values with the extractor in the conversion mode.
+
+    ``THREAD`` converts columns in parallel with a thread pool, each column with its own
+    copy of the extractor. Columns are the unit of the work because the type inference
+    of a cell depends on the preceding cells of the column: the results are the same as
+    the serial conversion. Rows that have different lengths than the headers and matrices
+    that have too few rows or columns are converted serially.
+    The number of threads is ``max_workers``, or the number of CPUs if |None|.
+    ``PROCESS`` uses the column-parallel conversion of the extractor, which is
+    serial if ``max_workers`` of the extractor is ``1``.
+    """
+
+    mode = resolve_conversion_mode(mode)
+
+    if mode == ConversionMode.PROCESS:
+        return dp_extractor.to_dp_matrix(value_matrix)
+
+    if mode == ConversionMode.THREAD and len(value_matrix) >= MIN_PARALLEL_ROWS:
+        num_threads = min(resolve_num_threads(max_workers), len(value_matrix[0]))
+
+        if num_threads > 1 and _is_aligned(dp_extractor, value_matrix):
+            from concurrent import futures
+
+            with futures.ThreadPoolExecutor(num_threads) as executor:
+                dp_lists = list(
+                    executor.map(
+                        lambda col_item: to_dp_list(dp_extractor, *col_item),
+                        enumerate(zip(*value_matrix)),
+                    )
+                )
+
+            return list(zip(*dp_lists))  # type: ignore
+
+    return _new_serial_extractor(dp_extractor).to_dp_matrix(value_matrix)
@@ -0,0 +1,174 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Union
+
+from .error import DataError
+
+
+if TYPE_CHECKING:
+    from dataproperty.typing import TypeHint
+
+    from ._core import TableData
+
+
+class Schema:
+    """
+    Column names and column types of a table.
+    A |TableData| instance created with a schema trusts the schema:
+    values are expected to be already typed Python values (e.g. |int|, |float|,
+    |str|, ``datetime``), and are used without per-cell type inference and validation.
+
+    :param headers: Column names.
+    :param type_hints:
+        Column types. |None| for a column means that the column type is unknown.
+    :param sample_size:
+        Number of rows to spot-check against the column types
+        when the values are converted. ``0`` disables the check.
+
+    :Sample Code:
+        .. code:: python
+
+            from typepy import Integer, RealNumber, String
+            from tabledata import Schema, TableData
+
+            schema = Schema(["id", "score", "name"], [Integer, RealNumber, String], sample_size=10)
+            tabledata = TableData("sample", [], [[1, 0.5, "a"], [2, 0.25, "b"]], schema=schema)
+    """
+
+    def __init__(
+        self,
+        headers: Sequence[str],
+        type_hints: Sequence[Union[str, "TypeHint"]],
+        sample_size: int = 0,
+    ) -> None:
+        from dataproperty.typing import normalize_type_hint
+
+        if len(headers) != len(type_hints):
+            raise ValueError(
+                f"headers and type_hints length mismatch: {len(headers)} != {len(type_hints)}"
+            )
+
+        self.__headers = list(headers)
+        self.__type_hints = [normalize_type_hint(type_hint) for type_hint in type_hints]
+        self.__sample_size = sample_size
+
+    def __repr__(self) -> str:
+        return "Schema({})".format(
+            ", ".join(
+                f"{header}={type_hint.__name__ if type_hint else None}"
+                for header, type_hint in zip(self.headers, self.type_hints)
+            )
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Schema):
+            return False
+
+        return self.headers == other.headers and self.type_hints == other.type_hints
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    @property
+    def headers(self) -> list[str]:
+        return self.__headers
+
+    @property
+    def type_hints(self) -> list["TypeHint"]:
+        return self.__type_hints
+
+    @property
+    def sample_size(self) -> int:
+        return self.__sample_size
+
+    @classmethod
+    def from_tabledata(cls, tabledata: "TableData", sample_size: int = 0) -> "Schema":
+        """
+        Create a schema from the column types of a converted table.
+        Columns with mixed cell types get |None| as the column type.
+        """
+
+        from ._common import extract_column_type_hints
+
+        return cls(
+            tabledata.headers,
+            extract_column_type_hints(tabledata.column_dp_list, tabledata.value_dp_matrix),
+            sample_size=sample_size,
+        )
+
+    def spot_check(self, value_matrix: Sequence[Sequence[Any]]) -> None:
+        """
+        Check values of evenly spaced :py:attr:`.sample_size` rows against the column types.
+
+        :raises tabledata.DataError: If a non-null value does not match the column type.
+        """
+
+        from typepy import StrictLevel
+
+        if self.sample_size <= 0 or not value_matrix:
+            return
+
+        num_rows = len(value_matrix)
+        step = max(num_rows // self.sample_size, 1)
+
+        for row_idx in range(0, num_rows, step)[: self.sample_size]:
+            for header, type_hint, value in zip(
+                self.headers, self.type_hints, value_matrix[row_idx]
+            ):
+                if type_hint is None or value is None:
+                    continue
+
+                if not type_hint(value, strict_level=StrictLevel.MAX).is_type():
+                    raise DataError(
+                        "value does not match the schema: "
+                        f"row={row_idx}, column={header}, type={type_hint.__name__}, "
+                        f"value={value!r}"
+                    )
+
+
+def _to_format_key(value: Any) -> tuple[type, Any]:
+    value_type = type(value)
+    if value_type in (str, int, bool):
+        return (value_type, value)
+
+    # equal values of the other types may have different representations
+    # (e.g. Decimal("1.0") and Decimal("1.00"), 0.0 and -0.0)
+    return (value_type, repr(value))
+
+
+def select_format_values(values: Sequence[Any], type_hint: "TypeHint") -> list[Any]:
+    """
+    Select the values of a column of a trusted schema that determine the column
+    properties (type, width, digits and bit length) of the column.
+
+    :return:
+        The minimum, maximum and smallest absolute values of |int| values of
+        integer columns, distinct values of the other typed columns,
+        and all of the values of columns without the column type.
+    """
+
+    from typepy import Integer
+
+    if type_hint is None:
+        # the type inference of a cell depends on the preceding cells of the column
+        return list(values)
+
+    non_null_values = [value for value in values if value is not None]
+    selected_values: list[Any]
+
+    if type_hint is Integer and all(type(value) is int for value in non_null_values):
+        selected_values = (
+            [min(non_null_values), max(non_null_values), min(non_null_values, key=abs)]
+            if non_null_values
+            else []
+        )
+    else:
+        selected_values = list({_to_format_key(value): value for value in non_null_values}.values())
+
+    if len(non_null_values) != len(values):
+        selected_values.append(None)
+
+    return selected_values
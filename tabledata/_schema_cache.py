@@ -0,0 +1,156 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Optional
+
+
+if TYPE_CHECKING:
+    from dataproperty.typing import TypeHint
+
+
+SchemaKey = tuple[Optional[str], tuple[str, ...]]
+
+
+class SchemaCache:
+    """
+    LRU cache of resolved column types keyed by a table name and headers.
+    |TableData| instances created with a cache infer the types of up to
+    ``sample_size`` evenly spaced rows, use the cached column types as type hints
+    if they are the same as the inferred types, and fall back to full type inference
+    otherwise (mismatch). Values of the rows that are not sampled are converted
+    with the type hints, which may be lossy (e.g. ``1.5`` to ``1`` for an integer column).
+    A mismatch does not replace the cached schema: call :py:meth:`.invalidate`
+    to discard a schema of tables whose types changed.
+
+    :param maxsize: Maximum number of schemas to keep.
+    :param sample_size: Number of rows sampled to verify a cached schema.
+
+    :Sample Code:
+        .. code:: python
+
+            from tabledata import SchemaCache, TableData
+
+            schema_cache = SchemaCache(maxsize=256)
+
+            for rows in reports:
+                tabledata = TableData("report", ["a", "b"], rows, schema_cache=schema_cache)
+                tabledata.value_dp_matrix
+
+            print(schema_cache.hits, schema_cache.misses)
+    """
+
+    def __init__(self, maxsize: int = 128, sample_size: int = 100) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be greater than zero: actual={maxsize}")
+        if sample_size <= 0:
+            raise ValueError(f"sample_size must be greater than zero: actual={sample_size}")
+
+        self.__maxsize = maxsize
+        self.__sample_size = sample_size
+        self.__schemas: OrderedDict[SchemaKey, list["TypeHint"]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__mismatches = 0
+
+    def __len__(self) -> int:
+        return len(self.__schemas)
+
+    def __repr__(self) -> str:
+        return ", ".join(
+            [
+                f"maxsize={self.maxsize}",
+                f"sample_size={self.sample_size}",
+                f"size={len(self)}",
+                f"hits={self.hits}",
+                f"misses={self.misses}",
+                f"mismatches={self.mismatches}",
+            ]
+        )
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    @property
+    def sample_size(self) -> int:
+        return self.__sample_size
+
+    @property
+    def hits(self) -> int:
+        """int: Number of lookups that found a schema."""
+
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """int: Number of lookups that did not find a schema."""
+
+        return self.__misses
+
+    @property
+    def mismatches(self) -> int:
+        """int: Number of cached schemas that did not match the data."""
+
+        return self.__mismatches
+
+    @staticmethod
+    def make_key(table_name: Optional[str], headers: Sequence[str]) -> SchemaKey:
+        return (table_name, tuple(headers))
+
+    def get(self, table_name: Optional[str], headers: Sequence[str]) -> Optional[list["TypeHint"]]:
+        """
+        :return: Cached column types. |None| if not found.
+        """
+
+        key = self.make_key(table_name, headers)
+
+        with self.__lock:
+            type_hints = self.__schemas.get(key)
+            if type_hints is None:
+                self.__misses += 1
+                return None
+
+            self.__schemas.move_to_end(key)
+            self.__hits += 1
+
+            return list(type_hints)
+
+    def put(
+        self, table_name: Optional[str], headers: Sequence[str], type_hints: Sequence["TypeHint"]
+    ) -> None:
+        key = self.make_key(table_name, headers)
+
+        with self.__lock:
+            self.__schemas[key] = list(type_hints)
+            self.__schemas.move_to_end(key)
+
+            while len(self.__schemas) > self.__maxsize:
+                self.__schemas.popitem(last=False)
+
+    def add_mismatch(self) -> None:
+        """
+        Count a cached schema that did not match the data.
+        """
+
+        with self.__lock:
+            self.__mismatches += 1
+
+    def invalidate(self, table_name: Optional[str], headers: Sequence[str]) -> None:
+        """
+        Discard a cached schema.
+        """
+
+        with self.__lock:
+            self.__schemas.pop(self.make_key(table_name, headers), None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__schemas.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__mismatches = 0
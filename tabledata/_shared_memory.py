@@ -0,0 +1,222 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import sys
+import threading
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from ._storage import Encoding, TableBuffer, serialize_tabledata
+
+
+if TYPE_CHECKING:
+    from ._core import TableData
+
+
+_attach_lock = threading.Lock()
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # prevent the resource tracker from unlinking the block when an attached
+    # process exits: the lifetime of the block is controlled by the owner.
+    # only the registration of the block by this thread is skipped: registrations
+    # by other threads during the attachment are passed to the tracker.
+    from multiprocessing import resource_tracker
+
+    thread_id = threading.get_ident()
+
+    def register(resource_name: str, rtype: str) -> None:
+        if (
+            rtype == "shared_memory"
+            and resource_name.lstrip("/") == name.lstrip("/")
+            and threading.get_ident() == thread_id
+        ):
+            return
+
+        original_register(resource_name, rtype)
+
+    with _attach_lock:
+        original_register = resource_tracker.register
+        resource_tracker.register = register  # type: ignore
+
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = original_register
+
+
+class SharedTableData:
+    """
+    Converted table data placed in a ``multiprocessing.shared_memory`` block.
+    The owner process creates the block with :py:meth:`.create`, and other processes
+    attach to it read-only with :py:meth:`.attach` without copying the data.
+    Instances are picklable: unpickling an instance attaches to the block.
+
+    The block uses the same layout as :py:meth:`.TableData.dump`:
+    ``int64``/``float64`` columns are stored as fixed-size arrays and
+    string columns are stored as offsets and UTF-8 encoded bytes.
+
+    Only the owner can :py:meth:`.unlink` the block. Exiting a ``with`` block
+    closes the instance, and also unlinks the block if the instance is the owner.
+
+    :Sample Code:
+        .. code:: python
+
+            from concurrent.futures import ProcessPoolExecutor
+            from tabledata import SharedTableData, TableData
+
+            def render(shared):
+                with shared:
+                    return shared.read_column("a")
+
+            tabledata = TableData("sample", ["a", "b"], [[1, "x"], [2, "y"]])
+
+            with SharedTableData.create(tabledata) as shared:
+                with ProcessPoolExecutor() as executor:
+                    print(list(executor.map(render, [shared] * 4)))
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, is_owner: bool) -> None:
+        self.__shm = shm
+        self.__is_owner = is_owner
+        self.__is_closed = False
+        self.__buffer = shm.buf.toreadonly()
+        self.__table_buffer = TableBuffer(self.__buffer)
+
+    @classmethod
+    def create(cls, tabledata: "TableData", name: Optional[str] = None) -> "SharedTableData":
+        """
+        Place the converted data of a |TableData| instance into a new shared memory block.
+
+        :param tabledata: Table data to share.
+        :param name: Name of the shared memory block. Generated if |None|.
+        :return: Owner instance of the shared memory block.
+        """
+
+        chunks = serialize_tabledata(tabledata)
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=max(sum(len(chunk) for chunk in chunks), 1)
+        )
+
+        offset = 0
+        for chunk in chunks:
+            shm.buf[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+
+        return cls(shm, is_owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTableData":
+        """
+        Attach to a shared memory block created by :py:meth:`.create`.
+
+        :param name: Name of the shared memory block.
+        """
+
+        return cls(_attach_shared_memory(name), is_owner=False)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (SharedTableData.attach, (self.name,))
+
+    def __enter__(self) -> "SharedTableData":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+        if self.__is_owner:
+            self.unlink()
+
+    @property
+    def name(self) -> str:
+        """str: Name of the shared memory block."""
+
+        return self.__shm.name
+
+    @property
+    def is_owner(self) -> bool:
+        return self.__is_owner
+
+    @property
+    def table_name(self) -> Optional[str]:
+        return self.__table_buffer.table_name
+
+    @property
+    def headers(self) -> list[str]:
+        return self.__table_buffer.headers
+
+    @property
+    def num_rows(self) -> int:
+        return self.__table_buffer.num_rows
+
+    def read_column(self, column: Union[int, str]) -> list[Any]:
+        """
+        :param column: Header name or index of the column to read.
+        :return: Converted values of the column.
+        """
+
+        return self.__table_buffer.read_column(column)
+
+    def column_buffer(self, column: Union[int, str]) -> memoryview:
+        """
+        :return:
+            Read-only zero-copy buffer of an ``int64``/``float64`` column.
+            The buffer must be released before closing the instance.
+        :raises TypeError: If the column is not a numeric column.
+        """
+
+        return self.__table_buffer.column_buffer(column)
+
+    def str_column_buffers(self, column: Union[int, str]) -> tuple[memoryview, memoryview]:
+        """
+        :return:
+            Read-only zero-copy buffers of a string column:
+            ``int64`` offsets (number of rows + 1) and UTF-8 encoded bytes.
+            The value of the ``i``-th row is ``data[offsets[i]:offsets[i + 1]]``.
+            The buffers must be released before closing the instance.
+        :raises TypeError: If the column is not a string column.
+        """
+
+        encoding = self.__table_buffer.column_info(column)["encoding"]
+        if encoding != Encoding.STR:
+            raise TypeError(f"column is not a string column: encoding={encoding}")
+
+        offsets, data = self.__table_buffer.column_blocks(column)[:2]
+
+        return (offsets.cast("q"), data)
+
+    def to_tabledata(self) -> "TableData":
+        """
+        :return: A |TableData| instance that holds a private copy of the shared data.
+        """
+
+        return self.__table_buffer.to_tabledata()
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block. The block itself is kept.
+        """
+
+        if self.__is_closed:
+            return
+
+        self.__table_buffer.release()
+        self.__buffer.release()
+        self.__shm.close()
+        self.__is_closed = True
+
+    def unlink(self) -> None:
+        """
+        Destroy the shared memory block.
+
+        :raises RuntimeError: If the instance is not the owner of the block.
+        """
+
+        if not self.__is_owner:
+            raise RuntimeError("only the owner can unlink a shared memory block")
+
+        self.__shm.unlink()
@@ -0,0 +1,119 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import heapq
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from decimal import Decimal
+from functools import cmp_to_key
+from typing import TYPE_CHECKING, Any, Optional
+
+
+if TYPE_CHECKING:
+    from typepy import Typecode
+
+
+NULLS_POSITIONS = ("first", "last")
+
+
+def _get_native_types(typecode: Optional["Typecode"]) -> tuple[type, ...]:
+    from typepy import Typecode
+
+    if typecode in (Typecode.INTEGER, Typecode.REAL_NUMBER, Typecode.INFINITY, Typecode.NAN):
+        return (int, float, Decimal)
+    if typecode == Typecode.BOOL:
+        return (bool,)
+    if typecode == Typecode.DATETIME:
+        return (datetime,)
+
+    return ()
+
+
+def make_value_key_func(typecode: Optional["Typecode"]) -> Callable[[Any], tuple]:
+    """
+    Make a function that returns the comparison key of a non-null value of a column.
+    Values of the column type are compared natively, and the other values are
+    compared as strings after them.
+    """
+
+    native_types = _get_native_types(typecode)
+    is_numeric = Decimal in native_types
+
+    def to_key(value: Any) -> tuple:
+        if isinstance(value, native_types) and not (is_numeric and isinstance(value, bool)):
+            return (0, value)
+
+        return (1, str(value))
+
+    return to_key
+
+
+def make_key_column(
+    values: Sequence[Any], typecode: Optional["Typecode"], descending: bool, nulls: str
+) -> list[tuple]:
+    """
+    Make sort keys of a column.
+    Values are compared with the keys of :py:func:`make_value_key_func`.
+    |None| and NaN values are regarded as nulls.
+    Null keys are placed so that nulls come ``nulls`` after sorting
+    with ``reverse=descending``.
+    """
+
+    to_key = make_value_key_func(typecode)
+    null_key = (0,) if (nulls == "first") != descending else (2,)
+    key_column = []
+
+    for value in values:
+        if value is None:
+            key_column.append(null_key)
+            continue
+
+        key = to_key(value)
+        if key[0] == 0 and value != value:
+            # NaN
+            key_column.append(null_key)
+        else:
+            key_column.append((1,) + key)
+
+    return key_column
+
+
+def sort_row_indices(
+    key_columns: Sequence[Sequence[tuple]], descending_list: Sequence[bool], limit: Optional[int]
+) -> list[int]:
+    """
+    Stable multi-key sort of row indices.
+    Only the top ``limit`` rows are selected with a heap if ``limit`` is specified.
+    """
+
+    num_rows = len(key_columns[0]) if key_columns else 0
+
+    if limit is None or limit >= num_rows:
+        row_idx_list = list(range(num_rows))
+
+        # least significant key first: each pass keeps the order of the previous passes
+        for key_column, descending in reversed(list(zip(key_columns, descending_list))):
+            row_idx_list.sort(key=key_column.__getitem__, reverse=descending)
+
+        return row_idx_list
+
+    if all(descending == descending_list[0] for descending in descending_list):
+        composite_keys = list(zip(*key_columns))
+        select = heapq.nlargest if descending_list[0] else heapq.nsmallest
+
+        return select(limit, range(num_rows), key=composite_keys.__getitem__)
+
+    def compare(lhs: int, rhs: int) -> int:
+        for key_column, descending in zip(key_columns, descending_list):
+            lhs_key = key_column[lhs]
+            rhs_key = key_column[rhs]
+
+            if lhs_key < rhs_key:
+                return 1 if descending else -1
+            if rhs_key < lhs_key:
+                return -1 if descending else 1
+
+        return 0
+
+    return heapq.nsmallest(limit, range(num_rows), key=cmp_to_key(compare))
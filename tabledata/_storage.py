@@ -0,0 +1,560 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import json
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Final, Optional, Union
+
+from ._common import extract_column_type_hints
+from .error import DataError
+
+
+if TYPE_CHECKING:
+    from ._core import TableData
+
+
+MAGIC: Final = b"TBLDATA\x00"
+FORMAT_VERSION: Final = 1
+ALIGNMENT: Final = 8
+
+# magic, format version, metadata offset, metadata length
+_HEADER_STRUCT: Final = struct.Struct("<8sQQQ")
+
+_INT64_MIN: Final = -(1 << 63)
+_INT64_MAX: Final = (1 << 63) - 1
+
+
+class Encoding:
+    INT64: Final = "int64"
+    FLOAT64: Final = "float64"
+    STR: Final = "str"
+    DECIMAL: Final = "decimal"
+
+    #: Values of mixed types as strings prefixed with a type tag.
+    TAGGED: Final = "tagged"
+
+    #: Values of mixed types pickled. Used only by in-memory pickling of |TableData|:
+    #: files never contain pickled data, thus loading a file does not unpickle it.
+    PICKLE: Final = "pickle"
+
+
+# type tags of TAGGED values
+_TAG_BOOL: Final = "b"
+_TAG_INT: Final = "i"
+_TAG_FLOAT: Final = "f"
+_TAG_DECIMAL: Final = "d"
+_TAG_STR: Final = "s"
+_TAG_DATETIME: Final = "t"
+_TAG_JSON: Final = "j"
+# values of the other types are stored as strings: restored by the column type hints
+_TAG_OTHER: Final = "o"
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _to_le_bytes(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def _from_le_bytes(typecode: str, buffer: Any) -> array:
+    values = array(typecode)
+    values.frombytes(buffer)
+    if sys.byteorder != "little":
+        values.byteswap()
+
+    return values
+
+
+def _detect_encoding(values: Sequence[Any], allow_pickle: bool) -> str:
+    value_types = {type(value) for value in values if value is not None}
+
+    if value_types == {int}:
+        if all(_INT64_MIN <= value <= _INT64_MAX for value in values if value is not None):
+            return Encoding.INT64
+    elif value_types == {float}:
+        return Encoding.FLOAT64
+    elif value_types == {str}:
+        return Encoding.STR
+    elif value_types == {Decimal}:
+        return Encoding.DECIMAL
+
+    return Encoding.PICKLE if allow_pickle else Encoding.TAGGED
+
+
+def _to_tagged_str(value: Any) -> str:
+    # bool is a subclass of int
+    if isinstance(value, bool):
+        return _TAG_BOOL + ("1" if value else "0")
+    if isinstance(value, int):
+        return _TAG_INT + str(value)
+    if isinstance(value, float):
+        return _TAG_FLOAT + repr(value)
+    if isinstance(value, Decimal):
+        return _TAG_DECIMAL + str(value)
+    if isinstance(value, str):
+        return _TAG_STR + value
+    if isinstance(value, datetime):
+        return _TAG_DATETIME + value.isoformat()
+    if isinstance(value, (list, dict)):
+        try:
+            return _TAG_JSON + json.dumps(value)
+        except (TypeError, ValueError):
+            pass
+
+    return _TAG_OTHER + str(value)
+
+
+def _from_tagged_str(tagged_value: str) -> Any:
+    tag, value = tagged_value[:1], tagged_value[1:]
+
+    if tag == _TAG_BOOL:
+        return value == "1"
+    if tag == _TAG_INT:
+        return int(value)
+    if tag == _TAG_FLOAT:
+        return float(value)
+    if tag == _TAG_DECIMAL:
+        return Decimal(value)
+    if tag in (_TAG_STR, _TAG_OTHER):
+        return value
+    if tag == _TAG_DATETIME:
+        return datetime.fromisoformat(value)
+    if tag == _TAG_JSON:
+        return json.loads(value)
+
+    raise DataError(f"unknown value type tag: {tag}")
+
+
+def _pack_str_values(values: Sequence[Optional[str]]) -> list[bytes]:
+    offsets = array("q", [0])
+    chunks = []
+    offset = 0
+
+    for value in values:
+        if value is not None:
+            chunk = value.encode("utf-8")
+            chunks.append(chunk)
+            offset += len(chunk)
+
+        offsets.append(offset)
+
+    return [_to_le_bytes(offsets), b"".join(chunks)]
+
+
+def is_lossy_column(encoding: str, values: Sequence[Any]) -> bool:
+    """
+    :return: |True| if some of the values are stored as strings by a ``TAGGED`` column.
+    """
+
+    if encoding != Encoding.TAGGED:
+        return False
+
+    return any(
+        _to_tagged_str(value).startswith(_TAG_OTHER) for value in values if value is not None
+    )
+
+
+def pack_column(values: Sequence[Any], allow_pickle: bool = False) -> tuple[str, list[bytes], bool]:
+    """
+    Encode a column of converted values into byte blocks.
+
+    :param allow_pickle:
+        Pickle columns of mixed types instead of storing the values with type tags.
+        Must be |False| for data that is stored to files.
+    :return: Tuple of the encoding name, encoded blocks and whether the column has nulls.
+    """
+
+    encoding = _detect_encoding(values, allow_pickle)
+    has_null = any(value is None for value in values)
+
+    if encoding == Encoding.INT64:
+        blocks = [_to_le_bytes(array("q", [0 if value is None else value for value in values]))]
+    elif encoding == Encoding.FLOAT64:
+        blocks = [_to_le_bytes(array("d", [0.0 if value is None else value for value in values]))]
+    elif encoding == Encoding.STR:
+        blocks = _pack_str_values(values)
+    elif encoding == Encoding.DECIMAL:
+        blocks = _pack_str_values([None if value is None else str(value) for value in values])
+    elif encoding == Encoding.TAGGED:
+        blocks = _pack_str_values(
+            [None if value is None else _to_tagged_str(value) for value in values]
+        )
+    else:
+        return (encoding, [pickle.dumps(list(values), protocol=pickle.HIGHEST_PROTOCOL)], False)
+
+    if has_null:
+        blocks.append(bytes(value is None for value in values))
+
+    return (encoding, blocks, has_null)
+
+
+def unpack_column(
+    encoding: str,
+    blocks: Sequence[memoryview],
+    num_rows: int,
+    has_null: bool,
+    allow_pickle: bool = False,
+) -> list[Any]:
+    """
+    Decode byte blocks created by :py:func:`pack_column` into a list of values.
+
+    :param allow_pickle: Decode pickled columns. Must be |False| for untrusted data.
+    :raises tabledata.DataError: If the encoding is unknown or not allowed.
+    """
+
+    if encoding == Encoding.PICKLE:
+        if not allow_pickle:
+            raise DataError("pickled columns are not loaded from untrusted data")
+
+        return pickle.loads(blocks[0])
+
+    if encoding == Encoding.INT64:
+        values: list[Any] = _from_le_bytes("q", blocks[0]).tolist()
+    elif encoding == Encoding.FLOAT64:
+        values = _from_le_bytes("d", blocks[0]).tolist()
+    elif encoding in (Encoding.STR, Encoding.DECIMAL, Encoding.TAGGED):
+        offsets = _from_le_bytes("q", blocks[0])
+        data = bytes(blocks[1])
+        values = [
+            data[offsets[row_idx] : offsets[row_idx + 1]].decode("utf-8")
+            for row_idx in range(num_rows)
+        ]
+    else:
+        raise DataError(f"unknown column encoding: {encoding}")
+
+    if has_null:
+        values = [None if is_null else value for value, is_null in zip(values, blocks[-1])]
+
+    if encoding == Encoding.DECIMAL:
+        values = [None if value is None else Decimal(value) for value in values]
+    elif encoding == Encoding.TAGGED:
+        values = [None if value is None else _from_tagged_str(value) for value in values]
+
+    return values
+
+
+def pack_tabledata(tabledata: "TableData") -> tuple[dict[str, Any], list[bytes]]:
+    """
+    Encode a |TableData| instance into metadata and column blocks.
+    Block offsets in the metadata are relative to the start of the data section.
+    """
+
+    headers = list(tabledata.headers)
+    value_matrix = tabledata.value_matrix
+    column_dp_list = tabledata.column_dp_list
+    type_hints = extract_column_type_hints(column_dp_list, tabledata.value_dp_matrix)
+    num_columns = len(headers) if headers else len(column_dp_list)
+    columns = list(zip(*value_matrix)) if value_matrix else [() for _ in range(num_columns)]
+
+    column_info_list = []
+    data_blocks: list[bytes] = []
+    offset = 0
+
+    for col_idx, values in enumerate(columns[:num_columns]):
+        encoding, blocks, has_null = pack_column(values)
+        block_ranges = []
+
+        for block in blocks:
+            block_ranges.append([offset, len(block)])
+            data_blocks.append(block)
+            padding = _align(len(block)) - len(block)
+            if padding:
+                data_blocks.append(b"\x00" * padding)
+            offset += len(block) + padding
+
+        try:
+            col_dp = column_dp_list[col_idx]
+            decimal_places = col_dp.decimal_places
+            type_hint = type_hints[col_idx]
+        except IndexError:
+            decimal_places = None
+            type_hint = None
+
+        column_info_list.append(
+            {
+                "encoding": encoding,
+                "blocks": block_ranges,
+                "has_null": has_null,
+                "is_lossy": is_lossy_column(encoding, values),
+                "type_hint": type_hint.__name__ if type_hint else None,
+                "decimal_places": decimal_places,
+            }
+        )
+
+    metadata = {
+        "table_name": tabledata.table_name,
+        "headers": headers,
+        "num_rows": len(value_matrix),
+        "max_precision": tabledata.dp_extractor.max_precision,
+        "columns": column_info_list,
+    }
+
+    return (metadata, data_blocks)
+
+
+def serialize_tabledata(tabledata: "TableData") -> list[bytes]:
+    """
+    Serialize a |TableData| instance into chunks of the binary table format:
+    a fixed size header, aligned column blocks and JSON metadata.
+    """
+
+    metadata, data_blocks = pack_tabledata(tabledata)
+    data_offset = _align(_HEADER_STRUCT.size)
+    data_size = sum(len(block) for block in data_blocks)
+    metadata_bytes = json.dumps(metadata).encode("utf-8")
+
+    return [
+        _HEADER_STRUCT.pack(
+            MAGIC, FORMAT_VERSION, data_offset + data_size, len(metadata_bytes)
+        ).ljust(data_offset, b"\x00"),
+        *data_blocks,
+        metadata_bytes,
+    ]
+
+
+class TableBuffer:
+    """
+    Read-only view of a binary table format stored in a buffer object
+    (``bytes``, ``mmap.mmap``, shared memory, etc.).
+    Columns are decoded on demand without reading the rest of the buffer.
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        self.__buffer = memoryview(buffer)
+
+        if len(self.__buffer) < _HEADER_STRUCT.size:
+            raise DataError("buffer too small to be a binary table")
+
+        magic, version, metadata_offset, metadata_len = _HEADER_STRUCT.unpack_from(self.__buffer)
+        if magic != MAGIC:
+            raise DataError("not a binary table: invalid magic number")
+        if version != FORMAT_VERSION:
+            raise DataError(f"unsupported binary table format version: {version}")
+
+        self.__data_offset = _align(_HEADER_STRUCT.size)
+        self.__metadata = json.loads(
+            bytes(self.__buffer[metadata_offset : metadata_offset + metadata_len])
+        )
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return self.__metadata
+
+    @property
+    def table_name(self) -> Optional[str]:
+        return self.__metadata["table_name"]
+
+    @property
+    def headers(self) -> list[str]:
+        return self.__metadata["headers"]
+
+    @property
+    def num_rows(self) -> int:
+        return self.__metadata["num_rows"]
+
+    @property
+    def num_columns(self) -> int:
+        return len(self.__metadata["columns"])
+
+    def to_column_index(self, column: Union[int, str]) -> int:
+        if isinstance(column, int):
+            if not 0 <= column < self.num_columns:
+                raise IndexError(f"column index out of range: {column}")
+
+            return column
+
+        try:
+            return self.headers.index(column)
+        except ValueError:
+            raise KeyError(f"column not found: {column}")
+
+    def column_info(self, column: Union[int, str]) -> dict[str, Any]:
+        return self.__metadata["columns"][self.to_column_index(column)]
+
+    def column_blocks(self, column: Union[int, str]) -> list[memoryview]:
+        info = self.column_info(column)
+
+        return [
+            self.__buffer[self.__data_offset + offset : self.__data_offset + offset + length]
+            for offset, length in info["blocks"]
+        ]
+
+    def read_column(self, column: Union[int, str]) -> list[Any]:
+        info = self.column_info(column)
+        blocks = self.column_blocks(column)
+
+        try:
+            return unpack_column(info["encoding"], blocks, self.num_rows, info["has_null"])
+        finally:
+            for block in blocks:
+                block.release()
+
+    def column_buffer(self, column: Union[int, str]) -> memoryview:
+        """
+        Return a zero-copy little-endian buffer of a numeric column.
+        Cells that are null hold zero.
+        """
+
+        info = self.column_info(column)
+        encoding = info["encoding"]
+
+        if encoding == Encoding.INT64:
+            return self.column_blocks(column)[0].cast("q")
+        if encoding == Encoding.FLOAT64:
+            return self.column_blocks(column)[0].cast("d")
+
+        raise TypeError(f"column is not numeric: encoding={encoding}")
+
+    def to_tabledata(self) -> "TableData":
+        import typepy
+
+        from ._core import TableData
+        from ._schema import Schema
+
+        columns = [self.read_column(col_idx) for col_idx in range(self.num_columns)]
+        type_hints = [
+            None if info["type_hint"] is None else getattr(typepy, info["type_hint"])
+            for info in self.__metadata["columns"]
+        ]
+
+        rows = [list(row) for row in zip(*columns)]
+
+        # values of lossy columns are restored from the strings by the type hints
+        is_lossy = any(info.get("is_lossy", False) for info in self.__metadata["columns"])
+
+        if is_lossy or len(self.headers) != len(type_hints):
+            return TableData(
+                self.table_name,
+                self.headers,
+                rows,
+                type_hints=type_hints,
+                max_precision=self.__metadata["max_precision"],
+            )
+
+        # values are already converted: trust the stored column types
+        return TableData(
+            self.table_name,
+            self.headers,
+            rows,
+            max_precision=self.__metadata["max_precision"],
+            schema=Schema(self.headers, type_hints),
+        )
+
+    def release(self) -> None:
+        self.__buffer.release()
+
+
+class BinaryTableReader:
+    """
+    Memory-mapped reader of a binary table file written by :py:meth:`.TableData.dump`.
+    Columns are read individually, so only the pages of the requested columns are loaded.
+
+    :param file_path: Path to the binary table file.
+
+    :Sample Code:
+        .. code:: python
+
+            from tabledata import BinaryTableReader
+
+            with BinaryTableReader("sample.tbl") as reader:
+                print(reader.headers)
+                print(reader.read_column("a"))
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.__file = open(file_path, "rb")
+
+        try:
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__table_buffer = TableBuffer(self.__mmap)
+        except Exception:
+            self.__file.close()
+            raise
+
+    def __enter__(self) -> "BinaryTableReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def table_name(self) -> Optional[str]:
+        return self.__table_buffer.table_name
+
+    @property
+    def headers(self) -> list[str]:
+        return self.__table_buffer.headers
+
+    @property
+    def num_rows(self) -> int:
+        return self.__table_buffer.num_rows
+
+    @property
+    def type_hints(self) -> list[Optional[str]]:
+        """list: Type hint names of the columns. |None| for mixed type columns."""
+
+        return [info["type_hint"] for info in self.__table_buffer.metadata["columns"]]
+
+    @property
+    def decimal_places(self) -> list[Optional[int]]:
+        """
+        list: Decimal places of the columns at the time of writing.
+        A table loaded from the file computes the same decimal places because
+        the values are stored without loss of precision.
+        """
+
+        return [info["decimal_places"] for info in self.__table_buffer.metadata["columns"]]
+
+    def read_column(self, column: Union[int, str]) -> list[Any]:
+        """
+        :param column: Header name or index of the column to read.
+        :return: Converted values of the column.
+        """
+
+        return self.__table_buffer.read_column(column)
+
+    def column_buffer(self, column: Union[int, str]) -> memoryview:
+        """
+        :return:
+            Zero-copy buffer of an ``int64``/``float64`` column.
+            The buffer must be released before closing the reader.
+        :raises TypeError: If the column is not a numeric column.
+        """
+
+        return self.__table_buffer.column_buffer(column)
+
+    def to_tabledata(self) -> "TableData":
+        return self.__table_buffer.to_tabledata()
+
+    def close(self) -> None:
+        if self.__file.closed:
+            return
+
+        self.__table_buffer.release()
+        self.__mmap.close()
+        self.__file.close()
+
+
+def dump_tabledata(tabledata: "TableData", file_path: str) -> None:
+    with open(file_path, "wb") as f:
+        for chunk in serialize_tabledata(tabledata):
+            f.write(chunk)
+
+
+def load_tabledata(file_path: str) -> "TableData":
+    with BinaryTableReader(file_path) as reader:
+        return reader.to_tabledata()
@@ -3,14 +3,18 @@
 """
 
 import abc
+import threading
 import warnings
-from collections.abc import Sequence
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple, Optional
 
 import typepy
 from dataproperty.typing import TypeHint
 
 from ._core import TableData
-from ._logger import logger  # type: ignore
+from ._logger import logger, logger_state  # type: ignore
 from .error import InvalidHeaderNameError, InvalidTableNameError
 
 
@@ -28,10 +32,92 @@ class TableDataNormalizerInterface(metaclass=abc.ABCMeta):
         pass
 
 
+class _HeaderCache:
+    """
+    Bounded LRU cache of normalized headers that is shared by the instances
+    of a normalizer class.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.__maxsize = maxsize
+        self.__headers: OrderedDict[tuple[type, Any], str] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__headers)
+
+    def get(self, header: Any) -> Optional[str]:
+        with self.__lock:
+            key = self.__to_key(header)
+            try:
+                new_header = self.__headers[key]
+            except (KeyError, TypeError):
+                return None
+
+            self.__headers.move_to_end(key)
+
+            return new_header
+
+    def put(self, header: Any, new_header: str) -> None:
+        with self.__lock:
+            key = self.__to_key(header)
+            try:
+                self.__headers[key] = new_header
+            except TypeError:
+                # unhashable header
+                return
+
+            self.__headers.move_to_end(key)
+
+            while len(self.__headers) > self.__maxsize:
+                self.__headers.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__headers.clear()
+
+    @staticmethod
+    def __to_key(header: Any) -> tuple[type, Any]:
+        # equal values of different types (e.g. 1, True and 1.0) are normalized differently
+        return (type(header), header)
+
+
+_header_cache_map: dict[type, _HeaderCache] = {}
+_header_cache_map_lock = threading.Lock()
+
+
+def _get_header_cache(normalizer_class: type, maxsize: int) -> _HeaderCache:
+    try:
+        return _header_cache_map[normalizer_class]
+    except KeyError:
+        pass
+
+    with _header_cache_map_lock:
+        return _header_cache_map.setdefault(normalizer_class, _HeaderCache(maxsize))
+
+
+def clear_header_cache() -> None:
+    """
+    Clear the normalized header caches of all of the normalizer classes.
+    """
+
+    with _header_cache_map_lock:
+        for header_cache in _header_cache_map.values():
+            header_cache.clear()
+
+
 class AbstractTableDataNormalizer(TableDataNormalizerInterface):
+    #: Maximum number of normalized headers cached per normalizer class.
+    #: The cache is keyed on preprocessed headers and shared across instances.
+    #: Disabled by default: set a positive number in a subclass whose header
+    #: validation/normalization does not depend on instance state.
+    #: An inherited cache is not used by a subclass that overrides the header methods
+    #: unless the subclass sets the attribute by itself.
+    header_cache_size = 0
+
     @property
     def _type_hints(self) -> list[TypeHint]:
-        return self._tabledata.dp_extractor.column_type_hints
+        return self._tabledata.type_hints
 
     def __init__(self, tabledata: TableData) -> None:
         self._tabledata = tabledata
@@ -58,15 +144,20 @@ class AbstractTableDataNormalizer(TableDataNormalizerInterface):
         :rtype: tabledata.TableData
         """
 
-        logger.debug(f"normalize: {type(self).__name__}")
+        if logger_state.is_enabled:
+            logger.debug(f"normalize: {type(self).__name__}")
 
         normalize_headers = self._normalize_headers()
 
+        if self.__is_preserve_data(normalize_headers):
+            # rows are not modified by the normalizer: share the converted data
+            return self._tabledata.rename(self.__normalize_table_name(), normalize_headers)
+
         return TableData(
             self.__normalize_table_name(),
             normalize_headers,
             self._normalize_rows(normalize_headers),
-            dp_extractor=self._tabledata.dp_extractor,
+            dp_extractor=self._tabledata.extractor_config,
             type_hints=self._type_hints,
             max_workers=self._tabledata.max_workers,
         )
@@ -160,25 +251,94 @@ class AbstractTableDataNormalizer(TableDataNormalizerInterface):
 
         return new_table_name
 
-    def _normalize_headers(self) -> list[str]:
-        new_header_list = []
+    def __is_preserve_data(self, normalize_headers: Sequence[str]) -> bool:
+        if type(self)._normalize_rows is not AbstractTableDataNormalizer._normalize_rows:
+            return False
+
+        if self._tabledata.headers and len(normalize_headers) != len(self._tabledata.headers):
+            return False
+
+        return self._type_hints == self._tabledata.type_hints
+
+    def __is_header_cache_enabled(self) -> bool:
+        if self.header_cache_size <= 0:
+            return False
+
+        normalizer_class = type(self)
+        owner_class = next(
+            klass for klass in normalizer_class.__mro__ if "header_cache_size" in vars(klass)
+        )
+
+        return all(
+            getattr(normalizer_class, method_name) is getattr(owner_class, method_name)
+            for method_name in ("_preprocess_header", "_validate_header", "_normalize_header")
+        )
+
+    def _validate_header_list(self, headers: Sequence[str]) -> list[bool]:
+        """
+        Validate headers in a batch.
+        Override this method in a subclass if the validation can be done
+        without raising exceptions.
+
+        :param headers: Preprocessed headers.
+        :return: Validation results of the headers.
+        """
 
-        for col_idx, header in enumerate(self._tabledata.headers):
-            header = self._preprocess_header(col_idx, header)
+        results = []
 
+        for header in headers:
             try:
                 self._validate_header(header)
-                new_header = header
+                results.append(True)
             except InvalidHeaderNameError:
+                results.append(False)
+
+        return results
+
+    def _normalize_headers(self) -> list[str]:
+        preprocessed_headers = [
+            self._preprocess_header(col_idx, header)
+            for col_idx, header in enumerate(self._tabledata.headers)
+        ]
+        header_cache = None
+        if self.__is_header_cache_enabled():
+            header_cache = _get_header_cache(type(self), self.header_cache_size)
+
+        new_header_list: list[Optional[str]] = []
+        uncached_col_indices = []
+
+        for col_idx, header in enumerate(preprocessed_headers):
+            new_header = header_cache.get(header) if header_cache is not None else None
+            if new_header is None:
+                uncached_col_indices.append(col_idx)
+
+            new_header_list.append(new_header)
+
+        if not uncached_col_indices:
+            return new_header_list  # type: ignore
+
+        uncached_headers = [preprocessed_headers[col_idx] for col_idx in uncached_col_indices]
+
+        for col_idx, header, is_valid in zip(
+            uncached_col_indices, uncached_headers, self._validate_header_list(uncached_headers)
+        ):
+            if is_valid:
+                new_header = header
+            else:
                 new_header = self._normalize_header(header)
                 self._validate_header(new_header)
 
-            new_header_list.append(new_header)
+            new_header_list[col_idx] = new_header
+
+            if header_cache is not None:
+                header_cache.put(header, new_header)
 
-        return new_header_list
+        return new_header_list  # type: ignore
 
 
 class TableDataNormalizer(AbstractTableDataNormalizer):
+    header_cache_size = 4096
+
     def _preprocess_table_name(self) -> str:
         if not self._tabledata.table_name:
             return ""
@@ -203,5 +363,113 @@ class TableDataNormalizer(AbstractTableDataNormalizer):
         except TypeError as e:
             raise InvalidHeaderNameError(e)
 
+    def _validate_header_list(self, headers: Sequence[str]) -> list[bool]:
+        if type(self)._validate_header is not TableDataNormalizer._validate_header:
+            # keep the validation of a subclass that overrides only _validate_header
+            return super()._validate_header_list(headers)
+
+        return [typepy.String(header).is_type() for header in headers]
+
     def _normalize_header(self, header: str) -> str:
         return str(typepy.String(header).force_convert())
+
+
+NormalizerFactory = Callable[[TableData], TableDataNormalizerInterface]
+
+
+class NormalizeResult(NamedTuple):
+    """
+    Result of normalizing a table with :py:func:`.normalize_tables`.
+    """
+
+    #: Normalized table data. |None| if failed.
+    tabledata: Optional[TableData]
+
+    #: Exception raised while validating/normalizing the table. |None| if succeeded.
+    error: Optional[BaseException]
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+def _normalize_table(
+    normalizer_factory: NormalizerFactory, tabledata: TableData, is_validate: bool
+) -> TableData:
+    normalizer = normalizer_factory(tabledata)
+
+    if is_validate:
+        normalizer.validate()
+
+    return normalizer.normalize()
+
+
+def normalize_tables(
+    tabledata_list: Iterable[TableData],
+    normalizer_factory: NormalizerFactory = TableDataNormalizer,
+    is_validate: bool = False,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> list[NormalizeResult]:
+    """
+    Normalize tables concurrently.
+
+    :param tabledata_list: Tables to normalize.
+    :param normalizer_factory:
+        Callable that creates a normalizer from a table, typically a subclass of
+        :py:class:`~.TableDataNormalizerInterface`.
+        Must be picklable if ``executor`` is a process pool.
+    :param is_validate:
+        If |True|, call ``validate`` method of the normalizers before normalizing.
+    :param executor:
+        Executor to run the normalizers (e.g. ``ProcessPoolExecutor``).
+        A thread pool with ``max_workers`` is used if |None|.
+    :param max_workers: Maximum number of threads of the default thread pool.
+    :return:
+        Results in the same order as ``tabledata_list``.
+        An exception raised for a table is stored to the result of the table
+        instead of being raised.
+
+    :Sample Code:
+        .. code:: python
+
+            from concurrent.futures import ProcessPoolExecutor
+            from tabledata.normalizer import normalize_tables
+
+            with ProcessPoolExecutor() as executor:
+                for result in normalize_tables(tables, executor=executor):
+                    if result.is_success:
+                        print(result.tabledata)
+                    else:
+                        print(result.error)
+    """
+
+    tabledata_list = list(tabledata_list)
+    if not tabledata_list:
+        return []
+
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as thread_executor:
+            return normalize_tables(
+                tabledata_list, normalizer_factory, is_validate, executor=thread_executor
+            )
+
+    if logger_state.is_enabled:
+        logger.debug(
+            f"normalize_tables: tables={len(tabledata_list)}, executor={type(executor).__name__}"
+        )
+
+    futures = [
+        executor.submit(_normalize_table, normalizer_factory, tabledata, is_validate)
+        for tabledata in tabledata_list
+    ]
+
+    results = []
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            results.append(NormalizeResult(None, error))
+        else:
+            results.append(NormalizeResult(future.result(), None))
+
+    return results
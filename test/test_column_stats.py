@@ -0,0 +1,155 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from tabledata import ColumnStats, Schema, TableData
+from tabledata._column_stats import HyperLogLog
+
+
+class Test_HyperLogLog:
+    @pytest.mark.parametrize(["num_values"], [[0], [1], [100], [HyperLogLog.EXACT_LIMIT]])
+    def test_normal_exact(self, num_values):
+        sketch = HyperLogLog()
+        for i in range(num_values):
+            sketch.add(i)
+            sketch.add(i)
+
+        assert sketch.count() == num_values
+
+    @pytest.mark.parametrize(["num_values"], [[5000], [50000]])
+    def test_normal_estimate(self, num_values):
+        sketch = HyperLogLog()
+        for i in range(num_values):
+            sketch.add(f"value{i}")
+
+        assert abs(sketch.count() - num_values) / num_values < 0.05
+
+    def test_normal_merge(self):
+        lhs = HyperLogLog()
+        rhs = HyperLogLog()
+        for i in range(3000):
+            lhs.add(i)
+        for i in range(2000, 6000):
+            rhs.add(i)
+
+        lhs.merge(rhs)
+
+        assert abs(lhs.count() - 6000) / 6000 < 0.05
+
+    @pytest.mark.parametrize(["precision"], [[3], [17]])
+    def test_exception_precision(self, precision):
+        with pytest.raises(ValueError):
+            HyperLogLog(precision)
+
+    def test_exception_merge(self):
+        with pytest.raises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+
+class Test_ColumnStats:
+    @pytest.mark.parametrize(
+        ["values", "expected"],
+        [
+            [[], (0, 0, 0, None, None, None)],
+            [[None, None], (2, 2, 0, None, None, None)],
+            [[3, 1, None, 2, 1], (5, 1, 3, 1, 3, None)],
+            [["b", "abc", None, "b"], (4, 1, 2, "abc", "b", 3)],
+            [[1.5, float("nan"), -1.0], (3, 0, 3, -1.0, 1.5, None)],
+            [[Decimal("NaN"), Decimal("1.5"), Decimal("NaN")], (3, 0, 2, 1.5, 1.5, None)],
+            [[1, "a"], (2, 0, 2, None, None, 1)],
+        ],
+    )
+    def test_normal(self, values, expected):
+        stats = ColumnStats()
+        stats.update(values)
+
+        assert (
+            stats.count,
+            stats.null_count,
+            stats.distinct_count,
+            stats.min,
+            stats.max,
+            stats.max_str_length,
+        ) == expected
+
+    def test_normal_merge(self):
+        lhs = ColumnStats()
+        lhs.update([3, None])
+        rhs = ColumnStats()
+        rhs.update([10, -1, 3])
+
+        lhs.merge(rhs)
+
+        assert lhs.count == 5
+        assert lhs.null_count == 1
+        assert lhs.distinct_count == 3
+        assert lhs.min == -1
+        assert lhs.max == 10
+
+    def test_normal_merge_not_comparable(self):
+        lhs = ColumnStats()
+        lhs.update([1])
+        rhs = ColumnStats()
+        rhs.update(["a"])
+
+        lhs.merge(rhs)
+
+        assert lhs.min is None
+        assert lhs.max is None
+        assert lhs.max_str_length == 1
+
+
+class Test_TableData_column_stats:
+    def test_normal(self):
+        tabledata = TableData(
+            "sample", ["a", "b", "c"], [[1, "x", 1.1], [2, None, None], [2, "yz", 3.3]]
+        )
+
+        stats_list = tabledata.column_stats()
+
+        assert len(stats_list) == 3
+        assert (stats_list[0].min, stats_list[0].max, stats_list[0].distinct_count) == (1, 2, 2)
+        assert (stats_list[1].null_count, stats_list[1].max_str_length) == (1, 2)
+        assert (stats_list[2].min, stats_list[2].max) == (Decimal("1.1"), Decimal("3.3"))
+
+    def test_normal_nan(self):
+        stats = TableData("sample", ["a"], [[1.5], ["nan"], [float("nan")]]).column_stats()[0]
+
+        assert (stats.min, stats.max) == (Decimal("1.5"), Decimal("1.5"))
+
+    def test_normal_cached(self):
+        tabledata = TableData("sample", ["a"], [[1], [2]])
+
+        stats = tabledata.column_stats()[0]
+        stats.update([100])
+
+        # returned statistics are copies of the cache
+        assert stats.max == 100
+        assert tabledata.column_stats()[0].max == 2
+
+    def test_normal_trusted_schema(self):
+        tabledata = TableData(
+            "sample", ["a", "b"], [[1, "x"], [2, "y"]], schema=Schema(["a", "b"], ["int", "str"])
+        )
+
+        stats_list = tabledata.column_stats()
+
+        assert not tabledata.has_value_dp_matrix
+        assert [stats.max for stats in stats_list] == [2, "y"]
+
+    def test_normal_rename(self):
+        tabledata = TableData("sample", ["a"], [[1], [2]])
+        tabledata.column_stats()
+
+        renamed = tabledata.rename("renamed", ["b"])
+
+        assert renamed.column_stats()[0].max == 2
+
+    def test_normal_empty_rows(self):
+        stats_list = TableData("sample", ["a", "b"], []).column_stats()
+
+        assert [stats.count for stats in stats_list] == [0, 0]
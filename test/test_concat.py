@@ -0,0 +1,119 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pickle
+from decimal import Decimal
+
+import pytest
+from typepy import Bool, Integer, RealNumber, String
+
+from tabledata import Schema, TableData
+from tabledata._concat import ChainedRows
+
+
+class Test_ChainedRows:
+    def test_normal(self):
+        rows = ChainedRows([[[1, 2], [3, 4]], [], [[5, 6]]], [None, None, [1, None]])
+
+        assert len(rows) == 3
+        assert list(rows) == [[1, 2], [3, 4], [6, None]]
+        assert rows[0] == [1, 2]
+        assert rows[-1] == [6, None]
+        assert rows[1:] == [[3, 4], [6, None]]
+        assert rows == [[1, 2], [3, 4], [6, None]]
+
+    @pytest.mark.parametrize(["index"], [[3], [-4]])
+    def test_exception(self, index):
+        rows = ChainedRows([[[1, 2], [3, 4]], [[5, 6]]], [None, None])
+
+        with pytest.raises(IndexError):
+            rows[index]
+
+
+class Test_TableData_concat:
+    def test_normal(self):
+        tabledata = TableData.concat(
+            [
+                TableData("shard", ["a", "b"], [[1, "x"], [2, "y"]]),
+                TableData("shard", ["a", "c"], [[2.5, True]]),
+                TableData("shard", ["c", "b"], [[False, "z"]]),
+            ]
+        )
+
+        assert tabledata.table_name == "shard"
+        assert tabledata.headers == ["a", "b", "c"]
+        assert tabledata.value_matrix == [
+            [1, "x", None],
+            [2, "y", None],
+            [Decimal("2.5"), None, True],
+            [None, "z", False],
+        ]
+        assert tabledata.is_trusted_schema
+        assert tabledata.schema.type_hints == [RealNumber, String, Bool]
+
+    @pytest.mark.parametrize(
+        ["rows_list", "expected"],
+        [
+            [[[[1]], [[2]]], Integer],
+            [[[[1]], [[1.5]]], RealNumber],
+            [[[[1]], [[None]]], Integer],
+            [[[[1]], []], Integer],
+            [[[[1]], [["a"]]], None],
+            [[[[1], ["a"]], [[2]]], None],
+        ],
+    )
+    def test_normal_widen(self, rows_list, expected):
+        tabledata = TableData.concat([TableData("shard", ["a"], rows) for rows in rows_list])
+
+        assert tabledata.schema.type_hints == [expected]
+
+    @pytest.mark.parametrize(["lazy"], [[True], [False]])
+    def test_normal_reuse_converted(self, lazy):
+        tables = [
+            TableData("shard", ["a", "b"], [[1, "x"], [2, None]]),
+            TableData("shard", ["b", "a"], [["z", 3]]),
+        ]
+        value_dp_matrices = [table.value_dp_matrix for table in tables]
+
+        tabledata = TableData.concat(tables, table_name="merged", lazy=lazy)
+
+        assert tabledata.table_name == "merged"
+        assert tabledata.has_value_dp_matrix
+        assert tabledata.value_dp_matrix[0][0] is value_dp_matrices[0][0][0]
+        assert tabledata.value_dp_matrix[2][0] is value_dp_matrices[1][0][1]
+        assert tabledata.value_matrix == [[1, "x"], [2, None], [3, "z"]]
+        assert (
+            tabledata.as_dict()
+            == TableData("merged", ["a", "b"], [[1, "x"], [2, None], [3, "z"]]).as_dict()
+        )
+
+    def test_normal_lazy(self):
+        rows = [[1, "x"], [2, "y"]]
+        part = TableData("shard", ["a", "b"], rows, schema=Schema(["a", "b"], [Integer, String]))
+
+        tabledata = TableData.concat([part, part], lazy=True)
+
+        assert isinstance(tabledata.value_matrix, ChainedRows)
+        assert tabledata.value_matrix[2] is part.value_matrix[0]
+        assert tabledata.sort_by("a").value_matrix == [[1, "x"], [1, "x"], [2, "y"], [2, "y"]]
+
+        restored = pickle.loads(pickle.dumps(tabledata))
+        assert restored.value_matrix == rows + rows
+
+    def test_normal_empty(self):
+        tabledata = TableData.concat([TableData("shard", ["a"], []), TableData("shard", [], [])])
+
+        assert tabledata.headers == ["a"]
+        assert tabledata.value_matrix == []
+
+    @pytest.mark.parametrize(
+        ["tables"],
+        [
+            [[]],
+            [[TableData("shard", [], [[1]])]],
+        ],
+    )
+    def test_exception(self, tables):
+        with pytest.raises(ValueError):
+            TableData.concat(tables)
@@ -2,9 +2,12 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-from collections import OrderedDict
+import dataclasses
+from collections import OrderedDict, defaultdict, namedtuple
 
-from tabledata import to_value_matrix
+import pytest
+
+from tabledata import DataError, to_value_matrix
 
 
 class Test_to_value_matrix:
@@ -53,3 +56,77 @@ class Test_to_value_matrix:
             )
             == expect
         )
+
+    def test_normal_namedtuple_rows(self):
+        Row = namedtuple("Row", "A B C")
+
+        assert to_value_matrix(["A", "B", "C"], [Row(1, 2.1, "hoge")]) == [(1, 2.1, "hoge")]
+        assert to_value_matrix(["C", "A", "D"], [Row(1, 2.1, "hoge")]) == [["hoge", 1, None]]
+
+    def test_normal_dataclass_rows(self):
+        @dataclasses.dataclass
+        class Row:
+            A: int
+            B: float
+            C: str
+
+        rows = [Row(1, 2.1, "hoge"), Row(0, 0.1, "foo")]
+
+        assert to_value_matrix(["A", "B", "C"], rows) == [[1, 2.1, "hoge"], [0, 0.1, "foo"]]
+        assert to_value_matrix(["C", "D"], rows, row_type=Row) == [["hoge", None], ["foo", None]]
+        assert to_value_matrix([], rows) == [[1, 2.1, "hoge"], [0, 0.1, "foo"]]
+
+    def test_normal_method_name_headers(self):
+        NamedRow = namedtuple("NamedRow", "a b")
+
+        @dataclasses.dataclass
+        class DataRow:
+            a: int
+
+            def total(self) -> int:
+                return self.a
+
+        assert to_value_matrix(["a", "count", "index"], [NamedRow(1, 2)]) == [[1, None, None]]
+        assert to_value_matrix(["a", "total", "__init__"], [DataRow(1)]) == [[1, None, None]]
+
+    def test_normal_attrs_rows(self):
+        attr = pytest.importorskip("attr")
+
+        @attr.s
+        class Row:
+            A = attr.ib()
+            B = attr.ib()
+
+        assert to_value_matrix(["B", "A"], [Row(1, "x")]) == [["x", 1]]
+
+    def test_normal_mixed_rows(self):
+        expect = [[1, 2], [3, None], (5, 6)]
+
+        assert to_value_matrix(["A", "B"], [{"A": 1, "B": 2}, {"A": 3}, (5, 6)]) == expect
+
+    def test_normal_get_method_rows(self):
+        class Row:
+            def __init__(self, value_map):
+                self.__value_map = value_map
+
+            def get(self, key):
+                return self.__value_map.get(key)
+
+        assert to_value_matrix(["A", "B"], [Row({"A": 1})]) == [[1, None]]
+
+    def test_normal_defaultdict_rows(self):
+        row = defaultdict(int, {"A": 1})
+
+        assert to_value_matrix(["A", "B"], [row]) == [[1, None]]
+        assert dict(row) == {"A": 1}
+
+    @pytest.mark.parametrize(
+        ["headers", "value_matrix", "expected"],
+        [
+            [["A"], [1, 2], DataError],
+            [[], [{"A": 1}], DataError],
+        ],
+    )
+    def test_exception(self, headers, value_matrix, expected):
+        with pytest.raises(expected):
+            to_value_matrix(headers, value_matrix)
@@ -0,0 +1,111 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+from dataproperty import DataPropertyExtractor
+from typepy import Integer, String, Typecode
+
+from tabledata import ExtractorConfig, TableData
+from tabledata._extractor import (
+    _MUTABLE_SETTING_NAMES,
+    _SHARED_SETTING_NAMES,
+    _TRANS_FUNC_LIST_ATTR,
+)
+
+
+class Test_ExtractorConfig:
+    def test_normal_snapshot(self):
+        dp_extractor = DataPropertyExtractor()
+        dp_extractor.max_precision = 2
+        config = ExtractorConfig(dp_extractor)
+
+        dp_extractor.max_precision = 5
+
+        assert config.max_precision == 2
+
+    def test_normal_shared(self):
+        config = ExtractorConfig(max_precision=3)
+        lhs = TableData("lhs", ["a", "b"], [[1, "2"]], dp_extractor=config)
+        rhs = TableData(
+            "rhs", ["c", "d"], [[3, "4"]], dp_extractor=config, type_hints=[None, String]
+        )
+
+        assert lhs.extractor_config is config
+        assert rhs.extractor_config is config
+
+        lhs.dp_extractor.max_precision = 1
+        lhs.dp_extractor.set_type_value(Typecode.NONE, "null")
+
+        assert config.max_precision == 3
+        assert rhs.dp_extractor.max_precision == 3
+        assert rhs.dp_extractor.type_value_map[Typecode.NONE] != "null"
+        assert rhs.dp_extractor.headers == ["c", "d"]
+        assert rhs.type_hints == [None, String]
+        assert [col_dp.type_class for col_dp in rhs.column_dp_list] == [Integer, String]
+
+    def test_normal_private_extractor(self):
+        config = ExtractorConfig()
+        tabledata = TableData("sample", ["a"], [[1]], dp_extractor=config)
+        tabledata.dp_extractor.max_precision = 1
+
+        assert tabledata.extractor_config is not config
+        assert tabledata.extractor_config.max_precision == 1
+
+    def test_normal_converted_shared(self):
+        config = ExtractorConfig(max_precision=3)
+        tabledata = TableData("sample", ["a", "b"], [[2, "x"], [1, "y"]], dp_extractor=config)
+        tabledata.value_dp_matrix
+
+        assert tabledata.extractor_config is config
+        assert tabledata.rename("renamed", ["c", "d"]).extractor_config is config
+        assert tabledata.sort_by("a").extractor_config is config
+
+        tabledata.dp_extractor.max_precision = 1
+
+        assert tabledata.extractor_config is not config
+        assert tabledata.extractor_config.max_precision == 1
+
+    def test_normal_float_type(self):
+        config = ExtractorConfig()
+
+        dp_extractor = config.new_extractor(["a"], float_type=float)
+
+        assert dp_extractor.float_type is float
+        assert config.float_type is None
+
+    @pytest.mark.parametrize(
+        ["name"], [[name] for name in _SHARED_SETTING_NAMES + (_TRANS_FUNC_LIST_ATTR,)]
+    )
+    def test_normal_expected_attrs(self, name):
+        # fails if a dataproperty release renames the attributes that ExtractorConfig reads
+        assert hasattr(DataPropertyExtractor(), name)
+
+    @pytest.mark.parametrize(
+        ["update"],
+        [
+            [lambda extractor: setattr(extractor, "max_precision", 1)],
+            [lambda extractor: extractor.set_type_value(Typecode.NONE, "null")],
+            [lambda extractor: extractor.update_preprocessor(dequote=True)],
+            [lambda extractor: extractor.update_strict_level_map({Typecode.INTEGER: 0})],
+            [lambda extractor: extractor.register_trans_func(lambda value: value)],
+        ],
+    )
+    def test_normal_is_source_of(self, update):
+        config = ExtractorConfig()
+        extractor = config.new_extractor(["a"])
+
+        assert config.is_source_of(extractor)
+
+        update(extractor)
+
+        assert not config.is_source_of(extractor)
+        assert config.is_source_of(config.new_extractor(["a"]))
+
+    def test_normal_new_extractor_isolated(self):
+        config = ExtractorConfig()
+        lhs = config.new_extractor(["a"])
+        rhs = config.new_extractor(["a"])
+
+        for name in _MUTABLE_SETTING_NAMES:
+            assert getattr(lhs, name) is not getattr(rhs, name)
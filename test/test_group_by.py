@@ -0,0 +1,161 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from typepy import Integer, RealNumber, String
+
+from tabledata import FloatType, Schema, TableData
+
+
+class Test_GroupBy_agg:
+    ROWS = [
+        ["a", 1, "x"],
+        ["b", 2, "y"],
+        ["a", 3, None],
+        ["b", None, "z"],
+        [None, 5, "w"],
+    ]
+
+    @pytest.mark.parametrize(
+        ["aggregations", "expected_headers", "expected"],
+        [
+            [
+                {"v": ["count", "sum", "mean"]},
+                ["k", "v_count", "v_sum", "v_mean"],
+                [["a", 2, 4, Decimal(2)], ["b", 1, 2, Decimal(2)], [None, 1, 5, Decimal(5)]],
+            ],
+            [
+                {"v": ["min", "max"], "s": "first"},
+                ["k", "v_min", "v_max", "s_first"],
+                [["a", 1, 3, "x"], ["b", 2, 2, "y"], [None, 5, 5, "w"]],
+            ],
+            [
+                {"s": ["count", "min", "max"]},
+                ["k", "s_count", "s_min", "s_max"],
+                [["a", 1, "x", "x"], ["b", 2, "y", "z"], [None, 1, "w", "w"]],
+            ],
+            [{}, ["k"], [["a"], ["b"], [None]]],
+        ],
+    )
+    def test_normal(self, aggregations, expected_headers, expected):
+        tabledata = TableData("sample", ["k", "v", "s"], self.ROWS)
+
+        actual = tabledata.group_by("k").agg(aggregations)
+
+        assert actual.table_name == "sample"
+        assert actual.headers == expected_headers
+        assert actual.value_matrix == expected
+
+    def test_normal_multi_keys(self):
+        tabledata = TableData(
+            "sample", ["k1", "k2", "v"], [[1, "a", 1], [1, "b", 2], [1, "a", 3], [2, "a", 4]]
+        )
+
+        actual = tabledata.group_by(["k1", "k2"]).agg({"v": "sum"})
+
+        assert actual.value_matrix == [[1, "a", 4], [1, "b", 2], [2, "a", 4]]
+
+    def test_normal_nan_key(self):
+        tabledata = TableData(
+            "sample", ["k", "v"], [[float("nan"), 1], [1.5, 2], [float("nan"), 3]]
+        )
+
+        actual = tabledata.group_by("k").agg({"v": "count"})
+
+        assert [row[1] for row in actual.value_matrix] == [2, 1]
+
+    def test_normal_nan_value(self):
+        tabledata = TableData("sample", ["k", "v"], [["a", 1.5], ["a", float("nan")]])
+
+        actual = tabledata.group_by("k").agg({"v": ["count", "sum"]})
+
+        assert actual.value_matrix == [["a", 1, Decimal("1.5")]]
+
+    def test_normal_type_hints(self):
+        tabledata = TableData("sample", ["k", "i", "r"], [["a", 1, 1.5], ["a", 2, 2.5]])
+
+        actual = tabledata.group_by("k").agg(
+            {"i": ["count", "sum", "mean", "max"], "r": ["sum", "first"]}
+        )
+
+        assert actual.is_trusted_schema
+        assert actual.schema.type_hints == [
+            String,
+            Integer,
+            Integer,
+            RealNumber,
+            Integer,
+            RealNumber,
+            RealNumber,
+        ]
+        assert actual.value_matrix == [
+            ["a", 2, 3, Decimal("1.5"), 2, Decimal("4.0"), Decimal("1.5")]
+        ]
+
+    def test_normal_trusted_schema(self):
+        tabledata = TableData(
+            "sample",
+            ["k", "v"],
+            [["a", 1], ["a", 2]],
+            schema=Schema(["k", "v"], [String, Integer]),
+        )
+
+        actual = tabledata.group_by("k").agg({"v": "sum"})
+
+        assert not tabledata.has_value_dp_matrix
+        assert actual.value_matrix == [["a", 3]]
+
+    @pytest.mark.parametrize(
+        ["rows", "expected"],
+        [
+            [[["a", 1], ["a", "x"]], [["a", 1, "x"]]],
+            [[["a", "x"], ["a", datetime(2020, 1, 1)]], [["a", datetime(2020, 1, 1), "x"]]],
+        ],
+    )
+    def test_normal_mixed_column(self, rows, expected):
+        tabledata = TableData("sample", ["k", "v"], rows)
+
+        actual = tabledata.group_by("k").agg({"v": ["min", "max"]})
+
+        assert actual.value_matrix == expected
+
+    def test_normal_float_decimal(self):
+        tabledata = TableData(
+            "sample",
+            ["k", "v"],
+            [["a", 1.5], ["a", Decimal("2.25")]],
+            float_type=FloatType.ORIGINAL,
+        )
+
+        actual = tabledata.group_by("k").agg({"v": ["sum", "mean", "min", "max"]})
+
+        assert actual.value_matrix == [
+            ["a", Decimal("3.75"), Decimal("1.875"), Decimal("1.5"), Decimal("2.25")]
+        ]
+
+    @pytest.mark.parametrize(
+        ["keys", "aggregations"],
+        [
+            ["x", {"v": "sum"}],
+            ["k", {"x": "sum"}],
+            ["k", {"v": "median"}],
+            ["k", {"s": "sum"}],
+            ["k", {"s": "mean"}],
+        ],
+    )
+    def test_exception(self, keys, aggregations):
+        tabledata = TableData("sample", ["k", "v", "s"], self.ROWS)
+
+        with pytest.raises(ValueError):
+            tabledata.group_by(keys).agg(aggregations)
+
+    @pytest.mark.parametrize(["keys", "aggregations"], [["v", {}], ["k", {"v": "sum"}]])
+    def test_exception_ragged(self, keys, aggregations):
+        tabledata = TableData("sample", ["k", "v"], [["a", 1], ["b"]])
+
+        with pytest.raises(ValueError):
+            tabledata.group_by(keys).agg(aggregations)
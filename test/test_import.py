@@ -0,0 +1,53 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+class Test_import:
+    def test_normal_lazy(self):
+        script = "\n".join(
+            [
+                "import sys",
+                "from tabledata import TableData",
+                "TableData('sample', ['a', 'b'], [[1, 2], [3, 4]])",
+                "print(','.join(sorted("
+                "name for name in ('dataproperty', 'loguru', 'multiprocessing', 'typepy') "
+                "if name in sys.modules)))",
+            ]
+        )
+
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=True, text=True
+        ).stdout
+
+        assert output.strip() == ""
+
+    @pytest.mark.parametrize(
+        ["name"],
+        [
+            ["BinaryTableReader"],
+            ["ExtractorConfig"],
+            ["MemoryUsage"],
+            ["Schema"],
+            ["SchemaCache"],
+            ["SharedTableData"],
+            ["convert_idx_to_alphabet"],
+            ["to_value_matrix"],
+        ],
+    )
+    def test_normal_lazy_attr(self, name):
+        import tabledata
+
+        assert name in dir(tabledata)
+        assert getattr(tabledata, name).__name__ == name
+
+    def test_exception(self):
+        import tabledata
+
+        with pytest.raises(AttributeError):
+            tabledata.not_exist_attr
@@ -0,0 +1,106 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from decimal import Decimal
+
+import pytest
+from typepy import Typecode
+
+from tabledata import RowIndex, TableData
+
+
+ROWS = [[1, "a", 1.5], [2, "b", None], [3, "c", float("nan")], [2, "d", 2.5]]
+
+
+class Test_TableData_get_column_index:
+    @pytest.mark.parametrize(
+        ["headers", "name", "expected"],
+        [
+            [["id", "name", "score"], "id", 0],
+            [["id", "name", "score"], "score", 2],
+            [["id", "name", "id"], "id", 0],
+        ],
+    )
+    def test_normal(self, headers, name, expected):
+        tabledata = TableData("sample", headers, ROWS)
+
+        assert tabledata.get_column_index(name) == expected
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            TableData("sample", ["id", "name", "score"], ROWS).get_column_index("x")
+
+
+class Test_TableData_get_column:
+    def test_normal(self):
+        tabledata = TableData("sample", ["id", "name", "score"], ROWS)
+
+        assert tabledata.get_column("name") == ["a", "b", "c", "d"]
+        assert tabledata.get_column("score")[:2] == [Decimal("1.5"), None]
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            TableData("sample", ["id", "name", "score"], ROWS).get_column("x")
+
+    def test_exception_ragged(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, 2], [3]])
+
+        assert tabledata.get_column("a") == [1, 3]
+
+        with pytest.raises(ValueError):
+            tabledata.get_column("b")
+        with pytest.raises(ValueError):
+            tabledata.get_value_dp_list("b")
+
+
+class Test_TableData_get_value_dp_list:
+    def test_normal(self):
+        tabledata = TableData("sample", ["id", "name", "score"], ROWS)
+
+        value_dp_list = tabledata.get_value_dp_list("id")
+
+        assert [value_dp.data for value_dp in value_dp_list] == [1, 2, 3, 2]
+        assert all(value_dp.typecode == Typecode.INTEGER for value_dp in value_dp_list)
+        assert value_dp_list[0] is tabledata.value_dp_matrix[0][0]
+
+
+class Test_TableData_create_index:
+    def test_normal(self):
+        tabledata = TableData("sample", ["id", "name", "score"], ROWS)
+
+        index = tabledata.create_index("id")
+
+        assert isinstance(index, RowIndex)
+        assert index.column == "id"
+        assert len(index) == 3
+        assert not index.is_unique
+        assert index.lookup(1) == [1, "a", Decimal("1.5")]
+        assert index.lookup(2)[1] == "b"
+        assert index.lookup(4) is None
+        assert [row[1] for row in index.lookup_all(2)] == ["b", "d"]
+        assert index.lookup_all(4) == []
+        assert index.get_row_index(3) == 2
+        assert 3 in index
+        assert "3" not in index
+
+        # cached
+        assert tabledata.create_index("id") is index
+
+    def test_normal_null_keys(self):
+        tabledata = TableData("sample", ["id", "name", "score"], ROWS)
+
+        index = tabledata.create_index("score")
+
+        assert index.is_unique
+        assert index.lookup(None)[1] == "b"
+        assert index.lookup(float("nan"))[1] == "c"
+        assert index.lookup(Decimal("2.5"))[1] == "d"
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            TableData("sample", ["id", "name", "score"], ROWS).create_index("x")
+
+    def test_exception_ragged(self):
+        with pytest.raises(ValueError):
+            TableData("sample", ["a", "b"], [[1, 2], [3]]).create_index("b")
@@ -0,0 +1,82 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+
+from tabledata import Phase, PhaseStats, TableData, set_instrument
+
+
+@pytest.fixture
+def global_stats():
+    stats = PhaseStats()
+    set_instrument(stats)
+
+    yield stats
+
+    set_instrument(None)
+
+
+class Test_TableData_instrument:
+    def test_normal(self):
+        events = []
+        tabledata = TableData("sample", ["a", "b"], [[1, 2], [3, 4], [5, 6]])
+        tabledata.instrument = events.append
+
+        tabledata.as_dict()
+
+        assert [(event.phase, event.cache_hit) for event in events] == [
+            (Phase.TO_VALUE_MATRIX, False),
+            (Phase.TO_DP_MATRIX, False),
+            (Phase.TO_VALUE_MATRIX, False),
+            (Phase.EXPORT, False),
+        ]
+        for event in events:
+            assert event.table_name == "sample"
+            assert event.num_rows == 3
+            assert event.num_cells == 6
+            assert event.duration >= 0
+
+        events.clear()
+        tabledata.column_dp_list
+
+        assert [(event.phase, event.cache_hit) for event in events] == [
+            (Phase.TO_DP_MATRIX, True),
+            (Phase.TO_COLUMN_DP_LIST, False),
+        ]
+
+    def test_normal_as_tuple(self):
+        events = []
+        tabledata = TableData("sample", ["a", "b"], [[1, 2]])
+        tabledata.instrument = events.append
+
+        records = tabledata.as_tuple()
+        assert events == []
+
+        list(records)
+        assert events[-1].phase == Phase.EXPORT
+        assert events[-1].operation == "as_tuple"
+
+    def test_normal_global(self, global_stats):
+        tabledata = TableData("sample", ["a", "b"], [[1, 2], [3, 4]])
+
+        tabledata.value_dp_matrix
+        tabledata.value_dp_matrix
+
+        stat = global_stats[Phase.TO_DP_MATRIX]
+        assert stat.count == 2
+        assert stat.cache_hits == 1
+        assert stat.cache_misses == 1
+        assert stat.num_rows == 4
+        assert stat.num_cells == 8
+        assert global_stats.phases == [Phase.TO_VALUE_MATRIX, Phase.TO_DP_MATRIX]
+
+        global_stats.clear()
+        assert global_stats.phases == []
+        assert global_stats[Phase.EXPORT].count == 0
+
+    def test_normal_disabled(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, 2]])
+
+        assert tabledata.instrument is None
+        assert tabledata.as_dict() == {"sample": [{"a": 1, "b": 2}]}
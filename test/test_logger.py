@@ -1,17 +1,128 @@
 import pytest
 
-from tabledata import set_logger
+from tabledata import TableData, set_logger
+from tabledata._logger import log_row_diagnostics, logger_state
 from tabledata._logger._null_logger import NullLogger
 
 
+class RecordLogger(NullLogger):
+    def __init__(self):
+        self.messages = []
+
+    def debug(self, __message, *args, **kwargs):
+        self.messages.append(__message)
+
+
+@pytest.fixture
+def record_logger(monkeypatch):
+    record_logger = RecordLogger()
+    monkeypatch.setattr("tabledata._logger._logger.logger", record_logger)
+    monkeypatch.setattr("tabledata._core.logger", record_logger)
+
+    return record_logger
+
+
 class Test_set_logger:
     @pytest.mark.parametrize(["value"], [[True], [False]])
     def test_smoke(self, value):
         set_logger(value)
 
+    def test_normal(self):
+        pytest.importorskip("loguru")
+
+        set_logger(True)
+        assert logger_state.is_enabled
+
+        set_logger(False)
+        assert not logger_state.is_enabled
+
+
+class Test_set_logger_loguru:
+    @pytest.fixture
+    def messages(self):
+        loguru = pytest.importorskip("loguru")
+        messages = []
+        handler_id = loguru.logger.add(messages.append, level="DEBUG", format="{message}")
+
+        yield messages
+
+        loguru.logger.remove(handler_id)
+        set_logger(False)
+
+    def test_normal(self, messages):
+        tabledata = TableData("sample", ["a", "b"], [[1, 2]])
+
+        set_logger(True)
+        tabledata.filter_column(patterns=["a"])
+
+        assert any("filter_column" in message for message in messages)
+
+    def test_normal_loguru_enable(self, messages):
+        from loguru import logger
+
+        tabledata = TableData("sample", ["a", "b"], [[1, 2]])
+
+        # logging of the package is enabled only by set_logger
+        logger.enable("tabledata")
+        tabledata.filter_column(patterns=["a"])
+
+        assert not any("filter_column" in message for message in messages)
+
 
 class Test_NullLogger:
     @pytest.mark.parametrize(["value"], [[True], [False]])
     def test_smoke(self, value, monkeypatch):
         monkeypatch.setattr("tabledata._logger._logger.logger", NullLogger())
         set_logger(value)
+
+        assert not logger_state.is_enabled
+
+
+class Test_log_row_diagnostics:
+    @pytest.mark.parametrize(
+        ["num_rows", "max_count", "expected"],
+        [
+            [3, 5, ["row 0", "row 1", "row 2"]],
+            [5, 2, ["row 0", "row 1", "... and 3 more rows"]],
+            [0, 2, []],
+        ],
+    )
+    def test_normal(self, record_logger, monkeypatch, num_rows, max_count, expected):
+        monkeypatch.setattr(logger_state, "is_enabled", True)
+
+        log_row_diagnostics(list(range(num_rows)), lambda row_idx: f"row {row_idx}", max_count)
+
+        assert record_logger.messages == expected
+
+    def test_normal_disabled(self, record_logger, monkeypatch):
+        monkeypatch.setattr(logger_state, "is_enabled", False)
+
+        def make_message(row_idx):
+            raise AssertionError("messages must not be built while logging is disabled")
+
+        log_row_diagnostics([0, 1], make_message)
+
+        assert record_logger.messages == []
+
+
+class Test_TableData_logging:
+    def test_normal(self, record_logger, monkeypatch):
+        tabledata = TableData("sample", ["a", "b"], [[1, 2]])
+
+        monkeypatch.setattr(logger_state, "is_enabled", False)
+        tabledata.filter_column(patterns=["a"])
+        assert record_logger.messages == []
+
+        monkeypatch.setattr(logger_state, "is_enabled", True)
+        tabledata.filter_column(patterns=["a"])
+        assert len(record_logger.messages) == 2
+
+    def test_normal_validate_rows(self, record_logger, monkeypatch):
+        monkeypatch.setattr(logger_state, "is_enabled", True)
+        tabledata = TableData("sample", ["a", "b"], [[1]] * 20)
+
+        with pytest.raises(ValueError):
+            tabledata.validate_rows()
+
+        assert len(record_logger.messages) == 11
+        assert record_logger.messages[-1] == "... and 10 more rows"
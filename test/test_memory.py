@@ -0,0 +1,76 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import sys
+
+import pytest
+
+from tabledata import MemoryUsage, TableData
+from tabledata._memory import deep_sizeof
+
+
+class Test_deep_sizeof:
+    def test_normal(self):
+        value = ["abc", [1, 2]]
+        seen = set()
+
+        assert deep_sizeof(value, seen) == sum(
+            sys.getsizeof(obj) for obj in [value, "abc", value[1], 1, 2]
+        )
+
+        # already counted objects are not counted again
+        assert deep_sizeof(value, seen) == 0
+
+    @pytest.mark.parametrize(["value"], [[None], [True], [int]])
+    def test_normal_static(self, value):
+        assert deep_sizeof(value, set()) == 0
+
+
+class Test_TableData_memory_usage:
+    def test_normal(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, "abc"], [2, "defg"]])
+
+        usage = tabledata.memory_usage()
+
+        assert isinstance(usage, MemoryUsage)
+        assert usage.headers == ["a", "b"]
+        assert usage.layer_usage("rows") > 0
+        assert usage.layer_usage("value_matrix") == 0
+        assert usage.layer_usage("value_dp_matrix") == 0
+        assert usage.column_usage("rows")[1] == sys.getsizeof("abc") + sys.getsizeof("defg")
+
+        tabledata.value_dp_matrix
+        converted_usage = tabledata.memory_usage()
+
+        assert converted_usage.layer_usage("rows") == usage.layer_usage("rows")
+        assert converted_usage.layer_usage("value_dp_matrix") > 0
+        assert all(size > 0 for size in converted_usage.column_usage("value_dp_matrix"))
+        assert converted_usage.total == sum(
+            converted_usage.layer_usage(layer) for layer in MemoryUsage.LAYERS
+        )
+        assert converted_usage.as_dict()["value_dp_matrix"] == dict(
+            zip(["a", "b"], converted_usage.column_usage("value_dp_matrix"))
+        )
+
+    def test_normal_shallow(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, "abc"], [2, "defg"]])
+        tabledata.value_dp_matrix
+
+        assert tabledata.memory_usage(deep=False).layer_usage(
+            "value_dp_matrix"
+        ) < tabledata.memory_usage(deep=True).layer_usage("value_dp_matrix")
+
+    def test_normal_dict_rows(self):
+        tabledata = TableData("sample", ["a", "b"], [{"a": 1, "b": "abc"}])
+
+        assert tabledata.memory_usage().column_usage("rows") == [
+            sys.getsizeof(1),
+            sys.getsizeof("abc"),
+        ]
+
+    def test_normal_empty(self):
+        usage = TableData("sample", [], []).memory_usage()
+
+        assert usage.column_totals == []
+        assert usage.layer_usage("value_dp_matrix") == 0
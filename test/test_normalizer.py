@@ -1,7 +1,10 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 
 from tabledata import TableData
-from tabledata.normalizer import TableDataNormalizer
+from tabledata.error import InvalidHeaderNameError
+from tabledata.normalizer import TableDataNormalizer, clear_header_cache, normalize_tables
 
 
 class Test_TableDataNormalizer:
@@ -74,3 +77,174 @@ class Test_TableDataNormalizer:
         new_tabledata = TableDataNormalizer(TableData(table_name, headers, rows)).normalize()
 
         assert new_tabledata.equals(expected)
+
+    def test_normal_share_converted_data(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, "x"], [2, "y"]])
+        value_dp_matrix = tabledata.value_dp_matrix
+
+        new_tabledata = TableDataNormalizer(tabledata).normalize()
+
+        assert new_tabledata.rows is tabledata.rows
+        assert new_tabledata.value_dp_matrix is value_dp_matrix
+
+    def test_normal_custom_rows(self):
+        class DoubleRowNormalizer(TableDataNormalizer):
+            def _normalize_rows(self, normalize_headers):
+                return [[value * 2 for value in row] for row in self._tabledata.rows]
+
+        tabledata = TableData("sample", ["a", "b"], [[1, 2]])
+        tabledata.value_dp_matrix
+
+        new_tabledata = DoubleRowNormalizer(tabledata).normalize()
+
+        assert not new_tabledata.has_value_dp_matrix
+        assert new_tabledata == TableData("sample", ["a", "b"], [[2, 4]])
+
+
+class UpperHeaderNormalizer(TableDataNormalizer):
+    header_cache_size = 2
+
+    def __init__(self, tabledata):
+        super().__init__(tabledata)
+
+        self.normalize_count = 0
+
+    def _validate_header(self, header):
+        if header != header.upper():
+            raise InvalidHeaderNameError(header)
+
+    def _normalize_header(self, header):
+        self.normalize_count += 1
+
+        return header.upper()
+
+    def _validate_header_list(self, headers):
+        return [header == header.upper() for header in headers]
+
+
+class NoCacheUpperHeaderNormalizer(UpperHeaderNormalizer):
+    header_cache_size = 0
+
+
+class NoSpaceHeaderNormalizer(TableDataNormalizer):
+    def _validate_header(self, header):
+        if " " in header:
+            raise InvalidHeaderNameError(header)
+
+    def _normalize_header(self, header):
+        return header.replace(" ", "_")
+
+
+class PrefixHeaderNormalizer(TableDataNormalizer):
+    def __init__(self, tabledata, prefix):
+        super().__init__(tabledata)
+
+        self.prefix = prefix
+
+    def _validate_header(self, header):
+        if not header.startswith(self.prefix):
+            raise InvalidHeaderNameError(header)
+
+    def _normalize_header(self, header):
+        return self.prefix + header
+
+
+class Test_TableDataNormalizer_header_cache:
+    def setup_method(self):
+        clear_header_cache()
+
+    def test_normal(self):
+        tabledata = TableData("sample", ["a", "B"], [[1, 2]])
+
+        normalizer = UpperHeaderNormalizer(tabledata)
+        assert normalizer.normalize().headers == ["A", "B"]
+        assert normalizer.normalize_count == 1
+
+        # cached across instances
+        normalizer = UpperHeaderNormalizer(tabledata)
+        assert normalizer.normalize().headers == ["A", "B"]
+        assert normalizer.normalize_count == 0
+
+        # the cache is per normalizer class
+        assert TableDataNormalizer(tabledata).normalize().headers == ["a", "B"]
+
+    def test_normal_bounded(self):
+        normalizer = UpperHeaderNormalizer(TableData("sample", ["a", "b", "c"], [[1, 2, 3]]))
+        assert normalizer.normalize().headers == ["A", "B", "C"]
+        assert normalizer.normalize_count == 3
+
+        # "a" was evicted
+        normalizer = UpperHeaderNormalizer(TableData("sample", ["a", "c"], [[1, 2]]))
+        assert normalizer.normalize().headers == ["A", "C"]
+        assert normalizer.normalize_count == 1
+
+    def test_normal_override_validate_header(self):
+        tabledata = TableData("sample", ["a b", "c"], [[1, 2]])
+
+        assert TableDataNormalizer(tabledata).normalize().headers == ["a b", "c"]
+        assert NoSpaceHeaderNormalizer(tabledata).normalize().headers == ["a_b", "c"]
+
+    def test_normal_inherited_cache_size(self):
+        tabledata = TableData("sample", ["a"], [[1]])
+
+        # the cache of TableDataNormalizer is not used by a subclass that depends on
+        # instance state without opting in
+        assert PrefixHeaderNormalizer(tabledata, "x_").normalize().headers == ["x_a"]
+        assert PrefixHeaderNormalizer(tabledata, "y_").normalize().headers == ["y_a"]
+
+    def test_normal_equal_headers_of_different_types(self):
+        tabledata = TableData("sample", [1, True, 1.0], [[1, 2, 3]])
+
+        assert TableDataNormalizer(tabledata).normalize().headers == ["1", "True", "1.0"]
+        assert TableDataNormalizer(tabledata).normalize().headers == ["1", "True", "1.0"]
+
+    def test_normal_disabled(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, 2]])
+
+        for _ in range(2):
+            normalizer = NoCacheUpperHeaderNormalizer(tabledata)
+            assert normalizer.normalize().headers == ["A", "B"]
+            assert normalizer.normalize_count == 2
+
+
+class Test_normalize_tables:
+    TABLES = [TableData(f"table{i}", ["a", "b"], [[i, "x"], [i + 1, "y"]]) for i in range(10)]
+
+    def test_normal(self):
+        results = normalize_tables(self.TABLES)
+
+        assert len(results) == len(self.TABLES)
+        for result, tabledata in zip(results, self.TABLES):
+            assert result.is_success
+            assert result.error is None
+            assert result.tabledata == tabledata
+
+    def test_normal_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = normalize_tables(
+                self.TABLES, normalizer_factory=UpperHeaderNormalizer, executor=executor
+            )
+
+        for result, tabledata in zip(results, self.TABLES):
+            assert result.is_success
+            assert result.tabledata.table_name == tabledata.table_name
+            assert result.tabledata.headers == ["A", "B"]
+            assert result.tabledata.value_matrix == tabledata.value_matrix
+
+    def test_normal_error(self):
+        tables = [
+            TableData("valid", ["a"], [[1]]),
+            TableData(None, ["a"], [[1]]),
+            TableData("valid", ["a"], [[2]]),
+        ]
+
+        results = normalize_tables(tables, is_validate=True, max_workers=2)
+
+        assert [result.is_success for result in results] == [True, False, True]
+        assert results[0].tabledata == tables[0]
+        assert results[1].tabledata is None
+        assert isinstance(results[1].error, ValueError)
+        assert results[2].tabledata == tables[2]
+
+    def test_normal_empty(self):
+        assert normalize_tables([]) == []
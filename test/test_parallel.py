@@ -0,0 +1,93 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import sys
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from dataproperty import DataPropertyExtractor
+from typepy import RealNumber, String
+
+from tabledata import ConversionMode
+from tabledata._parallel import (
+    MIN_PARALLEL_ROWS,
+    is_gil_enabled,
+    resolve_conversion_mode,
+    to_dp_matrix,
+)
+
+
+def make_mixed_rows(num_rows):
+    values = [1, "1", 1.5, "2.5", Decimal("3.5"), True, "abc", None, datetime(2017, 1, 1), "inf"]
+
+    return [
+        [values[row_idx % len(values)], values[(row_idx // 3) % len(values)], row_idx]
+        for row_idx in range(num_rows)
+    ]
+
+
+def to_typed_matrix(dp_matrix):
+    return [[(dp.typecode, dp.data) for dp in dp_list] for dp_list in dp_matrix]
+
+
+class Test_is_gil_enabled:
+    def test_normal(self, monkeypatch):
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+        assert not is_gil_enabled()
+
+        monkeypatch.delattr(sys, "_is_gil_enabled", raising=False)
+        assert is_gil_enabled()
+
+
+class Test_resolve_conversion_mode:
+    @pytest.mark.parametrize(
+        ["mode", "gil_enabled", "expected"],
+        [
+            [ConversionMode.AUTO, True, ConversionMode.PROCESS],
+            [ConversionMode.AUTO, False, ConversionMode.THREAD],
+            [ConversionMode.THREAD, True, ConversionMode.THREAD],
+            [ConversionMode.SERIAL, False, ConversionMode.SERIAL],
+            [ConversionMode.PROCESS, False, ConversionMode.PROCESS],
+        ],
+    )
+    def test_normal(self, monkeypatch, mode, gil_enabled, expected):
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: gil_enabled, raising=False)
+
+        assert resolve_conversion_mode(mode) == expected
+
+
+class Test_to_dp_matrix:
+    @pytest.mark.parametrize(
+        ["mode", "max_workers"],
+        [
+            [ConversionMode.THREAD, 4],
+            [ConversionMode.THREAD, 3],
+            [ConversionMode.THREAD, None],
+            [ConversionMode.PROCESS, None],
+            [ConversionMode.SERIAL, 4],
+        ],
+    )
+    def test_normal(self, mode, max_workers):
+        rows = make_mixed_rows(MIN_PARALLEL_ROWS * 4 + 7)
+        extractor = DataPropertyExtractor()
+        extractor.headers = ["a", "b", "c"]
+        expected = to_typed_matrix(extractor.to_dp_matrix(rows))
+
+        assert to_typed_matrix(to_dp_matrix(extractor, rows, mode, max_workers)) == expected
+
+    def test_normal_type_hints(self):
+        rows = make_mixed_rows(MIN_PARALLEL_ROWS)
+        extractor = DataPropertyExtractor()
+        extractor.column_type_hints = [String, RealNumber]
+        expected = to_typed_matrix(extractor.to_dp_matrix(rows))
+
+        assert to_typed_matrix(to_dp_matrix(extractor, rows, ConversionMode.THREAD, 4)) == expected
+
+    def test_normal_ragged(self):
+        rows = [[1, 2, 3]] * MIN_PARALLEL_ROWS * 2 + [[1]]
+        extractor = DataPropertyExtractor()
+        expected = to_typed_matrix(extractor.to_dp_matrix(rows))
+
+        assert to_typed_matrix(to_dp_matrix(extractor, rows, ConversionMode.THREAD, 4)) == expected
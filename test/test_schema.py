@@ -0,0 +1,87 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import datetime
+from decimal import Decimal
+
+import pytest
+from typepy import DateTime, Integer, RealNumber, String
+
+from tabledata import DataError, Schema, TableData
+
+
+class Test_Schema:
+    def test_normal(self):
+        schema = Schema(["a", "b"], ["int", String])
+
+        assert schema.headers == ["a", "b"]
+        assert schema.type_hints == [Integer, String]
+        assert schema == Schema(["a", "b"], [Integer, String])
+
+    def test_normal_from_tabledata(self):
+        tabledata = TableData("sample", ["a", "b", "c"], [[1, 1.1, "x"], [None, 2, "y"]])
+
+        assert Schema.from_tabledata(tabledata) == Schema(["a", "b", "c"], [Integer, None, String])
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            Schema(["a", "b"], [Integer])
+
+
+class Test_TableData_schema:
+    def test_normal_trusted(self):
+        schema = Schema(["i", "r", "s", "d"], [Integer, RealNumber, String, DateTime])
+        rows = [
+            (1, 0.5, "a", datetime.datetime(2017, 1, 1)),
+            (2, None, "b", datetime.datetime(2017, 1, 2)),
+        ]
+        tabledata = TableData("sample", [], rows, schema=schema)
+
+        assert tabledata.is_trusted_schema
+        assert tabledata.headers == ["i", "r", "s", "d"]
+        assert tabledata.value_matrix == [list(row) for row in rows]
+        assert isinstance(tabledata.value_matrix[0][1], float)
+        assert not tabledata.has_value_dp_matrix
+        assert tabledata.schema is schema
+        assert [col_dp.type_class for col_dp in tabledata.column_dp_list] == schema.type_hints
+
+    def test_normal_column_dp_list(self):
+        headers = ["i", "r", "d", "s", "t", "n"]
+        type_hints = [Integer, RealNumber, RealNumber, String, DateTime, None]
+        rows = [
+            [1, 1.5, Decimal("1.00"), "abc", datetime.datetime(2017, 1, 1), 1],
+            [-12345, 0.125, Decimal("10.1"), "あいう", datetime.datetime(2017, 1, 2), "x"],
+            [None, -0.0, None, None, None, None],
+            [2**40, 1.5, Decimal("1.00"), "abc", datetime.datetime(2017, 1, 1), 2.5],
+        ]
+        trusted = TableData("sample", headers, rows, schema=Schema(headers, type_hints))
+        hinted = TableData("sample", headers, rows, type_hints=type_hints)
+
+        def to_props(tabledata):
+            return [
+                (
+                    col_dp.typecode,
+                    col_dp.ascii_char_width,
+                    col_dp.decimal_places,
+                    col_dp.bit_length,
+                    col_dp.minmax_integer_digits.min_value,
+                    col_dp.minmax_integer_digits.max_value,
+                )
+                for col_dp in tabledata.column_dp_list
+            ]
+
+        assert to_props(trusted) == to_props(hinted)
+        assert not trusted.has_value_dp_matrix
+
+    def test_normal_spot_check(self):
+        schema = Schema(["a", "b"], [Integer, String], sample_size=2)
+
+        assert TableData("sample", [], [[1, "x"], [2, "y"]], schema=schema).value_matrix
+
+        with pytest.raises(DataError):
+            TableData("sample", [], [[1, "x"], ["2", "y"]], schema=schema).value_matrix
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            TableData("sample", ["a"], [[1, 2]], schema=Schema(["a", "b"], [Integer, Integer]))
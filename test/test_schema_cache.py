@@ -0,0 +1,96 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+from typepy import Integer, RealNumber, String
+
+from tabledata import SchemaCache, TableData
+
+
+class Test_SchemaCache:
+    def test_normal_lru(self):
+        schema_cache = SchemaCache(maxsize=2)
+        schema_cache.put("a", ["x"], [Integer])
+        schema_cache.put("b", ["x"], [String])
+
+        assert schema_cache.get("a", ["x"]) == [Integer]
+
+        schema_cache.put("c", ["x"], [RealNumber])
+
+        assert len(schema_cache) == 2
+        assert schema_cache.get("b", ["x"]) is None
+        assert schema_cache.get("a", ["x"]) == [Integer]
+        assert schema_cache.get("c", ["x"]) == [RealNumber]
+        assert schema_cache.hits == 3
+        assert schema_cache.misses == 1
+
+    def test_normal_tabledata(self):
+        schema_cache = SchemaCache()
+        headers = ["a", "b", "c"]
+        first = TableData(
+            "report", headers, [[1, 1.1, "x"], [2, 2.2, "y"]], schema_cache=schema_cache
+        )
+
+        assert first.value_matrix
+        assert schema_cache.misses == 1
+        assert schema_cache.get("report", headers) == [Integer, RealNumber, String]
+
+        second = TableData("report", headers, [[3, 3.3, "z"]], schema_cache=schema_cache)
+
+        assert second.equals(TableData("report", headers, [[3, 3.3, "z"]]))
+        assert second.type_hints == [Integer, RealNumber, String]
+        assert schema_cache.hits == 2
+        assert schema_cache.mismatches == 0
+
+    def test_normal_mismatch(self):
+        schema_cache = SchemaCache()
+        headers = ["a", "b"]
+        TableData("report", headers, [[1, "x"]], schema_cache=schema_cache).value_dp_matrix
+
+        rows = [["not int", "x"], [1, "y"]]
+        tabledata = TableData("report", headers, rows, schema_cache=schema_cache)
+
+        assert tabledata.equals(TableData("report", headers, rows))
+        assert schema_cache.mismatches == 1
+        assert schema_cache.get("report", headers) == [Integer, String]
+
+        schema_cache.invalidate("report", headers)
+        TableData("report", headers, rows, schema_cache=schema_cache).value_dp_matrix
+
+        assert schema_cache.get("report", headers) == [None, String]
+
+    @pytest.mark.parametrize(
+        ["first_rows", "rows", "cached_type_hint"],
+        [
+            [[[1], [2]], [[1.5], [2.7]], Integer],
+            [[["x"], ["y"]], [[1], [2]], String],
+        ],
+    )
+    def test_normal_mismatch_lossy(self, first_rows, rows, cached_type_hint):
+        schema_cache = SchemaCache()
+        TableData("report", ["a"], first_rows, schema_cache=schema_cache).value_dp_matrix
+
+        tabledata = TableData("report", ["a"], rows, schema_cache=schema_cache)
+
+        assert tabledata.value_matrix == TableData("report", ["a"], rows).value_matrix
+        assert schema_cache.mismatches == 1
+        assert schema_cache.get("report", ["a"]) == [cached_type_hint]
+
+    def test_normal_str_rows(self):
+        schema_cache = SchemaCache(sample_size=10)
+        headers = ["a", "b", "c"]
+        rows = [[str(i), f"{i}.5", f"x{i}"] for i in range(100)]
+        TableData("report", headers, rows, schema_cache=schema_cache).value_dp_matrix
+
+        tabledata = TableData("report", headers, rows, schema_cache=schema_cache)
+
+        assert tabledata.equals(TableData("report", headers, rows))
+        assert schema_cache.get("report", headers) == [Integer, RealNumber, String]
+        assert schema_cache.hits == 2
+        assert schema_cache.mismatches == 0
+
+    @pytest.mark.parametrize(["kwargs"], [[{"maxsize": 0}], [{"sample_size": 0}]])
+    def test_exception(self, kwargs):
+        with pytest.raises(ValueError):
+            SchemaCache(**kwargs)
@@ -0,0 +1,90 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pickle
+import sys
+import threading
+
+import pytest
+
+from tabledata import SharedTableData, TableData
+from tabledata._shared_memory import _attach_shared_memory
+
+
+class Test_SharedTableData:
+    def test_normal(self):
+        tabledata = TableData("sample", ["a", "b", "c"], [[1, 1.5, "x"], [None, 2.5, "あい"]])
+
+        with SharedTableData.create(tabledata) as shared:
+            assert shared.is_owner
+
+            with SharedTableData.attach(shared.name) as attached:
+                assert not attached.is_owner
+                assert attached.table_name == "sample"
+                assert attached.headers == ["a", "b", "c"]
+                assert attached.num_rows == 2
+                assert attached.read_column("a") == [1, None]
+                assert attached.to_tabledata().equals(tabledata)
+
+                buffer = attached.column_buffer("a")
+                assert buffer.readonly
+                assert buffer.tolist() == [1, 0]
+                buffer.release()
+
+                offsets, data = attached.str_column_buffers("c")
+                assert bytes(data[offsets[1] : offsets[2]]).decode("utf-8") == "あい"
+                offsets.release()
+                data.release()
+
+    def test_normal_pickle(self):
+        tabledata = TableData("sample", ["a"], [[1], [2]])
+
+        with SharedTableData.create(tabledata) as shared:
+            attached = pickle.loads(pickle.dumps(shared))
+
+            assert not attached.is_owner
+            assert attached.read_column("a") == [1, 2]
+
+            attached.close()
+
+    def test_exception(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, "x"]])
+
+        with SharedTableData.create(tabledata) as shared:
+            attached = SharedTableData.attach(shared.name)
+
+            with pytest.raises(RuntimeError):
+                attached.unlink()
+            with pytest.raises(TypeError):
+                attached.str_column_buffers("a")
+
+            attached.close()
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 13), reason="attached without tracking")
+class Test_attach_shared_memory:
+    def test_normal_other_registrations(self, monkeypatch):
+        from multiprocessing import resource_tracker, shared_memory
+
+        registered = []
+        monkeypatch.setattr(
+            resource_tracker, "register", lambda name, rtype: registered.append((name, rtype))
+        )
+
+        class FakeSharedMemory:
+            def __init__(self, name):
+                resource_tracker.register(f"/{name}", "shared_memory")
+
+                # a block created by another thread during the attachment
+                thread = threading.Thread(
+                    target=lambda: resource_tracker.register("/other", "shared_memory")
+                )
+                thread.start()
+                thread.join()
+
+        monkeypatch.setattr(shared_memory, "SharedMemory", FakeSharedMemory)
+
+        _attach_shared_memory("block")
+
+        assert registered == [("/other", "shared_memory")]
@@ -0,0 +1,111 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import datetime
+import ipaddress
+from decimal import Decimal
+
+import pytest
+from typepy import Integer, RealNumber, String
+
+from tabledata import BinaryTableReader, DataError, TableData
+from tabledata._storage import Encoding, pack_column, unpack_column
+
+
+class Test_TableData_dump:
+    @pytest.mark.parametrize(
+        ["table_name", "headers", "rows"],
+        [
+            ["normal", ["a", "b"], [[1, 2], [3, 4]]],
+            ["null", ["a", "b", "c"], [[1, None, "x"], [None, 2.5, None], [3, 0.1, "あい"]]],
+            ["mixed", ["a", "b"], [[1, "x"], [1.5, True], [datetime.datetime(2017, 1, 1), None]]],
+            ["big int", ["a"], [[1 << 70], [1]]],
+            ["ragged", ["a", "b"], [[1, 2], [3]]],
+            [
+                "other types",
+                ["a", "b"],
+                [[ipaddress.ip_address("192.168.0.1"), [1, 2]], [None, {"k": "v"}]],
+            ],
+            ["empty_records", ["a", "b"], []],
+            ["", [], []],
+        ],
+    )
+    def test_normal(self, tmp_path, table_name, headers, rows):
+        file_path = str(tmp_path / "table.bin")
+        tabledata = TableData(table_name, headers, rows)
+
+        tabledata.dump(file_path)
+        loaded = TableData.load(file_path)
+
+        assert loaded.equals(tabledata)
+        assert loaded.value_matrix == tabledata.value_matrix
+
+    def test_normal_type_hints(self, tmp_path):
+        file_path = str(tmp_path / "table.bin")
+        TableData(
+            "sample", ["int", "real", "str", "mixed"], [[1, 1.1, "a", 1], [2, 2.25, "b", 2.5]]
+        ).dump(file_path)
+
+        with BinaryTableReader(file_path) as reader:
+            assert reader.type_hints == ["Integer", "RealNumber", "String", None]
+            assert reader.decimal_places == [0, 2, None, 1]
+
+        loaded = TableData.load(file_path)
+        assert loaded.dp_extractor.column_type_hints == [Integer, RealNumber, String, None]
+        assert [col_dp.decimal_places for col_dp in loaded.column_dp_list] == [0, 2, None, 1]
+
+
+class Test_pack_column:
+    def test_normal_mixed(self):
+        values = [1, "x", True, None, datetime.datetime(2017, 1, 1)]
+        encoding, blocks, has_null = pack_column(values)
+
+        assert encoding == Encoding.TAGGED
+        assert unpack_column(encoding, [memoryview(block) for block in blocks], 5, has_null) == (
+            values
+        )
+
+    def test_exception_pickle(self):
+        encoding, blocks, has_null = pack_column([1, "x"], allow_pickle=True)
+
+        assert encoding == Encoding.PICKLE
+        assert unpack_column(encoding, blocks, 2, has_null, allow_pickle=True) == [1, "x"]
+        with pytest.raises(DataError):
+            unpack_column(encoding, blocks, 2, has_null)
+
+
+class Test_BinaryTableReader:
+    def test_normal(self, tmp_path):
+        file_path = str(tmp_path / "table.bin")
+        TableData(
+            "sample", ["a", "b", "c"], [[1, 1.1, "x"], [None, 2.2, "y"], [3, 3.3, None]]
+        ).dump(file_path)
+
+        with BinaryTableReader(file_path) as reader:
+            assert reader.table_name == "sample"
+            assert reader.headers == ["a", "b", "c"]
+            assert reader.num_rows == 3
+            assert reader.read_column("a") == [1, None, 3]
+            assert reader.read_column(1) == [Decimal("1.1"), Decimal("2.2"), Decimal("3.3")]
+            assert reader.read_column("c") == ["x", "y", None]
+
+            buffer = reader.column_buffer("a")
+            assert buffer.tolist() == [1, 0, 3]
+            buffer.release()
+
+    def test_exception(self, tmp_path):
+        file_path = str(tmp_path / "table.bin")
+        TableData("sample", ["a", "b"], [[1, "x"]]).dump(file_path)
+
+        with BinaryTableReader(file_path) as reader:
+            with pytest.raises(KeyError):
+                reader.read_column("not_exist")
+            with pytest.raises(TypeError):
+                reader.column_buffer("b")
+
+        invalid_file_path = tmp_path / "invalid.bin"
+        invalid_file_path.write_bytes(b"invalid data" * 10)
+
+        with pytest.raises(DataError):
+            BinaryTableReader(str(invalid_file_path))
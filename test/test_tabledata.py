@@ -3,14 +3,25 @@
 """
 
 import itertools
+import pickle
 import sys
+import threading
 from collections import OrderedDict, namedtuple
 from decimal import Decimal
 
 import pytest
-from typepy import Integer, String
+from typepy import Integer, RealNumber, String, Typecode
 
-from tabledata import DataError, PatternMatch, TableData
+from tabledata import (
+    ConversionMode,
+    DataError,
+    FloatType,
+    PatternMatch,
+    Phase,
+    PhaseStats,
+    Schema,
+    TableData,
+)
 
 
 attr_list_2 = ["attr_a", "attr_b"]
@@ -586,3 +597,561 @@ class Test_TableData_filter_column:
         )
 
         assert actual == expected
+
+
+class Test_TableData_sort_by:
+    ROWS = [[2, "x"], [None, "y"], [1, "z"], [float("nan"), "w"], [2, "a"]]
+
+    @pytest.mark.parametrize(
+        ["columns", "descending", "nulls", "limit", "expected"],
+        [
+            ["a", False, "last", None, [1, 2, 2, None, None]],
+            ["a", True, "last", None, [2, 2, 1, None, None]],
+            ["a", False, "first", None, [None, None, 1, 2, 2]],
+            ["a", True, "first", None, [None, None, 2, 2, 1]],
+            ["a", False, "last", 2, [1, 2]],
+            ["a", True, "first", 3, [None, None, 2]],
+            ["a", False, "last", 0, []],
+            ["a", False, "last", 10, [1, 2, 2, None, None]],
+        ],
+    )
+    def test_normal(self, columns, descending, nulls, limit, expected):
+        tabledata = TableData("sample", ["a", "b"], self.ROWS)
+
+        actual = tabledata.sort_by(columns, descending=descending, nulls=nulls, limit=limit)
+
+        # NaN is regarded as a null
+        assert [
+            None if row[0] is None or row[0] != row[0] else row[0] for row in actual.value_matrix
+        ] == expected
+
+    @pytest.mark.parametrize(
+        ["descending", "limit", "expected"],
+        [
+            [[False, False], None, ["z", "a", "x", "w", "y"]],
+            [[False, True], None, ["z", "x", "a", "y", "w"]],
+            [[True, False], None, ["a", "x", "z", "w", "y"]],
+            [[False, True], 3, ["z", "x", "a"]],
+            [[True, True], 2, ["x", "a"]],
+        ],
+    )
+    def test_normal_multi_columns(self, descending, limit, expected):
+        tabledata = TableData("sample", ["a", "b"], self.ROWS)
+
+        actual = tabledata.sort_by(["a", "b"], descending=descending, limit=limit)
+
+        assert [row[1] for row in actual.value_matrix] == expected
+
+    def test_normal_stable(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, "c"], [0, "b"], [1, "a"], [0, "d"]])
+
+        assert [row[1] for row in tabledata.sort_by("a").value_matrix] == ["b", "d", "c", "a"]
+        assert [row[1] for row in tabledata.sort_by("a", limit=3).value_matrix] == ["b", "d", "c"]
+
+    def test_normal_keep_types(self):
+        tabledata = TableData(
+            "sample", ["a", "b"], [["10", 1], ["9", 2.5]], type_hints=[String, None]
+        )
+        value_dp_matrix = tabledata.value_dp_matrix
+
+        actual = tabledata.sort_by("a")
+
+        # compared as strings: the column type is kept
+        assert actual.value_matrix == [["10", 1], ["9", Decimal("2.5")]]
+        assert actual.value_dp_matrix[0][0] is value_dp_matrix[0][0]
+        assert actual.rows == [["10", 1], ["9", 2.5]]
+        assert actual.table_name == "sample"
+
+    def test_normal_mixed_types(self):
+        tabledata = TableData("sample", ["a"], [["b"], [3], ["a"], [1]])
+
+        actual = tabledata.sort_by("a")
+
+        assert actual.value_matrix == [[1], [3], ["a"], ["b"]]
+
+    def test_normal_trusted_schema(self):
+        tabledata = TableData("sample", ["a"], [[3], [1], [2]], schema=Schema(["a"], [Integer]))
+
+        actual = tabledata.sort_by("a", descending=True)
+
+        assert actual.value_matrix == [[3], [2], [1]]
+        assert not actual.has_value_dp_matrix
+        assert actual.is_trusted_schema
+
+    @pytest.mark.parametrize(
+        ["columns", "descending", "nulls", "limit"],
+        [
+            ["c", False, "last", None],
+            [[], False, "last", None],
+            [["a", "b"], [True], "last", None],
+            ["a", False, "middle", None],
+            ["a", False, "last", -1],
+        ],
+    )
+    def test_exception(self, columns, descending, nulls, limit):
+        tabledata = TableData("sample", ["a", "b"], self.ROWS)
+
+        with pytest.raises(ValueError):
+            tabledata.sort_by(columns, descending=descending, nulls=nulls, limit=limit)
+
+    def test_exception_ragged(self):
+        tabledata = TableData("sample", ["a", "b"], [[2, "x"], [1]])
+
+        assert tabledata.sort_by("a").value_matrix == [[1], [2]]
+
+        with pytest.raises(ValueError):
+            tabledata.sort_by("b")
+
+
+class Test_TableData_drop_duplicates:
+    ROWS = [
+        [1, "x"],
+        [2, "y"],
+        [1, "x"],
+        [float("nan"), "z"],
+        [None, "y"],
+        [float("nan"), "z"],
+        [None, "w"],
+    ]
+
+    @pytest.mark.parametrize(
+        ["subset", "keep", "expected"],
+        [
+            [None, "first", ["x", "y", "z", "y", "w"]],
+            [None, "last", ["y", "x", "y", "z", "w"]],
+            ["a", "first", ["x", "y", "z", "y"]],
+            [["a"], "last", ["y", "x", "z", "w"]],
+            ["b", "first", ["x", "y", "z", "w"]],
+        ],
+    )
+    def test_normal(self, subset, keep, expected):
+        tabledata = TableData("sample", ["a", "b"], self.ROWS)
+
+        actual = tabledata.drop_duplicates(subset=subset, keep=keep)
+
+        assert [row[1] for row in actual.value_matrix] == expected
+
+    def test_normal_keep_converted(self):
+        tabledata = TableData(
+            "sample", ["a", "b"], [["1", 1.5], ["1", 1.5]], type_hints=[String, None]
+        )
+        value_dp_matrix = tabledata.value_dp_matrix
+
+        actual = tabledata.drop_duplicates()
+
+        assert actual.table_name == "sample"
+        assert actual.value_matrix == [["1", Decimal("1.5")]]
+        assert actual.value_dp_matrix[0][0] is value_dp_matrix[0][0]
+        assert actual.type_hints == [String, None]
+
+    def test_normal_no_duplicates(self):
+        tabledata = TableData("sample", ["a"], [[1], [2]])
+
+        actual = tabledata.drop_duplicates()
+
+        assert actual.value_matrix is tabledata.value_matrix
+
+    def test_normal_unhashable(self):
+        tabledata = TableData("sample", ["a"], [[[1, 2]], [[1, 2]], [[3]]])
+
+        assert tabledata.drop_duplicates().num_rows == 2
+
+    def test_normal_ragged(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, 2], [1], [3, 4]])
+
+        assert tabledata.drop_duplicates().value_matrix == [[1], [3]]
+
+        with pytest.raises(ValueError):
+            tabledata.drop_duplicates("b")
+
+    @pytest.mark.parametrize(["subset", "keep"], [["c", "first"], [None, "middle"]])
+    def test_exception(self, subset, keep):
+        with pytest.raises(ValueError):
+            TableData("sample", ["a", "b"], self.ROWS).drop_duplicates(subset=subset, keep=keep)
+
+
+class Test_TableData_page:
+    ROWS = [[i, "x" * (i % 5)] for i in range(100)]
+
+    @pytest.mark.parametrize(
+        ["index", "size", "expected"],
+        [
+            [0, 3, [0, 1, 2]],
+            [2, 3, [6, 7, 8]],
+            [9, 11, [99]],
+            [10, 10, []],
+            [100, 50, []],
+        ],
+    )
+    def test_normal(self, index, size, expected):
+        tabledata = TableData("sample", ["a", "b"], self.ROWS)
+
+        page = tabledata.page(index, size)
+
+        assert page.table_name == "sample"
+        assert page.headers == ["a", "b"]
+        assert [row[0] for row in page.value_matrix] == expected
+        assert not tabledata.has_value_dp_matrix
+
+    def test_normal_shared_column_dp_list(self):
+        tabledata = TableData("sample", ["a", "b"], self.ROWS)
+
+        first_page = tabledata.page(0, 2)
+        last_page = tabledata.page(49, 2)
+
+        assert first_page.column_dp_list is last_page.column_dp_list
+        assert [col_dp.ascii_char_width for col_dp in first_page.column_dp_list] == [2, 4]
+
+    def test_normal_sample(self, monkeypatch):
+        monkeypatch.setattr(TableData, "page_sample_size", 10)
+        tabledata = TableData("sample", ["a", "b"], self.ROWS)
+
+        page = tabledata.page(0, 1)
+
+        # sampled rows: 0, 10, 20, ..., 90
+        assert page.column_dp_list[0].ascii_char_width == 2
+        assert page.value_matrix == [[0, ""]]
+
+    def test_normal_sample_wider_type(self, monkeypatch):
+        monkeypatch.setattr(TableData, "page_sample_size", 10)
+        tabledata = TableData("sample", ["a"], [[i] for i in range(100)] + [[Decimal("1.23456")]])
+
+        assert tabledata.page(0, 50).column_dp_list[0].typecode == Typecode.INTEGER
+
+        page = tabledata.page(2, 50)
+        col_dp = page.column_dp_list[0]
+
+        assert col_dp.typecode == Typecode.REAL_NUMBER
+        assert col_dp.dp_to_str(page.value_dp_matrix[0][0]) == "1.23456"
+        assert tabledata.page(0, 50).column_dp_list is page.column_dp_list
+
+    def test_normal_converted(self):
+        tabledata = TableData("sample", ["a", "b"], self.ROWS)
+        value_dp_matrix = tabledata.value_dp_matrix
+
+        page = tabledata.page(1, 10)
+
+        assert page.value_dp_matrix[0][0] is value_dp_matrix[10][0]
+        assert page.column_dp_list is tabledata.page(2, 10).column_dp_list
+
+    def test_normal_cache(self, monkeypatch):
+        monkeypatch.setattr(TableData, "page_cache_size", 2)
+        tabledata = TableData("sample", ["a", "b"], self.ROWS)
+
+        page0 = tabledata.page(0)
+        page1 = tabledata.page(1)
+        assert tabledata.page(0) is page0
+
+        # page 1 is the least recently used page
+        tabledata.page(2)
+        assert tabledata.page(0) is page0
+        assert tabledata.page(1) is not page1
+
+    @pytest.mark.parametrize(["index", "size"], [[-1, 10], [0, 0]])
+    def test_exception(self, index, size):
+        with pytest.raises(ValueError):
+            TableData("sample", ["a", "b"], self.ROWS).page(index, size)
+
+
+class Test_TableData_float_type:
+    ROWS = [[1, 1.25, "3.5", Decimal("2.5"), None]]
+
+    @pytest.mark.parametrize(
+        ["float_type", "expected"],
+        [
+            [None, [1, Decimal("1.25"), Decimal("3.5"), Decimal("2.5"), None]],
+            [FloatType.DECIMAL, [1, Decimal("1.25"), Decimal("3.5"), Decimal("2.5"), None]],
+            [FloatType.FLOAT, [1, 1.25, 3.5, 2.5, None]],
+            [FloatType.ORIGINAL, [1, 1.25, Decimal("3.5"), Decimal("2.5"), None]],
+        ],
+    )
+    def test_normal(self, float_type, expected):
+        tabledata = TableData("sample", ["a", "b", "c", "d", "e"], self.ROWS, float_type=float_type)
+
+        assert tabledata.float_type == float_type
+        assert [type(value) for value in tabledata.value_matrix[0]] == [
+            type(value) for value in expected
+        ]
+        assert tabledata.value_matrix == [expected]
+        assert list(tabledata.as_tuple())[0] == tuple(expected)
+        assert list(tabledata.as_dict()["sample"][0].values()) == expected[:4]
+
+    def test_normal_max_precision(self):
+        tabledata = TableData(
+            "sample", ["a"], [[1.23456], [10.5]], float_type=FloatType.FLOAT, max_precision=2
+        )
+
+        assert tabledata.value_matrix == [[1.23456], [10.5]]
+        assert tabledata.column_dp_list[0].decimal_places == 2
+        assert tabledata.column_dp_list[0].dp_to_str(tabledata.value_dp_matrix[0][0]) == "1.23"
+
+    def test_normal_trusted_schema(self):
+        tabledata = TableData(
+            "sample",
+            ["a", "b"],
+            [[Decimal("1.5"), "x"]],
+            schema=Schema(["a", "b"], [RealNumber, String]),
+            float_type=FloatType.FLOAT,
+        )
+
+        assert tabledata.value_matrix == [[1.5, "x"]]
+        assert isinstance(tabledata.value_matrix[0][0], float)
+
+    @pytest.mark.parametrize(["pickle_caches"], [[True], [False]])
+    def test_normal_pickle(self, pickle_caches):
+        tabledata = TableData("sample", ["a"], [[1.5], [2.5]], float_type=FloatType.FLOAT)
+        tabledata.pickle_caches = pickle_caches
+        _ = tabledata.value_matrix
+
+        restored = pickle.loads(pickle.dumps(tabledata))
+
+        assert restored.float_type == FloatType.FLOAT
+        assert restored.value_matrix == [[1.5], [2.5]]
+        assert isinstance(restored.value_matrix[0][0], float)
+
+    def test_normal_derived(self):
+        tabledata = TableData(
+            "sample", ["a", "b"], [[1.5, 1], [2.5, 2]], float_type=FloatType.FLOAT
+        )
+
+        for derived in [
+            tabledata.rename("renamed"),
+            tabledata.sort_by("a"),
+            tabledata.filter_column(["a"]),
+            TableData.concat([tabledata, tabledata]),
+        ]:
+            assert derived.float_type == FloatType.FLOAT
+            assert isinstance(derived.value_matrix[0][0], float)
+
+
+class Test_TableData_concurrency:
+    NUM_THREADS = 16
+
+    @staticmethod
+    def run_threads(num_threads, func):
+        barrier = threading.Barrier(num_threads)
+        results = [None] * num_threads
+        errors = []
+
+        def worker(idx):
+            try:
+                barrier.wait()
+                results[idx] = func(idx)
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+        return results
+
+    @pytest.mark.parametrize(
+        ["attr", "phase"],
+        [
+            ["value_dp_matrix", Phase.TO_DP_MATRIX],
+            ["value_matrix", Phase.TO_DP_MATRIX],
+            ["column_dp_list", Phase.TO_DP_MATRIX],
+        ],
+    )
+    def test_normal_compute_once(self, attr, phase):
+        for _ in range(5):
+            stats = PhaseStats()
+            tabledata = TableData(
+                "sample", ["a", "b", "c"], [[i, f"{i}.5", str(i)] for i in range(300)]
+            )
+            tabledata.instrument = stats
+
+            results = self.run_threads(self.NUM_THREADS, lambda _idx: getattr(tabledata, attr))
+
+            assert stats[phase].cache_misses == 1
+            if attr != "column_dp_list":
+                # column properties are built at each access
+                assert all(result is results[0] for result in results)
+
+    def test_normal_mixed_access(self):
+        stats = PhaseStats()
+        tabledata = TableData("sample", ["a", "b"], [[i, f"{i}.5"] for i in range(300)])
+        tabledata.instrument = stats
+        getters = [
+            lambda: tabledata.value_dp_matrix,
+            lambda: tabledata.as_dict(),
+            lambda: tabledata.column_dp_list,
+            lambda: tabledata.column_stats(),
+            lambda: tabledata.create_index("a"),
+        ]
+
+        self.run_threads(
+            self.NUM_THREADS,
+            lambda idx: [getter() for getter in getters[idx % len(getters) :] + getters],
+        )
+
+        assert stats[Phase.TO_DP_MATRIX].cache_misses == 1
+
+    def test_normal_column_dp_list_extractor_change(self):
+        tabledata = TableData("sample", ["a"], [[1], [2]])
+        assert tabledata.column_dp_list[0].ascii_char_width == 1
+
+        tabledata.dp_extractor.min_column_width = 20
+
+        assert tabledata.column_dp_list[0].ascii_char_width == 20
+
+    def test_normal_pickle(self):
+        tabledata = TableData("sample", ["a"], [[1], [2]])
+        _ = tabledata.column_dp_list
+
+        restored = pickle.loads(pickle.dumps(tabledata))
+
+        assert restored.value_matrix == [[1], [2]]
+
+
+class Test_TableData_rename:
+    def test_normal(self):
+        tabledata = TableData("tablename", ["a", "b"], [[1, "x"], [2, "y"]])
+        value_dp_matrix = tabledata.value_dp_matrix
+
+        renamed = tabledata.rename("new", ["c", "d"])
+
+        assert renamed.table_name == "new"
+        assert renamed.headers == ["c", "d"]
+        assert renamed.rows is tabledata.rows
+        assert renamed.has_value_dp_matrix
+        assert renamed.value_dp_matrix is value_dp_matrix
+        assert renamed == TableData("new", ["c", "d"], [[1, "x"], [2, "y"]])
+
+    def test_normal_keep_headers(self):
+        tabledata = TableData("tablename", ["a", "b"], [[1, "x"]])
+
+        renamed = tabledata.rename("new")
+
+        assert renamed.headers == ["a", "b"]
+        assert not renamed.has_value_dp_matrix
+        assert renamed == TableData("new", ["a", "b"], [[1, "x"]])
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            TableData("tablename", ["a", "b"], [[1, 2]]).rename("new", ["a"])
+
+
+class Test_TableData_pickle:
+    @pytest.mark.parametrize(
+        ["table_name", "headers", "rows"],
+        [
+            ["normal", ["a", "b"], [[1, 2], [3, 4]]],
+            ["mixed", ["a", "b", "c"], [[1, 1.1, "x"], [None, 2, None], [3, "3.3", True]]],
+            ["empty_records", ["a", "b"], []],
+        ],
+    )
+    @pytest.mark.parametrize(["pickle_caches"], [[True], [False]])
+    def test_normal(self, table_name, headers, rows, pickle_caches):
+        tabledata = TableData(table_name, headers, rows)
+        tabledata.pickle_caches = pickle_caches
+        _ = tabledata.value_dp_matrix
+
+        restored = pickle.loads(pickle.dumps(tabledata))
+
+        assert restored.has_value_dp_matrix == pickle_caches
+        assert restored.equals(tabledata)
+        assert restored.value_matrix == tabledata.value_matrix
+        assert restored.pickle_caches == pickle_caches
+
+    def test_normal_not_converted(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, "2"], [3, "4"]], type_hints=[None, String])
+
+        restored = pickle.loads(pickle.dumps(tabledata))
+
+        assert not restored.has_value_dp_matrix
+        assert restored.rows == tabledata.rows
+        assert restored.dp_extractor.column_type_hints == [None, String]
+        assert restored.value_matrix == [[1, "2"], [3, "4"]]
+
+    @pytest.mark.parametrize(["pickle_caches"], [[True], [False]])
+    def test_normal_converted_rows(self, pickle_caches):
+        tabledata = TableData("sample", ["a", "b"], [["1", "2.0"], [3, "4.5"]])
+        tabledata.pickle_caches = pickle_caches
+        _ = tabledata.value_dp_matrix
+
+        restored = pickle.loads(pickle.dumps(tabledata))
+
+        assert restored.rows == [["1", "2.0"], [3, "4.5"]]
+        assert restored.value_matrix == [[1, Decimal("2.0")], [3, Decimal("4.5")]]
+        assert restored.type_hints == []
+        assert not restored.is_trusted_schema
+        assert restored == tabledata
+        assert restored.equals(tabledata)
+
+    def test_normal_typed_columns(self):
+        tabledata = TableData("sample", ["a", "b"], [[1, "x"], [3, None]])
+        _ = tabledata.value_matrix
+
+        state = tabledata.__getstate__()
+        restored = pickle.loads(pickle.dumps(tabledata))
+
+        # rows that are the same as the converted values are shipped only as the columns
+        assert "rows" not in state
+        assert restored.rows == [[1, "x"], [3, None]]
+        assert restored.value_matrix == tabledata.value_matrix
+        assert not restored.is_trusted_schema
+        assert restored == tabledata
+
+    def test_normal_trusted_schema(self):
+        schema = Schema(["a", "b"], [Integer, String])
+        tabledata = TableData("sample", [], [[1, "x"], [2, "y"]], schema=schema)
+        _ = tabledata.value_matrix
+
+        restored = pickle.loads(pickle.dumps(tabledata))
+
+        assert restored.is_trusted_schema
+        assert restored.schema == schema
+        assert restored == tabledata
+
+    @pytest.mark.parametrize(["pickle_caches"], [[True], [False]])
+    def test_normal_ragged(self, pickle_caches):
+        tabledata = TableData("sample", ["a", "b"], [[1, 2], [3]])
+        tabledata.pickle_caches = pickle_caches
+        _ = tabledata.value_dp_matrix
+
+        restored = pickle.loads(pickle.dumps(tabledata))
+
+        assert restored.has_value_dp_matrix == pickle_caches
+        assert restored.rows == [[1, 2], [3]]
+        assert restored == tabledata
+        assert restored.value_matrix == tabledata.value_matrix
+
+
+class Test_TableData_conversion_mode:
+    ROWS = [[row_idx, f"{row_idx}.5", "abc" if row_idx % 7 else None] for row_idx in range(1200)]
+
+    @pytest.mark.parametrize(
+        ["conversion_mode"],
+        [[ConversionMode.AUTO], [ConversionMode.THREAD], [ConversionMode.SERIAL]],
+    )
+    def test_normal(self, conversion_mode):
+        tabledata = TableData(
+            "sample",
+            ["a", "b", "c"],
+            self.ROWS,
+            max_workers=4,
+            conversion_mode=conversion_mode,
+        )
+        expected = TableData("sample", ["a", "b", "c"], self.ROWS)
+
+        assert tabledata.conversion_mode == conversion_mode
+        assert tabledata.value_matrix == expected.value_matrix
+        assert tabledata.as_dict() == expected.as_dict()
+        assert [col_dp.typecode for col_dp in tabledata.column_dp_list] == [
+            col_dp.typecode for col_dp in expected.column_dp_list
+        ]
+
+    def test_normal_pickle(self):
+        tabledata = TableData("sample", ["a"], [[1]], conversion_mode=ConversionMode.THREAD)
+
+        restored = pickle.loads(pickle.dumps(tabledata))
+
+        assert restored.conversion_mode == ConversionMode.THREAD
+        assert restored.transpose().conversion_mode == ConversionMode.THREAD
+        assert restored.rename(table_name="renamed").conversion_mode == ConversionMode.THREAD